@@ -15,6 +15,7 @@ limitations under the License.
 """
 
 from .bge_reranker_client import BGERerankerClient
+from .cached_reranker_client import CachedCrossEncoderClient
 from .client import CrossEncoderClient
 from .gemini_reranker_client import GeminiRerankerClient
 from .openai_reranker_client import OpenAIRerankerClient
@@ -23,5 +24,6 @@ __all__ = [
     'CrossEncoderClient',
     'OpenAIRerankerClient',
     'BGERerankerClient',
+    'CachedCrossEncoderClient',
     'GeminiRerankerClient',
 ]
@@ -14,7 +14,6 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import asyncio
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -29,21 +28,54 @@ else:
         ) from None
 
 from graphiti_core.cross_encoder.client import CrossEncoderClient
+from graphiti_core.utils.micro_batch import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_BATCH_WAIT,
+    MicroBatchWorker,
+)
+
+DEFAULT_MODEL = 'BAAI/bge-reranker-v2-m3'
 
 
 class BGERerankerClient(CrossEncoderClient):
-    def __init__(self):
-        self.model = CrossEncoder('BAAI/bge-reranker-v2-m3')
+    def __init__(
+        self,
+        model: str = DEFAULT_MODEL,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_wait: float = DEFAULT_BATCH_WAIT,
+        torch_num_threads: int | None = None,
+    ):
+        """
+        Initialize the BGERerankerClient.
+
+        The model is owned by a dedicated worker thread. Concurrent rank() calls are queued, and
+        the worker merges their (query, passage) pairs into batches of up to batch_size pairs,
+        waiting at most batch_wait seconds for a batch to fill up, so that concurrent searches
+        share model invocations.
+
+        Args:
+            model (str): The name of the cross-encoder model to load.
+            batch_size (int): The number of pairs the worker collects before scoring a batch.
+            batch_wait (float): The maximum time in seconds to wait for more requests to batch.
+            torch_num_threads (int | None): The number of threads torch uses for scoring. If not
+                set, the torch default is used.
+        """
+        self.model = CrossEncoder(model)
+        self.batch_size = batch_size
+        self.torch_num_threads = torch_num_threads
+        self._worker: MicroBatchWorker[list[str], float] = MicroBatchWorker(
+            self._predict,
+            batch_size=batch_size,
+            batch_wait=batch_wait,
+            initializer=self._initialize_worker,
+            name='bge-reranker',
+        )
 
     async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
         if not passages:
             return []
 
-        input_pairs = [[query, passage] for passage in passages]
-
-        # Run the synchronous predict method in an executor
-        loop = asyncio.get_running_loop()
-        scores = await loop.run_in_executor(None, self.model.predict, input_pairs)
+        scores = await self._worker.submit([[query, passage] for passage in passages])
 
         ranked_passages = sorted(
             [(passage, float(score)) for passage, score in zip(passages, scores, strict=False)],
@@ -52,3 +84,16 @@ class BGERerankerClient(CrossEncoderClient):
         )
 
         return ranked_passages
+
+    def close(self):
+        """Stop the worker thread once the queued requests have been scored."""
+        self._worker.close()
+
+    def _initialize_worker(self):
+        if self.torch_num_threads is not None:
+            import torch
+
+            torch.set_num_threads(self.torch_num_threads)
+
+    def _predict(self, pairs: list[list[str]]) -> list[float]:
+        return self.model.predict(pairs, batch_size=self.batch_size).tolist()
@@ -0,0 +1,105 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+import logging
+from collections import OrderedDict
+
+from .client import CrossEncoderClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = 100_000
+
+
+def _hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class CachedCrossEncoderClient(CrossEncoderClient):
+    def __init__(
+        self,
+        client: CrossEncoderClient,
+        max_size: int = DEFAULT_CACHE_SIZE,
+        model: str | None = None,
+    ):
+        """
+        Wrap a CrossEncoderClient and memoize the score of every (query, passage) pair.
+
+        Scores are cached in memory with LRU eviction, keyed by the model and the hashes of the
+        query and passage text. Only passages without a cached score are sent to the wrapped
+        client. This assumes the wrapped client scores each passage independently of the others
+        it is ranked with, which holds for the OpenAI, Gemini and BGE rerankers. In listwise mode
+        the LLM rerankers still rate each passage on an absolute scale.
+
+        Args:
+            client (CrossEncoderClient): The reranker to wrap.
+            max_size (int): The maximum number of cached scores.
+            model (str | None): The model name used in cache keys. Defaults to the model in the
+                wrapped client's config, so clients for different models never share scores.
+        """
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1')
+
+        self.client = client
+        self.max_size = max_size
+        config = getattr(client, 'config', None)
+        self.model = f'{type(client).__name__}:{model or getattr(config, "model", None)}'
+        self.hits = 0
+        self.misses = 0
+        self._scores: OrderedDict[tuple[str, str, str], float] = OrderedDict()
+
+    async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
+        query_hash = _hash_text(query)
+        keys = {passage: (self.model, query_hash, _hash_text(passage)) for passage in passages}
+
+        scores: dict[str, float] = {}
+        uncached: list[str] = []
+        for passage, key in keys.items():
+            score = self._scores.get(key)
+            if score is None:
+                uncached.append(passage)
+            else:
+                self._scores.move_to_end(key)
+                scores[passage] = score
+
+        self.hits += len(scores)
+        self.misses += len(uncached)
+
+        if uncached:
+            # Rerankers may short-circuit a single passage without scoring it, so a lone uncached
+            # passage is ranked together with one of the cached ones
+            to_rank = (
+                uncached if len(uncached) > 1 or not scores else uncached + [next(iter(scores))]
+            )
+            ranked = await self.client.rank(query, to_rank)
+            for passage, score in ranked:
+                scores[passage] = score
+                if len(to_rank) > 1:
+                    self._store(keys[passage], score)
+
+        results = [(passage, scores[passage]) for passage in passages if passage in scores]
+        results.sort(reverse=True, key=lambda x: x[1])
+        return results
+
+    def _store(self, key: tuple[str, str, str], score: float):
+        self._scores[key] = score
+        self._scores.move_to_end(key)
+        while len(self._scores) > self.max_size:
+            self._scores.popitem(last=False)
+
+    def clear(self):
+        self._scores.clear()
@@ -21,6 +21,14 @@ from typing import TYPE_CHECKING
 from ..helpers import semaphore_gather
 from ..llm_client import LLMConfig, RateLimitError
 from .client import CrossEncoderClient
+from .listwise import (
+    DEFAULT_LISTWISE_CHUNK_SIZE,
+    LISTWISE_SYSTEM_PROMPT,
+    LISTWISE_TOKENS_PER_PASSAGE,
+    build_listwise_prompt,
+    chunk_passages,
+    parse_listwise_scores,
+)
 
 if TYPE_CHECKING:
     from google import genai
@@ -49,6 +57,8 @@ class GeminiRerankerClient(CrossEncoderClient):
         self,
         config: LLMConfig | None = None,
         client: 'genai.Client | None' = None,
+        listwise: bool = False,
+        listwise_chunk_size: int = DEFAULT_LISTWISE_CHUNK_SIZE,
     ):
         """
         Initialize the GeminiRerankerClient with the provided configuration and client.
@@ -57,14 +67,24 @@ class GeminiRerankerClient(CrossEncoderClient):
         this reranker uses the Gemini API to perform direct relevance scoring of passages.
         Each passage is scored individually on a 0-100 scale.
 
+        In listwise mode the passages are instead sent in chunks of listwise_chunk_size, and every
+        passage of a chunk is scored in a single request. Passages that the model leaves out of its
+        answer are scored individually.
+
         Args:
             config (LLMConfig | None): The configuration for the LLM client, including API key, model, base URL, temperature, and max tokens.
             client (genai.Client | None): An optional async client instance to use. If not provided, a new genai.Client is created.
+            listwise (bool): Whether to score the passages of a chunk in a single request.
+            listwise_chunk_size (int): The maximum number of passages per listwise request.
         """
         if config is None:
             config = LLMConfig()
+        if listwise_chunk_size < 1:
+            raise ValueError('listwise_chunk_size must be at least 1')
 
         self.config = config
+        self.listwise = listwise
+        self.listwise_chunk_size = listwise_chunk_size
         if client is None:
             self.client = genai.Client(api_key=config.api_key)
         else:
@@ -79,6 +99,55 @@ class GeminiRerankerClient(CrossEncoderClient):
         if len(passages) <= 1:
             return [(passage, 1.0) for passage in passages]
 
+        if self.listwise:
+            return await self._rank_listwise(query, passages)
+        return await self._rank_pointwise(query, passages)
+
+    async def _rank_listwise(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
+        chunk_results = await semaphore_gather(
+            *[
+                self._score_listwise_chunk(query, chunk)
+                for chunk in chunk_passages(passages, self.listwise_chunk_size)
+            ]
+        )
+
+        results = [result for chunk_result in chunk_results for result in chunk_result]
+        results.sort(reverse=True, key=lambda x: x[1])
+        return results
+
+    async def _score_listwise_chunk(
+        self, query: str, passages: list[str]
+    ) -> list[tuple[str, float]]:
+        scores: dict[int, float] = {}
+        try:
+            response = await self.client.aio.models.generate_content(
+                model=self.config.model or DEFAULT_MODEL,
+                contents=[
+                    types.Content(
+                        role='user',
+                        parts=[types.Part.from_text(text=build_listwise_prompt(query, passages))],
+                    )
+                ],  # type: ignore
+                config=types.GenerateContentConfig(
+                    system_instruction=LISTWISE_SYSTEM_PROMPT,
+                    temperature=0.0,
+                    max_output_tokens=LISTWISE_TOKENS_PER_PASSAGE * len(passages),
+                ),
+            )
+            scores = parse_listwise_scores(getattr(response, 'text', None) or '', len(passages))
+        except Exception as e:
+            if _is_rate_limit_error(e):
+                raise RateLimitError from e
+            logger.warning(f'Listwise reranking failed, falling back to pointwise scoring: {e}')
+
+        results = [(passages[index], score) for index, score in scores.items()]
+        missing = [passage for index, passage in enumerate(passages) if index not in scores]
+        if missing:
+            results.extend(await self._rank_pointwise(query, missing))
+
+        return results
+
+    async def _rank_pointwise(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
         # Generate scoring prompts for each passage
         scoring_prompts = []
         for passage in passages:
@@ -147,15 +216,19 @@ Provide only a number between 0 and 100 (no explanation, just the number):"""
             return results
 
         except Exception as e:
-            # Check if it's a rate limit error based on Gemini API error codes
-            error_message = str(e).lower()
-            if (
-                'rate limit' in error_message
-                or 'quota' in error_message
-                or 'resource_exhausted' in error_message
-                or '429' in str(e)
-            ):
+            if _is_rate_limit_error(e):
                 raise RateLimitError from e
 
             logger.error(f'Error in generating LLM response: {e}')
             raise
+
+
+def _is_rate_limit_error(e: Exception) -> bool:
+    # Check if it's a rate limit error based on Gemini API error codes
+    error_message = str(e).lower()
+    return (
+        'rate limit' in error_message
+        or 'quota' in error_message
+        or 'resource_exhausted' in error_message
+        or '429' in str(e)
+    )
@@ -0,0 +1,62 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import re
+
+DEFAULT_LISTWISE_CHUNK_SIZE = 20
+
+LISTWISE_SYSTEM_PROMPT = (
+    'You are an expert at rating passage relevance. '
+    'Respond with only one line per passage in the form <number>: <score>.'
+)
+
+# Tokens needed to answer a single passage line, e.g. "12: 100\n"
+LISTWISE_TOKENS_PER_PASSAGE = 8
+
+_SCORE_LINE = re.compile(r'^\W*(\d+)\W+(\d{1,3})\b', re.MULTILINE)
+
+
+def chunk_passages(passages: list[str], chunk_size: int) -> list[list[str]]:
+    return [passages[i : i + chunk_size] for i in range(0, len(passages), chunk_size)]
+
+
+def build_listwise_prompt(query: str, passages: list[str]) -> str:
+    numbered_passages = '\n\n'.join(
+        f'[{i}]\n{passage}' for i, passage in enumerate(passages, start=1)
+    )
+    return f"""Rate how well each passage answers or relates to the query. Use a scale from 0 to 100.
+
+Query: {query}
+
+Passages:
+{numbered_passages}
+
+Respond with one line for each of the {len(passages)} passages in the form <number>: <score>, with no explanation."""
+
+
+def parse_listwise_scores(text: str, num_passages: int) -> dict[int, float]:
+    """Parse "<number>: <score>" lines into normalized scores by passage index.
+
+    Passages that are missing from the response or have an invalid number are left out, so that
+    the caller can score them individually.
+    """
+    scores: dict[int, float] = {}
+    for match in _SCORE_LINE.finditer(text):
+        index = int(match.group(1)) - 1
+        if 0 <= index < num_passages and index not in scores:
+            scores[index] = max(0.0, min(1.0, float(match.group(2)) / 100.0))
+
+    return scores
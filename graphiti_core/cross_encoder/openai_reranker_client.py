@@ -25,6 +25,14 @@ from ..helpers import semaphore_gather
 from ..llm_client import LLMConfig, OpenAIClient, RateLimitError
 from ..prompts import Message
 from .client import CrossEncoderClient
+from .listwise import (
+    DEFAULT_LISTWISE_CHUNK_SIZE,
+    LISTWISE_SYSTEM_PROMPT,
+    LISTWISE_TOKENS_PER_PASSAGE,
+    build_listwise_prompt,
+    chunk_passages,
+    parse_listwise_scores,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +44,8 @@ class OpenAIRerankerClient(CrossEncoderClient):
         self,
         config: LLMConfig | None = None,
         client: AsyncOpenAI | AsyncAzureOpenAI | OpenAIClient | None = None,
+        listwise: bool = False,
+        listwise_chunk_size: int = DEFAULT_LISTWISE_CHUNK_SIZE,
     ):
         """
         Initialize the OpenAIRerankerClient with the provided configuration and client.
@@ -43,14 +53,27 @@ class OpenAIRerankerClient(CrossEncoderClient):
         This reranker uses the OpenAI API to run a simple boolean classifier prompt concurrently
         for each passage. Log-probabilities are used to rank the passages.
 
+        In listwise mode the passages are instead sent in chunks of listwise_chunk_size, and the
+        model rates every passage of a chunk on a 0-100 scale in a single request. If the request
+        fails or the model leaves passages out of its answer, the whole chunk is scored with the
+        boolean classifier prompt instead, so scores within a chunk always come from one method.
+        Listwise ratings divided by 100 and classifier probabilities are only roughly comparable,
+        so the order across chunks scored by different methods is approximate.
+
         Args:
             config (LLMConfig | None): The configuration for the LLM client, including API key, model, base URL, temperature, and max tokens.
             client (AsyncOpenAI | AsyncAzureOpenAI | OpenAIClient | None): An optional async client instance to use. If not provided, a new AsyncOpenAI client is created.
+            listwise (bool): Whether to score the passages of a chunk in a single request.
+            listwise_chunk_size (int): The maximum number of passages per listwise request.
         """
         if config is None:
             config = LLMConfig()
+        if listwise_chunk_size < 1:
+            raise ValueError('listwise_chunk_size must be at least 1')
 
         self.config = config
+        self.listwise = listwise
+        self.listwise_chunk_size = listwise_chunk_size
         if client is None:
             self.client = AsyncOpenAI(api_key=config.api_key, base_url=config.base_url)
         elif isinstance(client, OpenAIClient):
@@ -59,6 +82,48 @@ class OpenAIRerankerClient(CrossEncoderClient):
             self.client = client
 
     async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
+        if self.listwise:
+            return await self._rank_listwise(query, passages)
+        return await self._rank_pointwise(query, passages)
+
+    async def _rank_listwise(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
+        chunk_results = await semaphore_gather(
+            *[
+                self._score_listwise_chunk(query, chunk)
+                for chunk in chunk_passages(passages, self.listwise_chunk_size)
+            ]
+        )
+
+        results = [result for chunk_result in chunk_results for result in chunk_result]
+        results.sort(reverse=True, key=lambda x: x[1])
+        return results
+
+    async def _score_listwise_chunk(
+        self, query: str, passages: list[str]
+    ) -> list[tuple[str, float]]:
+        scores: dict[int, float] = {}
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.config.model or DEFAULT_MODEL,
+                messages=[
+                    Message(role='system', content=LISTWISE_SYSTEM_PROMPT),
+                    Message(role='user', content=build_listwise_prompt(query, passages)),
+                ],  # type: ignore
+                temperature=0,
+                max_tokens=LISTWISE_TOKENS_PER_PASSAGE * len(passages),
+            )
+            scores = parse_listwise_scores(response.choices[0].message.content or '', len(passages))
+        except openai.RateLimitError as e:
+            raise RateLimitError from e
+        except Exception as e:
+            logger.warning(f'Listwise reranking failed, falling back to pointwise scoring: {e}')
+
+        if len(scores) < len(passages):
+            return await self._rank_pointwise(query, passages)
+
+        return [(passages[index], score) for index, score in scores.items()]
+
+    async def _rank_pointwise(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
         openai_messages_list: Any = [
             [
                 Message(
@@ -44,14 +44,23 @@ def handle_multiple_group_ids(func: F) -> F:
         if group_ids is None and group_ids_pos is not None and len(args) > group_ids_pos:
             group_ids = args[group_ids_pos]
 
-        # Only handle FalkorDB with multiple group_ids
-        if (
+        is_falkordb = (
             hasattr(self, 'clients')
             and hasattr(self.clients, 'driver')
             and self.clients.driver.provider == GraphProvider.FALKORDB
-            and group_ids
-            and len(group_ids) > 1
-        ):
+        )
+
+        # FalkorDB stores each group in its own graph, so a single group_id selects the graph for
+        # this call. The shared driver is never rebound, which keeps concurrent calls isolated.
+        if is_falkordb and group_ids and len(group_ids) == 1 and kwargs.get('driver') is None:
+            return await func(
+                self,
+                *args,
+                **{**kwargs, 'driver': self.clients.driver.clone(database=group_ids[0])},
+            )
+
+        # Only handle FalkorDB with multiple group_ids
+        if is_falkordb and group_ids and len(group_ids) > 1:
             # Execute for each group_id concurrently
             driver = self.clients.driver
 
@@ -15,8 +15,8 @@ limitations under the License.
 """
 
 import asyncio
-import datetime
 import logging
+from itertools import zip_longest
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -104,8 +104,7 @@ class FalkorDriverSession(GraphDriverSession):
                 params = convert_datetimes_to_strings(params)
                 await self.graph.query(str(cypher), params)  # type: ignore[reportUnknownArgumentType]
         else:
-            params = dict(kwargs)
-            params = convert_datetimes_to_strings(params)
+            params = convert_datetimes_to_strings(kwargs)
             await self.graph.query(str(query), params)  # type: ignore[reportUnknownArgumentType]
         # Assuming `graph.query` is async (ideal); otherwise, wrap in executor
         return None
@@ -169,7 +168,7 @@ class FalkorDriver(GraphDriver):
         graph = self._get_graph(self._database)
 
         # Convert datetime objects to ISO strings (FalkorDB does not support datetime objects directly)
-        params = convert_datetimes_to_strings(dict(kwargs))
+        params = convert_datetimes_to_strings(kwargs)
 
         try:
             result = await graph.query(cypher_query_, params)  # type: ignore[reportUnknownArgumentType]
@@ -185,16 +184,14 @@ class FalkorDriver(GraphDriver):
         header = [h[1] for h in result.header]
 
         # Convert FalkorDB's result format (list of lists) to the format expected by Graphiti (list of dicts)
-        records = []
-        for row in result.result_set:
-            record = {}
-            for i, field_name in enumerate(header):
-                if i < len(row):
-                    record[field_name] = row[i]
-                else:
-                    # If there are more fields in header than values in row, set to None
-                    record[field_name] = None
-            records.append(record)
+        # Fields missing from a row are set to None
+        num_fields = len(header)
+        records = [
+            dict(zip(header, row, strict=True))
+            if len(row) == num_fields
+            else dict(zip_longest(header, row[:num_fields]))
+            for row in result.result_set
+        ]
 
         return records, header, None
 
@@ -275,16 +272,7 @@ class FalkorDriver(GraphDriver):
 
     @staticmethod
     def convert_datetimes_to_strings(obj):
-        if isinstance(obj, dict):
-            return {k: FalkorDriver.convert_datetimes_to_strings(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [FalkorDriver.convert_datetimes_to_strings(item) for item in obj]
-        elif isinstance(obj, tuple):
-            return tuple(FalkorDriver.convert_datetimes_to_strings(item) for item in obj)
-        elif isinstance(obj, datetime):
-            return obj.isoformat()
-        else:
-            return obj
+        return convert_datetimes_to_strings(obj)
 
     def sanitize(self, query: str) -> str:
         """
@@ -16,22 +16,31 @@ limitations under the License.
 
 import asyncio
 import datetime
+import functools
 import logging
-from collections.abc import Coroutine
-from typing import Any
+from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Literal, TypeVar
 
 import boto3
 from langchain_aws.graphs import NeptuneAnalyticsGraph, NeptuneGraph
 from opensearchpy import OpenSearch, Urllib3AWSV4SignerAuth, Urllib3HttpConnection, helpers
 
 from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
+from graphiti_core.embedder.client import EMBEDDING_DIM
+from graphiti_core.helpers import decode_embedding, encode_embedding
 
 logger = logging.getLogger(__name__)
 DEFAULT_SIZE = 10
+# Threads running the blocking Neptune and OpenSearch clients, also the AOSS connection pool size
+DEFAULT_MAX_WORKERS = 20
+
+T = TypeVar('T')
 
 aoss_indices = [
     {
         'index_name': 'node_name_and_summary',
+        'embedding_field': 'name_embedding',
         'body': {
             'mappings': {
                 'properties': {
@@ -49,6 +58,7 @@ aoss_indices = [
     },
     {
         'index_name': 'community_name',
+        'embedding_field': 'name_embedding',
         'body': {
             'mappings': {
                 'properties': {
@@ -88,6 +98,7 @@ aoss_indices = [
     },
     {
         'index_name': 'edge_name_and_fact',
+        'embedding_field': 'fact_embedding',
         'body': {
             'mappings': {
                 'properties': {
@@ -109,15 +120,40 @@ aoss_indices = [
 class NeptuneDriver(GraphDriver):
     provider: GraphProvider = GraphProvider.NEPTUNE
 
-    def __init__(self, host: str, aoss_host: str, port: int = 8182, aoss_port: int = 443):
+    def __init__(
+        self,
+        host: str,
+        aoss_host: str,
+        port: int = 8182,
+        aoss_port: int = 443,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        embedding_dtype: Literal['float32', 'float16'] = 'float32',
+        aoss_knn: bool = False,
+    ):
         """This initializes a NeptuneDriver for use with Neptune as a backend
 
+        The Neptune and OpenSearch clients are synchronous, so their calls run on a bounded thread
+        pool instead of blocking the event loop. Up to max_workers queries run concurrently.
+
+        Embeddings are stored as base64 blobs of embedding_dtype values. Query parameters ending in
+        _embedding are encoded and result columns ending in _embedding are decoded by the driver.
+        With aoss_knn the AOSS indices also hold the embeddings, in k-NN vector fields, and
+        similarity searches only score the nearest neighbors found by AOSS. Entity nodes and edges
+        are then indexed in AOSS as they are saved. This needs a vector search collection and
+        indices created with aoss_knn enabled.
+
         Args:
             host (str): The Neptune Database or Neptune Analytics host
             aoss_host (str): The OpenSearch host value
             port (int, optional): The Neptune Database port, ignored for Neptune Analytics. Defaults to 8182.
             aoss_port (int, optional): The OpenSearch port. Defaults to 443.
+            max_workers (int, optional): The maximum number of concurrent Neptune and OpenSearch calls. Defaults to 20.
+            embedding_dtype (str, optional): float32, or float16 for half the storage. Defaults to float32.
+            aoss_knn (bool, optional): Delegate similarity search to AOSS k-NN. Defaults to False.
         """
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1')
+
         if not host:
             raise ValueError('You must provide an endpoint to create a NeptuneDriver')
 
@@ -148,8 +184,43 @@ class NeptuneDriver(GraphDriver):
             use_ssl=True,
             verify_certs=True,
             connection_class=Urllib3HttpConnection,
-            pool_maxsize=20,
+            pool_maxsize=max_workers,
         )
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='neptune')
+        self.embedding_dtype: Literal['float32', 'float16'] = embedding_dtype
+        self.aoss_knn = aoss_knn
+
+    async def _run_in_executor(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def _encode_embeddings(self, params: dict) -> dict:
+        # Copies the containers it changes, callers may still use their embeddings afterwards
+        encoded = {}
+        for k, v in params.items():
+            if isinstance(v, list) and k.endswith('_embedding'):
+                encoded[k] = encode_embedding(v, self.embedding_dtype)
+            elif isinstance(v, dict):
+                encoded[k] = self._encode_embeddings(v)
+            elif isinstance(v, list) and any(isinstance(item, dict) for item in v):
+                encoded[k] = [
+                    self._encode_embeddings(item) if isinstance(item, dict) else item for item in v
+                ]
+            else:
+                encoded[k] = v
+        return encoded
+
+    @staticmethod
+    def _decode_embeddings(record: dict) -> dict:
+        # Decodes the columns of a record and of the maps collected into its list columns
+        for k, v in record.items():
+            if isinstance(v, str) and k.endswith('_embedding'):
+                record[k] = decode_embedding(v)
+            elif isinstance(v, list):
+                for item in v:
+                    if isinstance(item, dict):
+                        NeptuneDriver._decode_embeddings(item)
+        return record
 
     def _sanitize_parameters(self, query, params: dict):
         if isinstance(query, list):
@@ -189,17 +260,22 @@ class NeptuneDriver(GraphDriver):
             return query
 
     async def execute_query(
-        self, cypher_query_, **kwargs: Any
-    ) -> tuple[dict[str, Any], None, None]:
-        params = dict(kwargs)
+        self, cypher_query_: str | list[tuple[str, dict[str, Any]]], **kwargs: Any
+    ) -> tuple[list[dict[str, Any]], None, None]:
+        params = self._encode_embeddings(kwargs)
         if isinstance(cypher_query_, list):
-            for q in cypher_query_:
-                result, _, _ = self._run_query(q[0], q[1])
+            result: list[dict[str, Any]] = []
+            for query, query_params in cypher_query_:
+                result, _, _ = await self._run_in_executor(
+                    self._run_query, query, self._encode_embeddings(query_params)
+                )
             return result, None, None
         else:
-            return self._run_query(cypher_query_, params)
+            return await self._run_in_executor(self._run_query, cypher_query_, params)
 
-    def _run_query(self, cypher_query_, params):
+    def _run_query(
+        self, cypher_query_: str, params: dict[str, Any]
+    ) -> tuple[list[dict[str, Any]], None, None]:
         cypher_query_ = str(self._sanitize_parameters(cypher_query_, params))
         try:
             result = self.client.query(cypher_query_, params=params)
@@ -209,13 +285,18 @@ class NeptuneDriver(GraphDriver):
             logger.error('Error executing query: %s', e)
             raise e
 
+        if isinstance(result, list):
+            for record in result:
+                if isinstance(record, dict):
+                    self._decode_embeddings(record)
         return result, None, None
 
     def session(self, database: str | None = None) -> GraphDriverSession:
         return NeptuneDriverSession(driver=self)
 
     async def close(self) -> None:
-        return self.client.client.close()
+        await self._run_in_executor(self.client.client.close)
+        self._executor.shutdown(wait=False)
 
     async def _delete_all_data(self) -> Any:
         return await self.execute_query('MATCH (n) DETACH DELETE n')
@@ -227,12 +308,29 @@ class NeptuneDriver(GraphDriver):
         # No matter what happens above, always return True
         return self.delete_aoss_indices()
 
+    def _index_body(self, index: dict[str, Any]) -> dict[str, Any]:
+        embedding_field = index.get('embedding_field')
+        if not self.aoss_knn or embedding_field is None:
+            return index['body']
+
+        properties = {
+            **index['body']['mappings']['properties'],
+            embedding_field: {
+                'type': 'knn_vector',
+                'dimension': EMBEDDING_DIM,
+                'method': {'name': 'hnsw', 'engine': 'faiss', 'space_type': 'cosinesimil'},
+            },
+        }
+        return {'settings': {'index': {'knn': True}}, 'mappings': {'properties': properties}}
+
     async def create_aoss_indices(self):
         for index in aoss_indices:
             index_name = index['index_name']
             client = self.aoss_client
-            if not client.indices.exists(index=index_name):
-                client.indices.create(index=index_name, body=index['body'])
+            if not await self._run_in_executor(client.indices.exists, index=index_name):
+                await self._run_in_executor(
+                    client.indices.create, index=index_name, body=self._index_body(index)
+                )
         # Sleep for 1 minute to let the index creation complete
         await asyncio.sleep(60)
 
@@ -240,8 +338,8 @@ class NeptuneDriver(GraphDriver):
         for index in aoss_indices:
             index_name = index['index_name']
             client = self.aoss_client
-            if client.indices.exists(index=index_name):
-                client.indices.delete(index=index_name)
+            if await self._run_in_executor(client.indices.exists, index=index_name):
+                await self._run_in_executor(client.indices.delete, index=index_name)
 
     async def build_indices_and_constraints(self, delete_existing: bool = False):
         # Neptune uses OpenSearch (AOSS) for indexing
@@ -249,26 +347,52 @@ class NeptuneDriver(GraphDriver):
             await self.delete_aoss_indices()
         await self.create_aoss_indices()
 
-    def run_aoss_query(self, name: str, query_text: str, limit: int = 10) -> dict[str, Any]:
+    async def run_aoss_query(self, name: str, query_text: str, limit: int = 10) -> dict[str, Any]:
         for index in aoss_indices:
             if name.lower() == index['index_name']:
-                index['query']['query']['multi_match']['query'] = query_text
-                query = {'size': limit, 'query': index['query']}
-                resp = self.aoss_client.search(body=query['query'], index=index['index_name'])
-                return resp
+                # Build the request from a copy, concurrent queries share the index definitions
+                body = {
+                    'query': {
+                        'multi_match': {
+                            **index['query']['query']['multi_match'],
+                            'query': query_text,
+                        }
+                    },
+                    'size': limit,
+                }
+                return await self._run_in_executor(
+                    self.aoss_client.search, body=body, index=index['index_name']
+                )
+        return {}
+
+    async def run_aoss_knn_query(
+        self, name: str, vector: list[float], limit: int = DEFAULT_SIZE
+    ) -> dict[str, Any]:
+        for index in aoss_indices:
+            if name.lower() == index['index_name'] and 'embedding_field' in index:
+                body = {
+                    'query': {'knn': {index['embedding_field']: {'vector': vector, 'k': limit}}},
+                    'size': limit,
+                    '_source': ['uuid'],
+                }
+                return await self._run_in_executor(
+                    self.aoss_client.search, body=body, index=index['index_name']
+                )
         return {}
 
-    def save_to_aoss(self, name: str, data: list[dict]) -> int:
+    async def save_to_aoss(self, name: str, data: list[dict]) -> int:
         for index in aoss_indices:
             if name.lower() == index['index_name']:
                 to_index = []
                 for d in data:
                     item = {'_index': name, '_id': d['uuid']}
-                    for p in index['body']['mappings']['properties']:
+                    for p in self._index_body(index)['mappings']['properties']:
                         if p in d:
                             item[p] = d[p]
                     to_index.append(item)
-                success, failed = helpers.bulk(self.aoss_client, to_index, stats_only=True)
+                success, failed = await self._run_in_executor(
+                    helpers.bulk, self.aoss_client, to_index, stats_only=True
+                )
                 return success
 
         return 0
@@ -32,10 +32,10 @@ from graphiti_core.helpers import parse_db_date
 from graphiti_core.models.edges.edge_db_queries import (
     COMMUNITY_EDGE_RETURN,
     EPISODIC_EDGE_RETURN,
-    EPISODIC_EDGE_SAVE,
     get_community_edge_save_query,
     get_entity_edge_return_query,
     get_entity_edge_save_query,
+    get_episodic_edge_save_query,
 )
 from graphiti_core.nodes import Node
 
@@ -131,7 +131,7 @@ class Edge(BaseModel, ABC):
 class EpisodicEdge(Edge):
     async def save(self, driver: GraphDriver):
         result = await driver.execute_query(
-            EPISODIC_EDGE_SAVE,
+            get_episodic_edge_save_query(driver.provider),
             episode_uuid=self.source_node_uuid,
             entity_uuid=self.target_node_uuid,
             uuid=self.uuid,
@@ -259,12 +259,6 @@ class EntityEdge(Edge):
             RETURN e.fact_embedding AS fact_embedding
         """
 
-        if driver.provider == GraphProvider.NEPTUNE:
-            query = """
-                MATCH (n:Entity)-[e:RELATES_TO {uuid: $uuid}]->(m:Entity)
-                RETURN [x IN split(e.fact_embedding, ",") | toFloat(x)] as fact_embedding
-            """
-
         if driver.provider == GraphProvider.KUZU:
             query = """
                 MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_ {uuid: $uuid})-[:RELATES_TO]->(m:Entity)
@@ -311,6 +305,11 @@ class EntityEdge(Edge):
                 edge_data=edge_data,
             )
 
+        if driver.provider == GraphProvider.NEPTUNE and driver.aoss_knn:  # pyright: ignore reportAttributeAccessIssue
+            await driver.save_to_aoss(  # pyright: ignore reportAttributeAccessIssue
+                'edge_name_and_fact', [edge_data]
+            )
+
         logger.debug(f'Saved edge to Graph: {self.uuid}')
 
         return result
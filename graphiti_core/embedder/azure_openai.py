@@ -20,6 +20,7 @@ from typing import Any
 from openai import AsyncAzureOpenAI, AsyncOpenAI
 
 from .client import EmbedderClient
+from .openai import OPENAI_MAX_BATCH_ITEMS, OPENAI_MAX_BATCH_TOKENS
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,9 @@ class AzureOpenAIEmbedderClient(EmbedderClient):
     Supports both AsyncAzureOpenAI and AsyncOpenAI (with Azure v1 API endpoint).
     """
 
+    max_batch_items = OPENAI_MAX_BATCH_ITEMS
+    max_batch_tokens = OPENAI_MAX_BATCH_TOKENS
+
     def __init__(
         self,
         azure_client: AsyncAzureOpenAI | AsyncOpenAI,
@@ -58,7 +62,7 @@ class AzureOpenAIEmbedderClient(EmbedderClient):
             logger.error(f'Error in Azure OpenAI embedding: {e}')
             raise
 
-    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+    async def _create_batch(self, input_data_list: list[str]) -> list[list[float]]:
         """Create batch embeddings using Azure OpenAI client."""
         try:
             response = await self.azure_client.embeddings.create(
@@ -14,20 +14,46 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
+import logging
 import os
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
 
 from pydantic import BaseModel, Field
 
+logger = logging.getLogger(__name__)
+
 EMBEDDING_DIM = int(os.getenv('EMBEDDING_DIM', 1024))
 
+DEFAULT_MAX_BATCH_ITEMS = 100
+DEFAULT_MAX_CONCURRENT_BATCHES = 4
+# Conservative estimate so that token budgets are not exceeded for non-English text
+CHARS_PER_TOKEN = 3
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Whether a provider error means the request was throttled rather than rejected."""
+    # Provider SDKs are optional, so match their rate limit errors by name and HTTP status
+    if any(cls.__name__ == 'RateLimitError' for cls in type(error).__mro__):
+        return True
+    return any(getattr(error, attr, None) == 429 for attr in ('status_code', 'code', 'http_status'))
+
 
 class EmbedderConfig(BaseModel):
     embedding_dim: int = Field(default=EMBEDDING_DIM, frozen=True)
 
 
 class EmbedderClient(ABC):
+    # Provider limits for a single embedding request, subclasses override them
+    max_batch_items: int = DEFAULT_MAX_BATCH_ITEMS
+    max_batch_tokens: int | None = None
+    max_concurrent_batches: int = DEFAULT_MAX_CONCURRENT_BATCHES
+
     @abstractmethod
     async def create(
         self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
@@ -35,4 +61,70 @@ class EmbedderClient(ABC):
         pass
 
     async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        """
+        Create embeddings for a list of inputs, preserving their order.
+
+        The inputs are split into sub-batches that respect max_batch_items and max_batch_tokens,
+        and up to max_concurrent_batches sub-batches are embedded at the same time with
+        _create_batch(). If a sub-batch fails, its inputs are retried one at a time so that a
+        single input the provider rejects does not fail the others. Rate limit errors are raised
+        instead, since retrying every input would only add requests to a throttled provider.
+        """
+        if not input_data_list:
+            return []
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+
+        async def embed(batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                embeddings = await self._create_batch(batch)
+            if len(embeddings) != len(batch):
+                raise ValueError(f'Expected {len(batch)} embeddings, got {len(embeddings)}')
+            return embeddings
+
+        async def embed_sub_batch(batch: list[str]) -> list[list[float]]:
+            if len(batch) == 1:
+                return await embed(batch)
+            try:
+                return await embed(batch)
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    raise
+                logger.warning(
+                    f'Embedding a batch of {len(batch)} inputs failed, retrying them individually: {e}'
+                )
+                results = await asyncio.gather(*[embed([item]) for item in batch])
+                return [embeddings[0] for embeddings in results]
+
+        results = await asyncio.gather(
+            *[embed_sub_batch(batch) for batch in self._split_batches(input_data_list)]
+        )
+        return [embedding for embeddings in results for embedding in embeddings]
+
+    async def _create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        """Embed a single sub-batch with one provider request."""
         raise NotImplementedError()
+
+    def _split_batches(self, input_data_list: list[str]) -> list[list[str]]:
+        batches: list[list[str]] = []
+        batch: list[str] = []
+        batch_tokens = 0
+        for item in input_data_list:
+            item_tokens = estimate_tokens(item)
+            if batch and (
+                len(batch) >= self.max_batch_items
+                or (
+                    self.max_batch_tokens is not None
+                    and batch_tokens + item_tokens > self.max_batch_tokens
+                )
+            ):
+                batches.append(batch)
+                batch = []
+                batch_tokens = 0
+            batch.append(item)
+            batch_tokens += item_tokens
+
+        if batch:
+            batches.append(batch)
+
+        return batches
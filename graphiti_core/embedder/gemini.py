@@ -84,6 +84,7 @@ class GeminiEmbedder(EmbedderClient):
             self.batch_size = DEFAULT_BATCH_SIZE
         else:
             self.batch_size = batch_size
+        self.max_batch_items = self.batch_size
 
     async def create(
         self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
@@ -110,12 +111,13 @@ class GeminiEmbedder(EmbedderClient):
 
         return result.embeddings[0].values
 
-    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+    async def _create_batch(self, input_data_list: list[str]) -> list[list[float]]:
         """
-        Create embeddings for a batch of input data using Google's Gemini embedding model.
+        Create embeddings for a sub-batch of input data with a single request.
 
-        This method handles batching to respect the Gemini API's limits on the number
-        of instances that can be processed in a single request.
+        create_batch() splits its input into sub-batches of at most batch_size inputs, to respect
+        the Gemini API's limits on the number of instances that can be processed in a single
+        request, and embeds them concurrently.
 
         Args:
             input_data_list: A list of strings to create embeddings for.
@@ -123,61 +125,19 @@ class GeminiEmbedder(EmbedderClient):
         Returns:
             A list of embedding vectors (each vector is a list of floats).
         """
-        if not input_data_list:
-            return []
-
-        batch_size = self.batch_size
-        all_embeddings = []
-
-        # Process inputs in batches
-        for i in range(0, len(input_data_list), batch_size):
-            batch = input_data_list[i : i + batch_size]
-
-            try:
-                # Generate embeddings for this batch
-                result = await self.client.aio.models.embed_content(
-                    model=self.config.embedding_model or DEFAULT_EMBEDDING_MODEL,
-                    contents=batch,  # type: ignore[arg-type]  # mypy fails on broad union type
-                    config=types.EmbedContentConfig(
-                        output_dimensionality=self.config.embedding_dim
-                    ),
-                )
-
-                if not result.embeddings or len(result.embeddings) == 0:
-                    raise Exception('No embeddings returned')
-
-                # Process embeddings from this batch
-                for embedding in result.embeddings:
-                    if not embedding.values:
-                        raise ValueError('Empty embedding values returned')
-                    all_embeddings.append(embedding.values)
-
-            except Exception as e:
-                # If batch processing fails, fall back to individual processing
-                logger.warning(
-                    f'Batch embedding failed for batch {i // batch_size + 1}, falling back to individual processing: {e}'
-                )
-
-                for item in batch:
-                    try:
-                        # Process each item individually
-                        result = await self.client.aio.models.embed_content(
-                            model=self.config.embedding_model or DEFAULT_EMBEDDING_MODEL,
-                            contents=[item],  # type: ignore[arg-type]  # mypy fails on broad union type
-                            config=types.EmbedContentConfig(
-                                output_dimensionality=self.config.embedding_dim
-                            ),
-                        )
-
-                        if not result.embeddings or len(result.embeddings) == 0:
-                            raise ValueError('No embeddings returned from Gemini API')
-                        if not result.embeddings[0].values:
-                            raise ValueError('Empty embedding values returned')
-
-                        all_embeddings.append(result.embeddings[0].values)
-
-                    except Exception as individual_error:
-                        logger.error(f'Failed to embed individual item: {individual_error}')
-                        raise individual_error
-
-        return all_embeddings
+        result = await self.client.aio.models.embed_content(
+            model=self.config.embedding_model or DEFAULT_EMBEDDING_MODEL,
+            contents=input_data_list,  # type: ignore[arg-type]  # mypy fails on broad union type
+            config=types.EmbedContentConfig(output_dimensionality=self.config.embedding_dim),
+        )
+
+        if not result.embeddings or len(result.embeddings) == 0:
+            raise ValueError('No embeddings returned from Gemini API')
+
+        embeddings: list[list[float]] = []
+        for embedding in result.embeddings:
+            if not embedding.values:
+                raise ValueError('Empty embedding values returned')
+            embeddings.append(embedding.values)
+
+        return embeddings
@@ -23,6 +23,10 @@ from .client import EmbedderClient, EmbedderConfig
 
 DEFAULT_EMBEDDING_MODEL = 'text-embedding-3-small'
 
+# Limits of a single request to the embeddings endpoint
+OPENAI_MAX_BATCH_ITEMS = 2048
+OPENAI_MAX_BATCH_TOKENS = 300_000
+
 
 class OpenAIEmbedderConfig(EmbedderConfig):
     embedding_model: EmbeddingModel | str = DEFAULT_EMBEDDING_MODEL
@@ -37,6 +41,9 @@ class OpenAIEmbedder(EmbedderClient):
     This client supports both AsyncOpenAI and AsyncAzureOpenAI clients.
     """
 
+    max_batch_items = OPENAI_MAX_BATCH_ITEMS
+    max_batch_tokens = OPENAI_MAX_BATCH_TOKENS
+
     def __init__(
         self,
         config: OpenAIEmbedderConfig | None = None,
@@ -59,7 +66,7 @@ class OpenAIEmbedder(EmbedderClient):
         )
         return result.data[0].embedding[: self.config.embedding_dim]
 
-    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+    async def _create_batch(self, input_data_list: list[str]) -> list[list[float]]:
         result = await self.client.embeddings.create(
             input=input_data_list, model=self.config.embedding_model
         )
@@ -17,7 +17,7 @@ limitations under the License.
 from openai import AsyncOpenAI
 
 from .client import EmbedderClient
-from .openai import OpenAIEmbedderConfig
+from .openai import OPENAI_MAX_BATCH_ITEMS, OPENAI_MAX_BATCH_TOKENS, OpenAIEmbedderConfig
 
 
 class OpenAIGenericEmbedder(EmbedderClient):
@@ -27,6 +27,9 @@ class OpenAIGenericEmbedder(EmbedderClient):
     This client is designed to work with any OpenAI-compatible embedding service.
     """
 
+    max_batch_items = OPENAI_MAX_BATCH_ITEMS
+    max_batch_tokens = OPENAI_MAX_BATCH_TOKENS
+
     def __init__(
         self,
         config: OpenAIEmbedderConfig | None = None,
@@ -51,7 +54,7 @@ class OpenAIGenericEmbedder(EmbedderClient):
         )
         return result.data[0].embedding[: self.config.embedding_dim]
 
-    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+    async def _create_batch(self, input_data_list: list[str]) -> list[list[float]]:
         result = await self.client.embeddings.create(
             input=input_data_list, model=self.config.embedding_model
         )
@@ -0,0 +1,121 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+import numpy as np
+from pydantic import Field
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+else:
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        raise ImportError(
+            'sentence-transformers is required for SentenceTransformerEmbedder. '
+            'Install it with: pip install graphiti-core[sentence-transformers]'
+        ) from None
+
+from ..utils.micro_batch import DEFAULT_BATCH_SIZE, DEFAULT_BATCH_WAIT, MicroBatchWorker
+from .client import EmbedderClient, EmbedderConfig
+
+# 1024-dimensional, matching the default EMBEDDING_DIM
+DEFAULT_EMBEDDING_MODEL = 'BAAI/bge-m3'
+
+WARMUP_TEXT = 'warm up'
+
+
+class SentenceTransformerEmbedderConfig(EmbedderConfig):
+    embedding_model: str = Field(default=DEFAULT_EMBEDDING_MODEL)
+    device: str = 'cpu'
+    batch_size: int = Field(default=DEFAULT_BATCH_SIZE, ge=1)
+    batch_wait: float = Field(default=DEFAULT_BATCH_WAIT, ge=0)
+    normalize_embeddings: bool = True
+    torch_num_threads: int | None = None
+    warmup: bool = True
+
+
+class SentenceTransformerEmbedder(EmbedderClient):
+    """
+    Local Sentence Transformers Embedder Client
+
+    Embeds text on the local machine, by default on the CPU. The model is owned by a dedicated
+    worker thread that merges the texts of concurrent create() and create_batch() calls into
+    batches of up to batch_size texts, waiting at most batch_wait seconds for a batch to fill up.
+    """
+
+    def __init__(self, config: SentenceTransformerEmbedderConfig | None = None):
+        if config is None:
+            config = SentenceTransformerEmbedderConfig()
+        self.config = config
+        self.model = SentenceTransformer(config.embedding_model, device=config.device)
+        self._worker: MicroBatchWorker[str, list[float]] = MicroBatchWorker(
+            self._encode,
+            batch_size=config.batch_size,
+            batch_wait=config.batch_wait,
+            initializer=self._initialize_worker,
+            name='sentence-transformer-embedder',
+        )
+        if config.warmup:
+            self._worker.start()
+
+    async def create(
+        self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
+    ) -> list[float]:
+        if isinstance(input_data, str):
+            input_list = [input_data]
+        elif isinstance(input_data, list) and all(isinstance(i, str) for i in input_data):
+            input_list = [str(i) for i in input_data if i]
+        else:
+            raise ValueError('SentenceTransformerEmbedder only embeds text input')
+
+        if len(input_list) == 0:
+            return []
+
+        embeddings = await self._worker.submit(input_list[:1])
+        return embeddings[0]
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        return await self._worker.submit(input_data_list)
+
+    def close(self):
+        """Stop the worker thread once the queued texts have been embedded."""
+        self._worker.close()
+
+    def _initialize_worker(self):
+        if self.config.torch_num_threads is not None:
+            import torch
+
+            torch.set_num_threads(self.config.torch_num_threads)
+
+        # Load weights and build kernels before the first real request
+        if self.config.warmup:
+            self._encode([WARMUP_TEXT])
+
+    def _encode(self, texts: list[str]) -> list[list[float]]:
+        embeddings = np.asarray(
+            self.model.encode(
+                texts,
+                batch_size=self.config.batch_size,
+                normalize_embeddings=self.config.normalize_embeddings,
+                convert_to_numpy=True,
+            ),
+            dtype=np.float32,
+        )[:, : self.config.embedding_dim]
+
+        return embeddings.tolist()
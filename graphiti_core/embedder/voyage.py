@@ -34,6 +34,10 @@ from .client import EmbedderClient, EmbedderConfig
 
 DEFAULT_EMBEDDING_MODEL = 'voyage-3'
 
+# Limits of a single request to the embeddings endpoint
+VOYAGE_MAX_BATCH_ITEMS = 1000
+VOYAGE_MAX_BATCH_TOKENS = 120_000
+
 
 class VoyageAIEmbedderConfig(EmbedderConfig):
     embedding_model: str = Field(default=DEFAULT_EMBEDDING_MODEL)
@@ -45,6 +49,9 @@ class VoyageAIEmbedder(EmbedderClient):
     VoyageAI Embedder Client
     """
 
+    max_batch_items = VOYAGE_MAX_BATCH_ITEMS
+    max_batch_tokens = VOYAGE_MAX_BATCH_TOKENS
+
     def __init__(self, config: VoyageAIEmbedderConfig | None = None):
         if config is None:
             config = VoyageAIEmbedderConfig()
@@ -68,7 +75,7 @@ class VoyageAIEmbedder(EmbedderClient):
         result = await self.client.embed(input_list, model=self.config.embedding_model)
         return [float(x) for x in result.embeddings[0][: self.config.embedding_dim]]
 
-    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+    async def _create_batch(self, input_data_list: list[str]) -> list[list[float]]:
         result = await self.client.embed(input_data_list, model=self.config.embedding_model)
         return [
             [float(x) for x in embedding[: self.config.embedding_dim]]
@@ -14,7 +14,10 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import logging
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
 from datetime import datetime
 from time import time
 
@@ -25,7 +28,7 @@ from typing_extensions import LiteralString
 from graphiti_core.cross_encoder.client import CrossEncoderClient
 from graphiti_core.cross_encoder.openai_reranker_client import OpenAIRerankerClient
 from graphiti_core.decorators import handle_multiple_group_ids
-from graphiti_core.driver.driver import GraphDriver
+from graphiti_core.driver.driver import GraphDriver, GraphProvider
 from graphiti_core.driver.neo4j_driver import Neo4jDriver
 from graphiti_core.edges import (
     CommunityEdge,
@@ -43,6 +46,7 @@ from graphiti_core.helpers import (
     validate_group_id,
 )
 from graphiti_core.llm_client import LLMClient, OpenAIClient
+from graphiti_core.models.nodes.node_db_queries import ENTITY_MENTION_COUNT_DECREMENT
 from graphiti_core.nodes import (
     CommunityNode,
     EntityNode,
@@ -52,6 +56,7 @@ from graphiti_core.nodes import (
     create_entity_node_embeddings,
 )
 from graphiti_core.search.search import SearchConfig, search
+from graphiti_core.search.search_cache import SearchCache
 from graphiti_core.search.search_config import DEFAULT_SEARCH_LIMIT, SearchResults
 from graphiti_core.search.search_config_recipes import (
     COMBINED_HYBRID_SEARCH_CROSS_ENCODER,
@@ -66,19 +71,25 @@ from graphiti_core.search.search_utils import (
 from graphiti_core.telemetry import capture_event
 from graphiti_core.tracer import Tracer, create_tracer
 from graphiti_core.utils.bulk_utils import (
+    CHUNK_SIZE,
     RawEpisode,
+    add_communities_bulk,
     add_nodes_and_edges_bulk,
     dedupe_edges_bulk,
     dedupe_nodes_bulk,
     extract_nodes_and_edges_bulk,
+    iter_episode_chunks,
     resolve_edge_pointers,
     retrieve_previous_episodes_bulk,
 )
 from graphiti_core.utils.datetime_utils import utc_now
 from graphiti_core.utils.maintenance.community_operations import (
+    CommunityDetectionAlgorithm,
+    CommunityUpdateBatcher,
     build_communities,
+    build_communities_incremental,
     remove_communities,
-    update_community,
+    update_communities_bulk,
 )
 from graphiti_core.utils.maintenance.edge_operations import (
     build_episodic_edges,
@@ -101,6 +112,15 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 
+# Output of the extraction stage of a bulk chunk: the saved episodes, their previous-episode
+# context, and the raw extracted nodes and edges per episode.
+BulkChunkExtraction = tuple[
+    list[EpisodicNode],
+    list[tuple[EpisodicNode, list[EpisodicNode]]],
+    list[list[EntityNode]],
+    list[list[EntityEdge]],
+]
+
 
 class AddEpisodeResults(BaseModel):
     episode: EpisodicNode
@@ -120,6 +140,12 @@ class AddBulkEpisodeResults(BaseModel):
     community_edges: list[CommunityEdge]
 
 
+class AddBulkEpisodeChunkResults(AddBulkEpisodeResults):
+    chunk_index: int
+    episodes_processed: int
+    duration_ms: float
+
+
 class AddTripletResults(BaseModel):
     nodes: list[EntityNode]
     edges: list[EntityEdge]
@@ -139,6 +165,8 @@ class Graphiti:
         max_coroutines: int | None = None,
         tracer: Tracer | None = None,
         trace_span_prefix: str = 'graphiti',
+        search_cache: SearchCache | None = None,
+        community_update_window: float | None = None,
     ):
         """
         Initialize a Graphiti instance.
@@ -175,6 +203,14 @@ class Graphiti:
             An OpenTelemetry tracer instance for distributed tracing. If not provided, tracing is disabled (no-op).
         trace_span_prefix : str, optional
             Prefix to prepend to all span names. Defaults to 'graphiti'.
+        search_cache : SearchCache | None, optional
+            A cache of search results that is invalidated by every write to the searched groups.
+            If not provided, search results are not cached.
+        community_update_window : float | None, optional
+            Seconds to collect the community updates of episodes added with update_communities=True
+            before applying them together, summarizing each affected community once. Deferred
+            updates are not part of the returned AddEpisodeResults. If not provided, every episode
+            applies its community updates before returning.
 
         Returns
         -------
@@ -217,6 +253,17 @@ class Graphiti:
         else:
             self.cross_encoder = OpenAIRerankerClient()
 
+        self.search_cache = search_cache
+
+        self.community_updates: CommunityUpdateBatcher | None = None
+        if community_update_window is not None:
+            self.community_updates = CommunityUpdateBatcher(
+                self.llm_client,
+                self.embedder,
+                window=community_update_window,
+                on_flush=self._invalidate_search_cache,
+            )
+
         # Initialize tracer
         self.tracer = create_tracer(tracer, trace_span_prefix)
 
@@ -229,6 +276,7 @@ class Graphiti:
             embedder=self.embedder,
             cross_encoder=self.cross_encoder,
             tracer=self.tracer,
+            search_cache=search_cache,
         )
 
         # Capture telemetry event
@@ -316,8 +364,18 @@ class Graphiti:
             finally:
                 graphiti.close()
         """
+        if self.community_updates is not None:
+            await self.community_updates.close()
+
         await self.driver.close()
 
+    async def flush_community_updates(self) -> tuple[list[CommunityNode], list[CommunityEdge]]:
+        """Apply the community updates that are waiting for the community_update_window."""
+        if self.community_updates is None:
+            return [], []
+
+        return await self.community_updates.flush()
+
     async def build_indices_and_constraints(self, delete_existing: bool = False):
         """
         Build indices and constraints in the Neo4j database.
@@ -354,6 +412,7 @@ class Graphiti:
 
     async def _extract_and_resolve_nodes(
         self,
+        clients: GraphitiClients,
         episode: EpisodicNode,
         previous_episodes: list[EpisodicNode],
         entity_types: dict[str, type[BaseModel]] | None,
@@ -361,11 +420,11 @@ class Graphiti:
     ) -> tuple[list[EntityNode], dict[str, str], list[tuple[EntityNode, EntityNode]]]:
         """Extract nodes from episode and resolve against existing graph."""
         extracted_nodes = await extract_nodes(
-            self.clients, episode, previous_episodes, entity_types, excluded_entity_types
+            clients, episode, previous_episodes, entity_types, excluded_entity_types
         )
 
         nodes, uuid_map, duplicates = await resolve_extracted_nodes(
-            self.clients,
+            clients,
             extracted_nodes,
             episode,
             previous_episodes,
@@ -374,20 +433,28 @@ class Graphiti:
 
         return nodes, uuid_map, duplicates
 
-    async def _extract_and_resolve_edges(
+    async def _extract_episode(
         self,
+        clients: GraphitiClients,
         episode: EpisodicNode,
-        extracted_nodes: list[EntityNode],
         previous_episodes: list[EpisodicNode],
+        entity_types: dict[str, type[BaseModel]] | None,
+        excluded_entity_types: list[str] | None,
         edge_type_map: dict[tuple[str, str], list[str]],
         group_id: str,
         edge_types: dict[str, type[BaseModel]] | None,
-        nodes: list[EntityNode],
-        uuid_map: dict[str, str],
-    ) -> tuple[list[EntityEdge], list[EntityEdge]]:
-        """Extract edges from episode and resolve against existing graph."""
+    ) -> tuple[list[EntityNode], list[EntityEdge]]:
+        """Extract nodes and edges from an episode.
+
+        Extraction only depends on the episode and its previous episodes, never on the entities
+        and edges already in the graph, so it can run ahead of the resolution of earlier episodes.
+        """
+        extracted_nodes = await extract_nodes(
+            clients, episode, previous_episodes, entity_types, excluded_entity_types
+        )
+
         extracted_edges = await extract_edges(
-            self.clients,
+            clients,
             episode,
             extracted_nodes,
             previous_episodes,
@@ -396,10 +463,37 @@ class Graphiti:
             edge_types,
         )
 
+        return extracted_nodes, extracted_edges
+
+    async def _resolve_and_save_episode(
+        self,
+        clients: GraphitiClients,
+        episode: EpisodicNode,
+        previous_episodes: list[EpisodicNode],
+        extracted_nodes: list[EntityNode],
+        extracted_edges: list[EntityEdge],
+        entity_types: dict[str, type[BaseModel]] | None,
+        edge_type_map: dict[tuple[str, str], list[str]],
+        edge_types: dict[str, type[BaseModel]] | None,
+        update_communities: bool,
+        now: datetime,
+    ) -> tuple[AddEpisodeResults, list[EntityEdge]]:
+        """Resolve extracted nodes and edges against the graph, invalidate edges and persist.
+
+        Returns the episode results along with the edges invalidated by this episode.
+        """
+        nodes, uuid_map, _ = await resolve_extracted_nodes(
+            clients,
+            extracted_nodes,
+            episode,
+            previous_episodes,
+            entity_types,
+        )
+
         edges = resolve_edge_pointers(extracted_edges, uuid_map)
 
         resolved_edges, invalidated_edges = await resolve_extracted_edges(
-            self.clients,
+            clients,
             edges,
             episode,
             nodes,
@@ -407,10 +501,46 @@ class Graphiti:
             edge_type_map,
         )
 
-        return resolved_edges, invalidated_edges
+        # Extract node attributes
+        hydrated_nodes = await extract_attributes_from_nodes(
+            clients, nodes, episode, previous_episodes, entity_types
+        )
+
+        entity_edges = resolved_edges + invalidated_edges
+
+        # Process and save episode data
+        episodic_edges, episode = await self._process_episode_data(
+            clients, episode, hydrated_nodes, entity_edges, now
+        )
+
+        # Update communities if requested
+        communities: list[CommunityNode] = []
+        community_edges: list[CommunityEdge] = []
+        if update_communities:
+            if self.community_updates is not None:
+                self.community_updates.add(clients.driver, hydrated_nodes)
+            else:
+                communities, community_edges = await update_communities_bulk(
+                    clients.driver, clients.llm_client, clients.embedder, hydrated_nodes
+                )
+
+        self._invalidate_search_cache([episode.group_id])
+
+        return (
+            AddEpisodeResults(
+                episode=episode,
+                episodic_edges=episodic_edges,
+                nodes=hydrated_nodes,
+                edges=entity_edges,
+                communities=communities,
+                community_edges=community_edges,
+            ),
+            invalidated_edges,
+        )
 
     async def _process_episode_data(
         self,
+        clients: GraphitiClients,
         episode: EpisodicNode,
         nodes: list[EntityNode],
         entity_edges: list[EntityEdge],
@@ -424,7 +554,7 @@ class Graphiti:
             episode.content = ''
 
         await add_nodes_and_edges_bulk(
-            self.driver,
+            clients.driver,
             [episode],
             episodic_edges,
             nodes,
@@ -434,38 +564,146 @@ class Graphiti:
 
         return episodic_edges, episode
 
-    async def _extract_and_dedupe_nodes_bulk(
+    async def _extract_bulk_chunk(
         self,
-        episode_context: list[tuple[EpisodicNode, list[EpisodicNode]]],
+        clients: GraphitiClients,
+        bulk_episodes: list[RawEpisode],
+        group_id: str,
+        now: datetime,
         edge_type_map: dict[tuple[str, str], list[str]],
         edge_types: dict[str, type[BaseModel]] | None,
         entity_types: dict[str, type[BaseModel]] | None,
         excluded_entity_types: list[str] | None,
-    ) -> tuple[
-        dict[str, list[EntityNode]],
-        dict[str, str],
-        list[list[EntityEdge]],
-    ]:
-        """Extract nodes and edges from all episodes and deduplicate."""
+    ) -> BulkChunkExtraction:
+        """Save a batch of raw episodes and run LLM extraction over them.
+
+        This stage does not read entities or edges from the graph, so it can safely run ahead of
+        the resolution of an earlier batch.
+        """
+        episodes = [
+            await EpisodicNode.get_by_uuid(clients.driver, episode.uuid)
+            if episode.uuid is not None
+            else EpisodicNode(
+                name=episode.name,
+                labels=[],
+                source=episode.source,
+                content=episode.content,
+                source_description=episode.source_description,
+                group_id=group_id,
+                created_at=now,
+                valid_at=episode.reference_time,
+            )
+            for episode in bulk_episodes
+        ]
+
+        # Save all episodes
+        await add_nodes_and_edges_bulk(
+            driver=clients.driver,
+            episodic_nodes=episodes,
+            episodic_edges=[],
+            entity_nodes=[],
+            entity_edges=[],
+            embedder=self.embedder,
+        )
+        self._invalidate_search_cache([group_id])
+
+        # Get previous episode context for each episode
+        episode_context = await retrieve_previous_episodes_bulk(clients.driver, episodes)
+
         # Extract all nodes and edges for each episode
         extracted_nodes_bulk, extracted_edges_bulk = await extract_nodes_and_edges_bulk(
-            self.clients,
+            clients,
             episode_context,
             edge_type_map=edge_type_map,
             edge_types=edge_types,
             entity_types=entity_types,
             excluded_entity_types=excluded_entity_types,
+            max_coroutines=self.max_coroutines,
         )
 
+        return episodes, episode_context, extracted_nodes_bulk, extracted_edges_bulk
+
+    async def _resolve_and_save_bulk_chunk(
+        self,
+        clients: GraphitiClients,
+        episodes: list[EpisodicNode],
+        episode_context: list[tuple[EpisodicNode, list[EpisodicNode]]],
+        extracted_nodes_bulk: list[list[EntityNode]],
+        extracted_edges_bulk: list[list[EntityEdge]],
+        now: datetime,
+        edge_type_map: dict[tuple[str, str], list[str]],
+        edge_types: dict[str, type[BaseModel]] | None,
+        entity_types: dict[str, type[BaseModel]] | None,
+    ) -> AddBulkEpisodeResults:
+        """Dedupe and resolve an extracted batch against the graph and persist it."""
         # Dedupe extracted nodes in memory
         nodes_by_episode, uuid_map = await dedupe_nodes_bulk(
-            self.clients, extracted_nodes_bulk, episode_context, entity_types
+            clients, extracted_nodes_bulk, episode_context, entity_types
+        )
+
+        # Create Episodic Edges
+        episodic_edges: list[EpisodicEdge] = []
+        for episode_uuid, nodes in nodes_by_episode.items():
+            episodic_edges.extend(build_episodic_edges(nodes, episode_uuid, now))
+
+        # Re-map edge pointers and dedupe edges
+        extracted_edges_bulk_updated: list[list[EntityEdge]] = [
+            resolve_edge_pointers(edges, uuid_map) for edges in extracted_edges_bulk
+        ]
+
+        edges_by_episode = await dedupe_edges_bulk(
+            clients,
+            extracted_edges_bulk_updated,
+            episode_context,
+            [],
+            edge_types or {},
+            edge_type_map,
+        )
+
+        # Resolve nodes and edges against the existing graph
+        (
+            final_hydrated_nodes,
+            resolved_edges,
+            invalidated_edges,
+            final_uuid_map,
+        ) = await self._resolve_nodes_and_edges_bulk(
+            clients,
+            nodes_by_episode,
+            edges_by_episode,
+            episode_context,
+            entity_types,
+            edge_types,
+            edge_type_map,
+            episodes,
+        )
+
+        # Resolved pointers for episodic edges
+        resolved_episodic_edges = resolve_edge_pointers(episodic_edges, final_uuid_map)
+
+        # save data to KG
+        await add_nodes_and_edges_bulk(
+            clients.driver,
+            episodes,
+            resolved_episodic_edges,
+            final_hydrated_nodes,
+            resolved_edges + invalidated_edges,
+            self.embedder,
         )
 
-        return nodes_by_episode, uuid_map, extracted_edges_bulk
+        self._invalidate_search_cache(list({episode.group_id for episode in episodes}))
+
+        return AddBulkEpisodeResults(
+            episodes=episodes,
+            episodic_edges=resolved_episodic_edges,
+            nodes=final_hydrated_nodes,
+            edges=resolved_edges + invalidated_edges,
+            communities=[],
+            community_edges=[],
+        )
 
     async def _resolve_nodes_and_edges_bulk(
         self,
+        clients: GraphitiClients,
         nodes_by_episode: dict[str, list[EntityNode]],
         edges_by_episode: dict[str, list[EntityEdge]],
         episode_context: list[tuple[EpisodicNode, list[EpisodicNode]]],
@@ -494,7 +732,7 @@ class Graphiti:
         node_results = await semaphore_gather(
             *[
                 resolve_extracted_nodes(
-                    self.clients,
+                    clients,
                     nodes_by_episode_unique[episode.uuid],
                     episode,
                     previous_episodes,
@@ -527,7 +765,7 @@ class Graphiti:
         hydrated_nodes_results: list[list[EntityNode]] = await semaphore_gather(
             *[
                 extract_attributes_from_nodes(
-                    self.clients,
+                    clients,
                     nodes_by_episode_unique[episode.uuid],
                     episode,
                     previous_episodes,
@@ -554,7 +792,7 @@ class Graphiti:
         edge_results = await semaphore_gather(
             *[
                 resolve_extracted_edges(
-                    self.clients,
+                    clients,
                     edges_by_episode_unique[episode.uuid],
                     episode,
                     final_hydrated_nodes,
@@ -573,6 +811,35 @@ class Graphiti:
 
         return final_hydrated_nodes, resolved_edges, invalidated_edges, uuid_map
 
+    def _invalidate_search_cache(self, group_ids: list[str] | None):
+        """Drop cached search results that may have been affected by a write to these groups."""
+        if self.search_cache is not None:
+            self.search_cache.invalidate(group_ids)
+
+    def _get_group_clients(
+        self, group_id: str | None, driver: GraphDriver | None = None
+    ) -> tuple[str, GraphitiClients]:
+        """Resolve the group id of a call and the clients bound to that group's database.
+
+        The returned clients are scoped to the call: the instance's driver and clients are never
+        reassigned, so concurrent calls for different groups can share one Graphiti instance and
+        one connection pool.
+        """
+        if group_id is None or group_id == get_default_group_id(self.driver.provider):
+            # if group_id is None, use the default group id by the provider
+            # and the preset database name will be used
+            group_id = get_default_group_id(self.driver.provider)
+        else:
+            validate_group_id(group_id)
+            if driver is None and group_id != self.driver._database:
+                # if group_id is provided, use it as the database name
+                driver = self.driver.clone(database=group_id)
+
+        if driver is None or driver is self.clients.driver:
+            return group_id, self.clients
+
+        return group_id, self.clients.model_copy(update={'driver': driver})
+
     @handle_multiple_group_ids
     async def retrieve_episodes(
         self,
@@ -627,6 +894,7 @@ class Graphiti:
         previous_episode_uuids: list[str] | None = None,
         edge_types: dict[str, type[BaseModel]] | None = None,
         edge_type_map: dict[tuple[str, str], list[str]] | None = None,
+        driver: GraphDriver | None = None,
     ) -> AddEpisodeResults:
         """
         Process an episode and update the graph.
@@ -661,6 +929,9 @@ class Graphiti:
         previous_episode_uuids : list[str] | None
             Optional.  list of episode uuids to use as the previous episodes. If this is not provided,
             the most recent episodes by created_at date will be used.
+        driver : GraphDriver | None
+            Optional. The driver to use for this call. If not provided, a driver bound to the
+            group's database is derived from the Graphiti driver without modifying it.
 
         Returns
         -------
@@ -675,7 +946,9 @@ class Graphiti:
         It is recommended to run this method as a background process, such as in a queue.
         It's important that each episode is added sequentially and awaited before adding
         the next one. For web applications, consider using FastAPI's background tasks
-        or a dedicated task queue like Celery for this purpose.
+        or a dedicated task queue like Celery for this purpose. To ingest a busy stream of
+        episodes for a single group with higher throughput, use `add_episode_stream`, which
+        overlaps the extraction of consecutive episodes while still resolving them in order.
 
         Example using FastAPI background tasks:
             @app.post("/add_episode")
@@ -689,16 +962,7 @@ class Graphiti:
         validate_entity_types(entity_types)
         validate_excluded_entity_types(excluded_entity_types, entity_types)
 
-        if group_id is None:
-            # if group_id is None, use the default group id by the provider
-            # and the preset database name will be used
-            group_id = get_default_group_id(self.driver.provider)
-        else:
-            validate_group_id(group_id)
-            if group_id != self.driver._database:
-                # if group_id is provided, use it as the database name
-                self.driver = self.driver.clone(database=group_id)
-                self.clients.driver = self.driver
+        group_id, clients = self._get_group_clients(group_id, driver)
 
         with self.tracer.start_span('add_episode') as span:
             try:
@@ -709,14 +973,15 @@ class Graphiti:
                         last_n=RELEVANT_SCHEMA_LIMIT,
                         group_ids=[group_id],
                         source=source,
+                        driver=clients.driver,
                     )
                     if previous_episode_uuids is None
-                    else await EpisodicNode.get_by_uuids(self.driver, previous_episode_uuids)
+                    else await EpisodicNode.get_by_uuids(clients.driver, previous_episode_uuids)
                 )
 
                 # Get or create episode
                 episode = (
-                    await EpisodicNode.get_by_uuid(self.driver, uuid)
+                    await EpisodicNode.get_by_uuid(clients.driver, uuid)
                     if uuid is not None
                     else EpisodicNode(
                         name=name,
@@ -737,92 +1002,246 @@ class Graphiti:
                     else {('Entity', 'Entity'): []}
                 )
 
-                # Extract and resolve nodes
-                extracted_nodes = await extract_nodes(
-                    self.clients, episode, previous_episodes, entity_types, excluded_entity_types
-                )
-
-                nodes, uuid_map, _ = await resolve_extracted_nodes(
-                    self.clients,
-                    extracted_nodes,
+                extracted_nodes, extracted_edges = await self._extract_episode(
+                    clients,
                     episode,
                     previous_episodes,
                     entity_types,
+                    excluded_entity_types,
+                    edge_type_map or edge_type_map_default,
+                    group_id,
+                    edge_types,
                 )
 
-                # Extract and resolve edges in parallel with attribute extraction
-                resolved_edges, invalidated_edges = await self._extract_and_resolve_edges(
+                results, invalidated_edges = await self._resolve_and_save_episode(
+                    clients,
                     episode,
-                    extracted_nodes,
                     previous_episodes,
+                    extracted_nodes,
+                    extracted_edges,
+                    entity_types,
                     edge_type_map or edge_type_map_default,
-                    group_id,
                     edge_types,
-                    nodes,
-                    uuid_map,
-                )
-
-                # Extract node attributes
-                hydrated_nodes = await extract_attributes_from_nodes(
-                    self.clients, nodes, episode, previous_episodes, entity_types
-                )
-
-                entity_edges = resolved_edges + invalidated_edges
-
-                # Process and save episode data
-                episodic_edges, episode = await self._process_episode_data(
-                    episode, hydrated_nodes, entity_edges, now
+                    update_communities,
+                    now,
                 )
 
-                # Update communities if requested
-                communities = []
-                community_edges = []
-                if update_communities:
-                    communities, community_edges = await semaphore_gather(
-                        *[
-                            update_community(self.driver, self.llm_client, self.embedder, node)
-                            for node in nodes
-                        ],
-                        max_coroutines=self.max_coroutines,
-                    )
-
                 end = time()
 
                 # Add span attributes
                 span.add_attributes(
                     {
-                        'episode.uuid': episode.uuid,
+                        'episode.uuid': results.episode.uuid,
                         'episode.source': source.value,
                         'episode.reference_time': reference_time.isoformat(),
                         'group_id': group_id,
-                        'node.count': len(hydrated_nodes),
-                        'edge.count': len(entity_edges),
+                        'node.count': len(results.nodes),
+                        'edge.count': len(results.edges),
                         'edge.invalidated_count': len(invalidated_edges),
                         'previous_episodes.count': len(previous_episodes),
                         'entity_types.count': len(entity_types) if entity_types else 0,
                         'edge_types.count': len(edge_types) if edge_types else 0,
                         'update_communities': update_communities,
-                        'communities.count': len(communities) if update_communities else 0,
+                        'communities.count': len(results.communities) if update_communities else 0,
                         'duration_ms': (end - start) * 1000,
                     }
                 )
 
                 logger.info(f'Completed add_episode in {(end - start) * 1000} ms')
 
-                return AddEpisodeResults(
-                    episode=episode,
-                    episodic_edges=episodic_edges,
-                    nodes=hydrated_nodes,
-                    edges=entity_edges,
-                    communities=communities,
-                    community_edges=community_edges,
-                )
+                return results
 
             except Exception as e:
                 span.set_status('error', str(e))
                 span.record_exception(e)
                 raise e
 
+    async def add_episode_stream(
+        self,
+        episodes: Iterable[RawEpisode] | AsyncIterable[RawEpisode],
+        group_id: str | None = None,
+        update_communities: bool = False,
+        entity_types: dict[str, type[BaseModel]] | None = None,
+        excluded_entity_types: list[str] | None = None,
+        edge_types: dict[str, type[BaseModel]] | None = None,
+        edge_type_map: dict[tuple[str, str], list[str]] | None = None,
+        extraction_lookahead: int = 1,
+        driver: GraphDriver | None = None,
+    ) -> AsyncIterator[AddEpisodeResults]:
+        """
+        Process a stream of consecutive episodes for a single group with pipelined extraction.
+
+        This has the same semantics as awaiting `add_episode` for each episode in turn, including
+        node and edge resolution and edge invalidation, but overlaps the stages of consecutive
+        episodes to increase throughput.
+
+        Parameters
+        ----------
+        episodes : Iterable[RawEpisode] | AsyncIterable[RawEpisode]
+            The episodes to add, in chronological order.
+        group_id : str | None
+            An id for the graph partition the episodes are a part of.
+        update_communities : bool
+            Optional. Whether to update communities with new node information
+        extraction_lookahead : int, optional
+            The number of episodes whose extraction may run ahead of the episode currently being
+            resolved. Defaults to 1. A value of 0 disables pipelining.
+        driver : GraphDriver | None
+            Optional. The driver to use for this call. If not provided, a driver bound to the
+            group's database is derived from the Graphiti driver without modifying it.
+
+        Yields
+        ------
+        AddEpisodeResults
+            The results of each episode, in the order the episodes were supplied, once the episode
+            has been written to the graph.
+
+        Notes
+        -----
+        Node and edge extraction for episode N+1 runs while episode N is being resolved against
+        the graph and persisted. Resolution, invalidation and persistence are always performed one
+        episode at a time and in order, so every episode is resolved against a graph that already
+        contains all the episodes before it.
+
+        Episodes that are still in the pipeline have not been written yet, so they are appended
+        to the previous-episode context retrieved from the graph for the episodes that follow them.
+        """
+        if extraction_lookahead < 0:
+            raise ValueError(
+                f'extraction_lookahead must be a non-negative integer, got {extraction_lookahead}'
+            )
+
+        validate_entity_types(entity_types)
+        validate_excluded_entity_types(excluded_entity_types, entity_types)
+
+        group_id, clients = self._get_group_clients(group_id, driver)
+
+        # Create default edge type map
+        edge_type_map_default = (
+            {('Entity', 'Entity'): list(edge_types.keys())}
+            if edge_types is not None
+            else {('Entity', 'Entity'): []}
+        )
+        resolved_edge_type_map = edge_type_map or edge_type_map_default
+
+        async def finish_episode(
+            episode: EpisodicNode,
+            previous_episodes: list[EpisodicNode],
+            now: datetime,
+            extraction: asyncio.Task,
+        ) -> AddEpisodeResults:
+            start = time()
+            with self.tracer.start_span('add_episode_stream.episode') as span:
+                try:
+                    extracted_nodes, extracted_edges = await extraction
+                    results, invalidated_edges = await self._resolve_and_save_episode(
+                        clients,
+                        episode,
+                        previous_episodes,
+                        extracted_nodes,
+                        extracted_edges,
+                        entity_types,
+                        resolved_edge_type_map,
+                        edge_types,
+                        update_communities,
+                        now,
+                    )
+                except Exception as e:
+                    span.set_status('error', str(e))
+                    span.record_exception(e)
+                    raise e
+
+                end = time()
+                span.add_attributes(
+                    {
+                        'episode.uuid': results.episode.uuid,
+                        'episode.source': episode.source.value,
+                        'group_id': group_id,
+                        'node.count': len(results.nodes),
+                        'edge.count': len(results.edges),
+                        'edge.invalidated_count': len(invalidated_edges),
+                        'previous_episodes.count': len(previous_episodes),
+                        'duration_ms': (end - start) * 1000,
+                    }
+                )
+
+            logger.info(f'Completed add_episode_stream episode in {(end - start) * 1000} ms')
+
+            return results
+
+        # Episodes whose extraction has been scheduled but which have not been written yet
+        in_flight: deque[tuple[EpisodicNode, list[EpisodicNode], datetime, asyncio.Task]] = deque()
+        try:
+            async for chunk in iter_episode_chunks(episodes, chunk_size=1):
+                raw_episode = chunk[0]
+                now = utc_now()
+                episode = (
+                    await EpisodicNode.get_by_uuid(clients.driver, raw_episode.uuid)
+                    if raw_episode.uuid is not None
+                    else EpisodicNode(
+                        name=raw_episode.name,
+                        group_id=group_id,
+                        labels=[],
+                        source=raw_episode.source,
+                        content=raw_episode.content,
+                        source_description=raw_episode.source_description,
+                        created_at=now,
+                        valid_at=raw_episode.reference_time,
+                    )
+                )
+
+                previous_episodes = await self._retrieve_pipelined_previous_episodes(
+                    clients, episode, group_id, [pending[0] for pending in in_flight]
+                )
+
+                extraction = asyncio.create_task(
+                    self._extract_episode(
+                        clients,
+                        episode,
+                        previous_episodes,
+                        entity_types,
+                        excluded_entity_types,
+                        resolved_edge_type_map,
+                        group_id,
+                        edge_types,
+                    )
+                )
+                in_flight.append((episode, previous_episodes, now, extraction))
+
+                while len(in_flight) > extraction_lookahead:
+                    yield await finish_episode(*in_flight.popleft())
+
+            while in_flight:
+                yield await finish_episode(*in_flight.popleft())
+        finally:
+            for _, _, _, extraction in in_flight:
+                extraction.cancel()
+
+    async def _retrieve_pipelined_previous_episodes(
+        self,
+        clients: GraphitiClients,
+        episode: EpisodicNode,
+        group_id: str,
+        pending_episodes: list[EpisodicNode],
+    ) -> list[EpisodicNode]:
+        """Retrieve previous episodes, including those still in the pipeline and not yet saved."""
+        previous_episodes = await self.retrieve_episodes(
+            episode.valid_at,
+            last_n=RELEVANT_SCHEMA_LIMIT,
+            group_ids=[group_id],
+            source=episode.source,
+            driver=clients.driver,
+        )
+
+        saved_uuids = {previous_episode.uuid for previous_episode in previous_episodes}
+        previous_episodes += [
+            pending_episode
+            for pending_episode in pending_episodes
+            if pending_episode.uuid not in saved_uuids and pending_episode.source == episode.source
+        ]
+
+        return previous_episodes[-RELEVANT_SCHEMA_LIMIT:]
+
     async def add_episode_bulk(
         self,
         bulk_episodes: list[RawEpisode],
@@ -831,6 +1250,7 @@ class Graphiti:
         excluded_entity_types: list[str] | None = None,
         edge_types: dict[str, type[BaseModel]] | None = None,
         edge_type_map: dict[tuple[str, str], list[str]] | None = None,
+        driver: GraphDriver | None = None,
     ) -> AddBulkEpisodeResults:
         """
         Process multiple episodes in bulk and update the graph.
@@ -844,6 +1264,9 @@ class Graphiti:
             A list of RawEpisode objects to be processed and added to the graph.
         group_id : str | None
             An id for the graph partition the episode is a part of.
+        driver : GraphDriver | None
+            Optional. The driver to use for this call. If not provided, a driver bound to the
+            group's database is derived from the Graphiti driver without modifying it.
 
         Returns
         -------
@@ -875,15 +1298,7 @@ class Graphiti:
                 start = time()
                 now = utc_now()
 
-                # if group_id is None, use the default group id by the provider
-                if group_id is None:
-                    group_id = get_default_group_id(self.driver.provider)
-                else:
-                    validate_group_id(group_id)
-                    if group_id != self.driver._database:
-                        # if group_id is provided, use it as the database name
-                        self.driver = self.driver.clone(database=group_id)
-                        self.clients.driver = self.driver
+                group_id, clients = self._get_group_clients(group_id, driver)
 
                 # Create default edge type map
                 edge_type_map_default = (
@@ -892,94 +1307,32 @@ class Graphiti:
                     else {('Entity', 'Entity'): []}
                 )
 
-                episodes = [
-                    await EpisodicNode.get_by_uuid(self.driver, episode.uuid)
-                    if episode.uuid is not None
-                    else EpisodicNode(
-                        name=episode.name,
-                        labels=[],
-                        source=episode.source,
-                        content=episode.content,
-                        source_description=episode.source_description,
-                        group_id=group_id,
-                        created_at=now,
-                        valid_at=episode.reference_time,
-                    )
-                    for episode in bulk_episodes
-                ]
-
-                # Save all episodes
-                await add_nodes_and_edges_bulk(
-                    driver=self.driver,
-                    episodic_nodes=episodes,
-                    episodic_edges=[],
-                    entity_nodes=[],
-                    entity_edges=[],
-                    embedder=self.embedder,
-                )
-
-                # Get previous episode context for each episode
-                episode_context = await retrieve_previous_episodes_bulk(self.driver, episodes)
-
-                # Extract and dedupe nodes and edges
                 (
-                    nodes_by_episode,
-                    uuid_map,
-                    extracted_edges_bulk,
-                ) = await self._extract_and_dedupe_nodes_bulk(
+                    episodes,
                     episode_context,
+                    extracted_nodes_bulk,
+                    extracted_edges_bulk,
+                ) = await self._extract_bulk_chunk(
+                    clients,
+                    bulk_episodes,
+                    group_id,
+                    now,
                     edge_type_map or edge_type_map_default,
                     edge_types,
                     entity_types,
                     excluded_entity_types,
                 )
 
-                # Create Episodic Edges
-                episodic_edges: list[EpisodicEdge] = []
-                for episode_uuid, nodes in nodes_by_episode.items():
-                    episodic_edges.extend(build_episodic_edges(nodes, episode_uuid, now))
-
-                # Re-map edge pointers and dedupe edges
-                extracted_edges_bulk_updated: list[list[EntityEdge]] = [
-                    resolve_edge_pointers(edges, uuid_map) for edges in extracted_edges_bulk
-                ]
-
-                edges_by_episode = await dedupe_edges_bulk(
-                    self.clients,
-                    extracted_edges_bulk_updated,
+                results = await self._resolve_and_save_bulk_chunk(
+                    clients,
+                    episodes,
                     episode_context,
-                    [],
-                    edge_types or {},
+                    extracted_nodes_bulk,
+                    extracted_edges_bulk,
+                    now,
                     edge_type_map or edge_type_map_default,
-                )
-
-                # Resolve nodes and edges against the existing graph
-                (
-                    final_hydrated_nodes,
-                    resolved_edges,
-                    invalidated_edges,
-                    final_uuid_map,
-                ) = await self._resolve_nodes_and_edges_bulk(
-                    nodes_by_episode,
-                    edges_by_episode,
-                    episode_context,
-                    entity_types,
                     edge_types,
-                    edge_type_map or edge_type_map_default,
-                    episodes,
-                )
-
-                # Resolved pointers for episodic edges
-                resolved_episodic_edges = resolve_edge_pointers(episodic_edges, final_uuid_map)
-
-                # save data to KG
-                await add_nodes_and_edges_bulk(
-                    self.driver,
-                    episodes,
-                    resolved_episodic_edges,
-                    final_hydrated_nodes,
-                    resolved_edges + invalidated_edges,
-                    self.embedder,
+                    entity_types,
                 )
 
                 end = time()
@@ -988,31 +1341,177 @@ class Graphiti:
                 bulk_span.add_attributes(
                     {
                         'group_id': group_id,
-                        'node.count': len(final_hydrated_nodes),
-                        'edge.count': len(resolved_edges + invalidated_edges),
+                        'node.count': len(results.nodes),
+                        'edge.count': len(results.edges),
                         'duration_ms': (end - start) * 1000,
                     }
                 )
 
                 logger.info(f'Completed add_episode_bulk in {(end - start) * 1000} ms')
 
-                return AddBulkEpisodeResults(
-                    episodes=episodes,
-                    episodic_edges=resolved_episodic_edges,
-                    nodes=final_hydrated_nodes,
-                    edges=resolved_edges + invalidated_edges,
-                    communities=[],
-                    community_edges=[],
-                )
+                return results
 
             except Exception as e:
                 bulk_span.set_status('error', str(e))
                 bulk_span.record_exception(e)
                 raise e
 
+    async def add_episode_bulk_stream(
+        self,
+        bulk_episodes: Iterable[RawEpisode] | AsyncIterable[RawEpisode],
+        group_id: str | None = None,
+        entity_types: dict[str, type[BaseModel]] | None = None,
+        excluded_entity_types: list[str] | None = None,
+        edge_types: dict[str, type[BaseModel]] | None = None,
+        edge_type_map: dict[tuple[str, str], list[str]] | None = None,
+        chunk_size: int = CHUNK_SIZE,
+        driver: GraphDriver | None = None,
+    ) -> AsyncIterator[AddBulkEpisodeChunkResults]:
+        """
+        Stream episodes into the graph in fixed-size chunks.
+
+        This is the streaming counterpart of `add_episode_bulk`. Episodes are consumed lazily from
+        any iterable or async iterable, so very large backfills never need to be materialized as a
+        single list.
+
+        Parameters
+        ----------
+        bulk_episodes : Iterable[RawEpisode] | AsyncIterable[RawEpisode]
+            The source of episodes to ingest. It is consumed one chunk at a time.
+        group_id : str | None
+            An id for the graph partition the episodes are a part of.
+        chunk_size : int, optional
+            The number of episodes processed per chunk. Defaults to CHUNK_SIZE.
+        driver : GraphDriver | None
+            Optional. The driver to use for this call. If not provided, a driver bound to the
+            group's database is derived from the Graphiti driver without modifying it.
+
+        Yields
+        ------
+        AddBulkEpisodeChunkResults
+            The results for each chunk once it has been written to the graph, along with the chunk
+            index and the running number of episodes processed.
+
+        Notes
+        -----
+        The pipeline is two stages deep: LLM extraction for chunk N+1 runs while chunk N is being
+        resolved against the graph and written. At most two chunks are held in memory at once, and
+        LLM fan-out within each stage is bounded by `max_coroutines`.
+
+        Each chunk has the same semantics as a call to `add_episode_bulk`; in particular, no edge
+        invalidation or date extraction is performed.
+
+        Example:
+            async for progress in graphiti.add_episode_bulk_stream(read_messages(), chunk_size=50):
+                logger.info(f'{progress.episodes_processed} episodes ingested')
+        """
+        group_id, clients = self._get_group_clients(group_id, driver)
+
+        # Create default edge type map
+        edge_type_map_default = (
+            {('Entity', 'Entity'): list(edge_types.keys())}
+            if edge_types is not None
+            else {('Entity', 'Entity'): []}
+        )
+        resolved_edge_type_map = edge_type_map or edge_type_map_default
+
+        async def process_chunk(
+            chunk: list[RawEpisode],
+        ) -> tuple[datetime, float, BulkChunkExtraction]:
+            start = time()
+            now = utc_now()
+            extraction = await self._extract_bulk_chunk(
+                clients,
+                chunk,
+                group_id,
+                now,
+                resolved_edge_type_map,
+                edge_types,
+                entity_types,
+                excluded_entity_types,
+            )
+            return now, start, extraction
+
+        chunk_index = 0
+        episodes_processed = 0
+
+        async def finish_chunk(
+            now: datetime, start: float, extraction: BulkChunkExtraction
+        ) -> AddBulkEpisodeChunkResults:
+            nonlocal chunk_index, episodes_processed
+
+            with self.tracer.start_span('add_episode_bulk_stream.chunk') as chunk_span:
+                try:
+                    results = await self._resolve_and_save_bulk_chunk(
+                        clients,
+                        *extraction,
+                        now,
+                        resolved_edge_type_map,
+                        edge_types,
+                        entity_types,
+                    )
+                except Exception as e:
+                    chunk_span.set_status('error', str(e))
+                    chunk_span.record_exception(e)
+                    raise e
+
+                duration_ms = (time() - start) * 1000
+                episodes_processed += len(results.episodes)
+                chunk_span.add_attributes(
+                    {
+                        'group_id': group_id,
+                        'chunk.index': chunk_index,
+                        'episode.count': len(results.episodes),
+                        'node.count': len(results.nodes),
+                        'edge.count': len(results.edges),
+                        'duration_ms': duration_ms,
+                    }
+                )
+
+            logger.info(
+                f'Completed add_episode_bulk_stream chunk {chunk_index} '
+                f'({episodes_processed} episodes processed) in {duration_ms} ms'
+            )
+
+            chunk_results = AddBulkEpisodeChunkResults(
+                **dict(results),
+                chunk_index=chunk_index,
+                episodes_processed=episodes_processed,
+                duration_ms=duration_ms,
+            )
+            chunk_index += 1
+            return chunk_results
+
+        pending: asyncio.Task | None = None
+        try:
+            async for chunk in iter_episode_chunks(bulk_episodes, chunk_size):
+                if pending is None:
+                    pending = asyncio.create_task(process_chunk(chunk))
+                    continue
+
+                # Wait for extraction of the previous chunk so that its episodes are saved before
+                # the next chunk retrieves its previous-episode context.
+                extracted = await pending
+                pending = asyncio.create_task(process_chunk(chunk))
+                yield await finish_chunk(*extracted)
+
+            if pending is not None:
+                extracted = await pending
+                pending = None
+                yield await finish_chunk(*extracted)
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+
     @handle_multiple_group_ids
     async def build_communities(
-        self, group_ids: list[str] | None = None, driver: GraphDriver | None = None
+        self,
+        group_ids: list[str] | None = None,
+        driver: GraphDriver | None = None,
+        algorithm: CommunityDetectionAlgorithm = CommunityDetectionAlgorithm.label_propagation,
+        resolution: float = 1.0,
+        max_community_size: int | None = None,
+        incremental: bool = False,
     ) -> tuple[list[CommunityNode], list[CommunityEdge]]:
         """
         Use a community clustering algorithm to find communities of nodes. Create community nodes summarising
@@ -1020,30 +1519,46 @@ class Graphiti:
         ----------
         group_ids : list[str] | None
             Optional. Create communities only for the listed group_ids. If blank the entire graph will be used.
+        algorithm : CommunityDetectionAlgorithm
+            Optional. The clustering algorithm. Louvain yields smaller, more balanced communities
+            than label propagation on dense graphs.
+        resolution : float
+            Optional. Louvain resolution, higher values produce smaller communities.
+        max_community_size : int | None
+            Optional. The maximum number of entities in a Louvain community.
+        incremental : bool
+            Optional. Keep existing communities whose members are unchanged or nearly unchanged and
+            only summarize the changed clusters, instead of rebuilding every community. Only the
+            new communities and member edges are returned.
         """
         if driver is None:
             driver = self.clients.driver
 
-        # Clear existing communities
-        await remove_communities(driver)
+        if incremental:
+            community_nodes, community_edges = await build_communities_incremental(
+                driver,
+                self.llm_client,
+                group_ids,
+                algorithm=algorithm,
+                resolution=resolution,
+                max_community_size=max_community_size,
+            )
+        else:
+            # Clear existing communities
+            await remove_communities(driver, group_ids)
 
-        community_nodes, community_edges = await build_communities(
-            driver, self.llm_client, group_ids
-        )
+            community_nodes, community_edges = await build_communities(
+                driver,
+                self.llm_client,
+                group_ids,
+                algorithm=algorithm,
+                resolution=resolution,
+                max_community_size=max_community_size,
+            )
 
-        await semaphore_gather(
-            *[node.generate_name_embedding(self.embedder) for node in community_nodes],
-            max_coroutines=self.max_coroutines,
-        )
+        await add_communities_bulk(driver, community_nodes, community_edges, self.embedder)
 
-        await semaphore_gather(
-            *[node.save(driver) for node in community_nodes],
-            max_coroutines=self.max_coroutines,
-        )
-        await semaphore_gather(
-            *[edge.save(driver) for edge in community_edges],
-            max_coroutines=self.max_coroutines,
-        )
+        self._invalidate_search_cache(group_ids)
 
         return community_nodes, community_edges
 
@@ -1152,23 +1667,47 @@ class Graphiti:
             driver=driver,
         )
 
-    async def get_nodes_and_edges_by_episode(self, episode_uuids: list[str]) -> SearchResults:
-        episodes = await EpisodicNode.get_by_uuids(self.driver, episode_uuids)
+    async def get_nodes_and_edges_by_episode(
+        self,
+        episode_uuids: list[str],
+        group_id: str | None = None,
+        driver: GraphDriver | None = None,
+    ) -> SearchResults:
+        """
+        Get the nodes and edges extracted from the given episodes.
+
+        On FalkorDB, group_id selects the graph the episodes were added to.
+        """
+        _, clients = self._get_group_clients(group_id, driver)
+        driver = clients.driver
+
+        episodes = await EpisodicNode.get_by_uuids(driver, episode_uuids)
 
         edges_list = await semaphore_gather(
-            *[EntityEdge.get_by_uuids(self.driver, episode.entity_edges) for episode in episodes],
+            *[EntityEdge.get_by_uuids(driver, episode.entity_edges) for episode in episodes],
             max_coroutines=self.max_coroutines,
         )
 
         edges: list[EntityEdge] = [edge for lst in edges_list for edge in lst]
 
-        nodes = await get_mentioned_nodes(self.driver, episodes)
+        nodes = await get_mentioned_nodes(driver, episodes)
 
         return SearchResults(edges=edges, nodes=nodes)
 
     async def add_triplet(
-        self, source_node: EntityNode, edge: EntityEdge, target_node: EntityNode
+        self,
+        source_node: EntityNode,
+        edge: EntityEdge,
+        target_node: EntityNode,
+        driver: GraphDriver | None = None,
     ) -> AddTripletResults:
+        """
+        Add a triplet to the graph, resolving its nodes and edge against the existing graph.
+
+        On FalkorDB the triplet is written to the graph of the edge's group.
+        """
+        _, clients = self._get_group_clients(edge.group_id, driver)
+
         if source_node.name_embedding is None:
             await source_node.generate_name_embedding(self.embedder)
         if target_node.name_embedding is None:
@@ -1177,19 +1716,19 @@ class Graphiti:
             await edge.generate_embedding(self.embedder)
 
         nodes, uuid_map, _ = await resolve_extracted_nodes(
-            self.clients,
+            clients,
             [source_node, target_node],
         )
 
         updated_edge = resolve_edge_pointers([edge], uuid_map)[0]
 
         valid_edges = await EntityEdge.get_between_nodes(
-            self.driver, edge.source_node_uuid, edge.target_node_uuid
+            clients.driver, edge.source_node_uuid, edge.target_node_uuid
         )
 
         related_edges = (
             await search(
-                self.clients,
+                clients,
                 updated_edge.fact,
                 group_ids=[updated_edge.group_id],
                 config=EDGE_HYBRID_SEARCH_RRF,
@@ -1198,7 +1737,7 @@ class Graphiti:
         ).edges
         existing_edges = (
             await search(
-                self.clients,
+                clients,
                 updated_edge.fact,
                 group_ids=[updated_edge.group_id],
                 config=EDGE_HYBRID_SEARCH_RRF,
@@ -1229,35 +1768,82 @@ class Graphiti:
         await create_entity_edge_embeddings(self.embedder, edges)
         await create_entity_node_embeddings(self.embedder, nodes)
 
-        await add_nodes_and_edges_bulk(self.driver, [], [], nodes, edges, self.embedder)
+        await add_nodes_and_edges_bulk(clients.driver, [], [], nodes, edges, self.embedder)
+        self._invalidate_search_cache([edge.group_id])
         return AddTripletResults(edges=edges, nodes=nodes)
 
-    async def remove_episode(self, episode_uuid: str):
+    async def remove_episode(
+        self,
+        episode_uuid: str,
+        group_id: str | None = None,
+        driver: GraphDriver | None = None,
+    ):
+        """
+        Remove an episode along with the edges and nodes that only it created.
+
+        On FalkorDB, group_id selects the graph the episode was added to.
+        """
+        _, clients = self._get_group_clients(group_id, driver)
+        driver = clients.driver
+
         # Find the episode to be deleted
-        episode = await EpisodicNode.get_by_uuid(self.driver, episode_uuid)
+        episode = await EpisodicNode.get_by_uuid(driver, episode_uuid)
 
         # Find edges mentioned by the episode
-        edges = await EntityEdge.get_by_uuids(self.driver, episode.entity_edges)
+        edges = await EntityEdge.get_by_uuids(driver, episode.entity_edges)
 
         # We should only delete edges created by the episode
         edges_to_delete: list[EntityEdge] = []
+        edges_to_update: list[EntityEdge] = []
         for edge in edges:
             if edge.episodes and edge.episodes[0] == episode.uuid:
                 edges_to_delete.append(edge)
+            elif episode.uuid in edge.episodes:
+                edges_to_update.append(edge)
 
         # Find nodes mentioned by the episode
-        nodes = await get_mentioned_nodes(self.driver, [episode])
+        nodes = await get_mentioned_nodes(driver, [episode])
+        # Nodes without a maintained mention count fall back to counting their MENTIONS edges
+        uncounted_uuids = [node.uuid for node in nodes if node.mention_count is None]
+        mention_counts: dict[str, int] = {}
+        if uncounted_uuids:
+            query: LiteralString = """
+                UNWIND $uuids AS uuid
+                MATCH (e:Episodic)-[:MENTIONS]->(n:Entity {uuid: uuid})
+                RETURN n.uuid AS uuid, count(*) AS episode_count
+            """
+            records, _, _ = await driver.execute_query(query, uuids=uncounted_uuids, routing_='r')
+            mention_counts = {record['uuid']: record['episode_count'] for record in records}
+
         # We should delete all nodes that are only mentioned in the deleted episode
         nodes_to_delete: list[EntityNode] = []
+        nodes_to_keep: list[EntityNode] = []
         for node in nodes:
-            query: LiteralString = 'MATCH (e:Episodic)-[:MENTIONS]->(n:Entity {uuid: $uuid}) RETURN count(*) AS episode_count'
-            records, _, _ = await self.driver.execute_query(query, uuid=node.uuid, routing_='r')
-
-            for record in records:
-                if record['episode_count'] == 1:
-                    nodes_to_delete.append(node)
-
-        await Edge.delete_by_uuids(self.driver, [edge.uuid for edge in edges_to_delete])
-        await Node.delete_by_uuids(self.driver, [node.uuid for node in nodes_to_delete])
+            mention_count = (
+                node.mention_count
+                if node.mention_count is not None
+                else mention_counts.get(node.uuid, 0)
+            )
+            if mention_count <= 1:
+                nodes_to_delete.append(node)
+            else:
+                nodes_to_keep.append(node)
+
+        await Edge.delete_by_uuids(driver, [edge.uuid for edge in edges_to_delete])
+        await Node.delete_by_uuids(driver, [node.uuid for node in nodes_to_delete])
+
+        await episode.delete(driver)
+
+        # Keep the denormalized mention counts of surviving edges and nodes in step
+        for edge in edges_to_update:
+            edge.episodes = [uuid for uuid in edge.episodes if uuid != episode.uuid]
+        await semaphore_gather(*[edge.load_fact_embedding(driver) for edge in edges_to_update])
+        await semaphore_gather(*[edge.save(driver) for edge in edges_to_update])
+
+        if nodes_to_keep and driver.provider != GraphProvider.KUZU:
+            await driver.execute_query(
+                ENTITY_MENTION_COUNT_DECREMENT,
+                node_uuids=[node.uuid for node in nodes_to_keep],
+            )
 
-        await episode.delete(self.driver)
+        self._invalidate_search_cache([episode.group_id])
@@ -20,6 +20,7 @@ from graphiti_core.cross_encoder import CrossEncoderClient
 from graphiti_core.driver.driver import GraphDriver
 from graphiti_core.embedder import EmbedderClient
 from graphiti_core.llm_client import LLMClient
+from graphiti_core.search.search_cache import SearchCache
 from graphiti_core.tracer import Tracer
 
 
@@ -29,5 +30,6 @@ class GraphitiClients(BaseModel):
     embedder: EmbedderClient
     cross_encoder: CrossEncoderClient
     tracer: Tracer
+    search_cache: SearchCache | None = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
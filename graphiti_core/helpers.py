@@ -15,11 +15,12 @@ limitations under the License.
 """
 
 import asyncio
+import base64
 import os
 import re
 from collections.abc import Coroutine
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 import numpy as np
 from dotenv import load_dotenv
@@ -102,6 +103,78 @@ def normalize_l2(embedding: list[float]) -> NDArray:
     return np.where(norm == 0, embedding_array, embedding_array / norm)
 
 
+# Little-endian dtypes of the embedding blobs, keyed by the prefix stored in front of them
+EMBEDDING_BLOB_DTYPES: dict[str, np.dtype] = {'f32': np.dtype('<f4'), 'f16': np.dtype('<f2')}
+EMBEDDING_BLOB_PREFIXES = {'float32': 'f32', 'float16': 'f16'}
+
+
+def encode_embedding(
+    embedding: list[float], dtype: Literal['float32', 'float16'] = 'float32'
+) -> str:
+    """Encode an embedding as a prefixed base64 blob, for stores without a vector type."""
+    prefix = EMBEDDING_BLOB_PREFIXES[dtype]
+    blob = np.asarray(embedding, dtype=EMBEDDING_BLOB_DTYPES[prefix]).tobytes()
+    return f'{prefix}:{base64.b64encode(blob).decode("ascii")}'
+
+
+def _embedding_blob_dtype(value: str) -> np.dtype | None:
+    return EMBEDDING_BLOB_DTYPES.get(value[:3]) if value[3:4] == ':' else None
+
+
+def decode_embedding(value: str | list[float] | None) -> list[float] | None:
+    """Decode an embedding stored by encode_embedding, or as comma-joined floats."""
+    if value is None or isinstance(value, list):
+        return value
+    if not value:
+        return None
+
+    dtype = _embedding_blob_dtype(value)
+    if dtype is None:
+        return [float(x) for x in value.split(',')]
+    return np.frombuffer(base64.b64decode(value[4:]), dtype=dtype).astype(np.float32).tolist()
+
+
+def decode_embedding_matrix(
+    values: list[str | list[float] | None], dim: int
+) -> tuple[NDArray, NDArray]:
+    """Decode stored embeddings of dimension dim into the rows of one float32 matrix.
+
+    Blobs of the same dtype are decoded with a single np.frombuffer call. Returns the matrix and
+    the indices of the values its rows belong to; empty values and other dimensions are skipped.
+    """
+    blobs: dict[str, tuple[list[int], list[bytes]]] = {}
+    other_indices: list[int] = []
+    other_rows: list[list[float]] = []
+    for i, value in enumerate(values):
+        if not value:
+            continue
+        dtype = _embedding_blob_dtype(value) if isinstance(value, str) else None
+        if dtype is None:
+            row = decode_embedding(value)
+            if row is not None and len(row) == dim:
+                other_indices.append(i)
+                other_rows.append(row)
+            continue
+
+        blob = base64.b64decode(value[4:])  # type: ignore[index]
+        if len(blob) == dim * dtype.itemsize:
+            indices, chunks = blobs.setdefault(value[:3], ([], []))  # type: ignore[index]
+            indices.append(i)
+            chunks.append(blob)
+
+    indices = list(other_indices)
+    matrices = [np.asarray(other_rows, dtype=np.float32).reshape(-1, dim)]
+    for prefix, (blob_indices, chunks) in blobs.items():
+        indices.extend(blob_indices)
+        matrices.append(
+            np.frombuffer(b''.join(chunks), dtype=EMBEDDING_BLOB_DTYPES[prefix])
+            .reshape(-1, dim)
+            .astype(np.float32)
+        )
+
+    return np.concatenate(matrices), np.asarray(indices, dtype=np.int64)
+
+
 # Use this instead of asyncio.gather() to bound coroutines
 async def semaphore_gather(
     *coroutines: Coroutine,
@@ -27,6 +27,25 @@ EPISODIC_EDGE_SAVE = """
 """
 
 
+def get_episodic_edge_save_query(provider: GraphProvider) -> str:
+    # Kuzu has no mention_count column, its mention counts are aggregated at query time
+    if provider == GraphProvider.KUZU:
+        return EPISODIC_EDGE_SAVE
+
+    # A new MENTIONS edge increments the mention count of its entity. Entities saved before
+    # the count was maintained keep a null count until they are backfilled.
+    return """
+        MATCH (episode:Episodic {uuid: $episode_uuid})
+        MATCH (node:Entity {uuid: $entity_uuid})
+        MERGE (episode)-[e:MENTIONS {uuid: $uuid}]->(node)
+        ON CREATE SET node.mention_count = node.mention_count + 1
+        SET
+            e.group_id = $group_id,
+            e.created_at = $created_at
+        RETURN e.uuid AS uuid
+    """
+
+
 def get_episodic_edge_save_bulk_query(provider: GraphProvider) -> str:
     if provider == GraphProvider.KUZU:
         return """
@@ -44,6 +63,7 @@ def get_episodic_edge_save_bulk_query(provider: GraphProvider) -> str:
         MATCH (episode:Episodic {uuid: edge.source_node_uuid})
         MATCH (node:Entity {uuid: edge.target_node_uuid})
         MERGE (episode)-[e:MENTIONS {uuid: edge.uuid}]->(node)
+        ON CREATE SET node.mention_count = node.mention_count + 1
         SET
             e.group_id = edge.group_id,
             e.created_at = edge.created_at
@@ -77,7 +97,7 @@ def get_entity_edge_save_query(provider: GraphProvider, has_aoss: bool = False)
                 MATCH (target:Entity {uuid: $edge_data.target_uuid})
                 MERGE (source)-[e:RELATES_TO {uuid: $edge_data.uuid}]->(target)
                 SET e = removeKeyFromMap(removeKeyFromMap($edge_data, "fact_embedding"), "episodes")
-                SET e.fact_embedding = join([x IN coalesce($edge_data.fact_embedding, []) | toString(x) ], ",")
+                SET e.fact_embedding = coalesce($edge_data.fact_embedding, "")
                 SET e.episodes = join($edge_data.episodes, ",")
                 RETURN $edge_data.uuid AS uuid
             """
@@ -141,7 +161,7 @@ def get_entity_edge_save_bulk_query(provider: GraphProvider, has_aoss: bool = Fa
                 MATCH (target:Entity {uuid: edge.target_node_uuid})
                 MERGE (source)-[r:RELATES_TO {uuid: edge.uuid}]->(target)
                 SET r = removeKeyFromMap(removeKeyFromMap(edge, "fact_embedding"), "episodes")
-                SET r.fact_embedding = join([x IN coalesce(edge.fact_embedding, []) | toString(x) ], ",")
+                SET r.fact_embedding = coalesce(edge.fact_embedding, "")
                 SET r.episodes = join(edge.episodes, ",")
                 RETURN edge.uuid AS uuid
             """
@@ -271,6 +291,53 @@ def get_community_edge_save_query(provider: GraphProvider) -> str:
             """
 
 
+def get_community_edge_save_bulk_query(provider: GraphProvider) -> str:
+    match provider:
+        case GraphProvider.FALKORDB:
+            return """
+                UNWIND $community_edges AS edge
+                MATCH (community:Community {uuid: edge.source_node_uuid})
+                MATCH (node {uuid: edge.target_node_uuid})
+                MERGE (community)-[e:HAS_MEMBER {uuid: edge.uuid}]->(node)
+                SET e = {uuid: edge.uuid, group_id: edge.group_id, created_at: edge.created_at}
+                RETURN e.uuid AS uuid
+            """
+        case GraphProvider.NEPTUNE:
+            return """
+                UNWIND $community_edges AS edge
+                MATCH (community:Community {uuid: edge.source_node_uuid})
+                MATCH (node {uuid: edge.target_node_uuid})
+                WHERE node:Entity OR node:Community
+                MERGE (community)-[r:HAS_MEMBER {uuid: edge.uuid}]->(node)
+                SET r.uuid= edge.uuid
+                SET r.group_id= edge.group_id
+                SET r.created_at= edge.created_at
+                RETURN r.uuid AS uuid
+            """
+        case GraphProvider.KUZU:
+            # COPY only inserts, so the edges must not exist yet and their members must be entities
+            return """
+                COPY HAS_MEMBER FROM (
+                    UNWIND $community_edges AS edge
+                    RETURN
+                        edge.source_node_uuid,
+                        edge.target_node_uuid,
+                        edge.uuid,
+                        edge.group_id,
+                        edge.created_at
+                ) (from='Community', to='Entity')
+            """
+        case _:  # Neo4j
+            return """
+                UNWIND $community_edges AS edge
+                MATCH (community:Community {uuid: edge.source_node_uuid})
+                MATCH (node:Entity | Community {uuid: edge.target_node_uuid})
+                MERGE (community)-[e:HAS_MEMBER {uuid: edge.uuid}]->(node)
+                SET e = {uuid: edge.uuid, group_id: edge.group_id, created_at: edge.created_at}
+                RETURN e.uuid AS uuid
+            """
+
+
 COMMUNITY_EDGE_RETURN = """
     e.uuid AS uuid,
     e.group_id AS group_id,
@@ -131,8 +131,11 @@ def get_entity_node_save_query(provider: GraphProvider, labels: str, has_aoss: b
         case GraphProvider.FALKORDB:
             return f"""
                 MERGE (n:Entity {{uuid: $entity_data.uuid}})
+                ON CREATE SET n.mention_count = 0
+                WITH n, n.mention_count AS mention_count
                 SET n:{labels}
                 SET n = $entity_data
+                SET n.mention_count = mention_count
                 SET n.name_embedding = vecf32($entity_data.name_embedding)
                 RETURN n.uuid AS uuid
             """
@@ -156,9 +159,12 @@ def get_entity_node_save_query(provider: GraphProvider, labels: str, has_aoss: b
                 label_subquery += f' SET n:{label}\n'
             return f"""
                 MERGE (n:Entity {{uuid: $entity_data.uuid}})
+                ON CREATE SET n.mention_count = 0
+                WITH n, n.mention_count AS mention_count
                 {label_subquery}
                 SET n = removeKeyFromMap(removeKeyFromMap($entity_data, "labels"), "name_embedding")
-                SET n.name_embedding = join([x IN coalesce($entity_data.name_embedding, []) | toString(x) ], ",")
+                SET n.mention_count = mention_count
+                SET n.name_embedding = coalesce($entity_data.name_embedding, "")
                 RETURN n.uuid AS uuid
             """
         case _:
@@ -170,8 +176,11 @@ def get_entity_node_save_query(provider: GraphProvider, labels: str, has_aoss: b
             return (
                 f"""
                 MERGE (n:Entity {{uuid: $entity_data.uuid}})
+                ON CREATE SET n.mention_count = 0
+                WITH n, n.mention_count AS mention_count
                 SET n:{labels}
                 SET n = $entity_data
+                SET n.mention_count = mention_count
                 """
                 + save_embedding_query
                 + """
@@ -193,8 +202,11 @@ def get_entity_node_save_bulk_query(
                             f"""
                             UNWIND $nodes AS node
                             MERGE (n:Entity {{uuid: node.uuid}})
+                            ON CREATE SET n.mention_count = 0
+                            WITH n, node, n.mention_count AS mention_count
                             SET n:{label}
                             SET n = node
+                            SET n.mention_count = mention_count
                             WITH n, node
                             SET n.name_embedding = vecf32(node.name_embedding)
                             RETURN n.uuid AS uuid
@@ -213,9 +225,12 @@ def get_entity_node_save_bulk_query(
                     f"""
                         UNWIND $nodes AS node
                         MERGE (n:Entity {{uuid: node.uuid}})
+                        ON CREATE SET n.mention_count = 0
+                        WITH n, node, n.mention_count AS mention_count
                         {labels}
                         SET n = removeKeyFromMap(removeKeyFromMap(node, "labels"), "name_embedding")
-                        SET n.name_embedding = join([x IN coalesce(node.name_embedding, []) | toString(x) ], ",")
+                        SET n.mention_count = mention_count
+                        SET n.name_embedding = coalesce(node.name_embedding, "")
                         RETURN n.uuid AS uuid
                     """
                 )
@@ -243,8 +258,11 @@ def get_entity_node_save_bulk_query(
                 """
                     UNWIND $nodes AS node
                     MERGE (n:Entity {uuid: node.uuid})
+                    ON CREATE SET n.mention_count = 0
+                    WITH n, node, n.mention_count AS mention_count
                     SET n:$(node.labels)
                     SET n = node
+                    SET n.mention_count = mention_count
                     """
                 + save_embedding_query
                 + """
@@ -253,6 +271,31 @@ def get_entity_node_save_bulk_query(
             )
 
 
+# The mention_count of an entity is set to 0 when it is created, kept when it is saved again,
+# incremented when a MENTIONS edge to it is created and decremented when an episode mentioning it
+# is removed. Kuzu has a fixed schema without this column, so its mention counts are aggregated
+# at query time.
+
+# Recomputes the mention_count of the given entities from their MENTIONS edges, used to backfill
+# entities that were saved before the count was maintained.
+ENTITY_MENTION_COUNT_UPDATE = """
+    UNWIND $node_uuids AS node_uuid
+    MATCH (n:Entity {uuid: node_uuid})
+    OPTIONAL MATCH (episode:Episodic)-[:MENTIONS]->(n)
+    WITH n, count(episode) AS mention_count
+    SET n.mention_count = mention_count
+    RETURN n.uuid AS uuid
+"""
+
+# Entities saved before the count was maintained have a null count, which stays null
+ENTITY_MENTION_COUNT_DECREMENT = """
+    UNWIND $node_uuids AS node_uuid
+    MATCH (n:Entity {uuid: node_uuid})
+    SET n.mention_count = n.mention_count - 1
+    RETURN n.uuid AS uuid
+"""
+
+
 def get_entity_node_return_query(provider: GraphProvider) -> str:
     # `name_embedding` is not returned by default and must be loaded manually using `load_name_embedding()`.
     if provider == GraphProvider.KUZU:
@@ -289,7 +332,7 @@ def get_community_node_save_query(provider: GraphProvider) -> str:
             return """
                 MERGE (n:Community {uuid: $uuid})
                 SET n = {uuid: $uuid, name: $name, group_id: $group_id, summary: $summary, created_at: $created_at}
-                SET n.name_embedding = join([x IN coalesce($name_embedding, []) | toString(x) ], ",")
+                SET n.name_embedding = coalesce($name_embedding, "")
                 RETURN n.uuid AS uuid
             """
         case GraphProvider.KUZU:
@@ -312,6 +355,49 @@ def get_community_node_save_query(provider: GraphProvider) -> str:
             """
 
 
+def get_community_node_save_bulk_query(provider: GraphProvider) -> str:
+    match provider:
+        case GraphProvider.FALKORDB:
+            return """
+                UNWIND $communities AS community
+                MERGE (n:Community {uuid: community.uuid})
+                SET n = community
+                WITH n, community
+                SET n.name_embedding = vecf32(community.name_embedding)
+                RETURN n.uuid AS uuid
+            """
+        case GraphProvider.NEPTUNE:
+            return """
+                UNWIND $communities AS community
+                MERGE (n:Community {uuid: community.uuid})
+                SET n = removeKeyFromMap(community, "name_embedding")
+                SET n.name_embedding = coalesce(community.name_embedding, "")
+                RETURN n.uuid AS uuid
+            """
+        case GraphProvider.KUZU:
+            # COPY only inserts, so the communities must not exist yet
+            return """
+                COPY Community FROM (
+                    UNWIND $communities AS community
+                    RETURN
+                        community.uuid,
+                        community.name,
+                        community.group_id,
+                        community.created_at,
+                        community.name_embedding,
+                        community.summary
+                )
+            """
+        case _:  # Neo4j
+            return """
+                UNWIND $communities AS community
+                MERGE (n:Community {uuid: community.uuid})
+                SET n = {uuid: community.uuid, name: community.name, group_id: community.group_id, summary: community.summary, created_at: community.created_at}
+                WITH n, community CALL db.create.setNodeVectorProperty(n, "name_embedding", community.name_embedding)
+                RETURN n.uuid AS uuid
+            """
+
+
 COMMUNITY_NODE_RETURN = """
     c.uuid AS uuid,
     c.name AS name,
@@ -324,7 +410,7 @@ COMMUNITY_NODE_RETURN = """
 COMMUNITY_NODE_RETURN_NEPTUNE = """
     n.uuid AS uuid,
     n.name AS name,
-    [x IN split(n.name_embedding, ",") | toFloat(x)] AS name_embedding,
+    n.name_embedding AS name_embedding,
     n.group_id AS group_id,
     n.summary AS summary,
     n.created_at AS created_at
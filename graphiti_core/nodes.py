@@ -438,6 +438,10 @@ class EntityNode(Node):
     attributes: dict[str, Any] = Field(
         default={}, description='Additional attributes of the node. Dependent on node labels'
     )
+    mention_count: int | None = Field(
+        default=None,
+        description='number of episodes that mention the node, maintained when MENTIONS edges are written',
+    )
 
     async def generate_name_embedding(self, embedder: EmbedderClient):
         start = time()
@@ -452,17 +456,10 @@ class EntityNode(Node):
         if driver.graph_operations_interface:
             return await driver.graph_operations_interface.node_load_embeddings(self, driver)
 
-        if driver.provider == GraphProvider.NEPTUNE:
-            query: LiteralString = """
-                MATCH (n:Entity {uuid: $uuid})
-                RETURN [x IN split(n.name_embedding, ",") | toFloat(x)] as name_embedding
-            """
-
-        else:
-            query: LiteralString = """
-                MATCH (n:Entity {uuid: $uuid})
-                RETURN n.name_embedding AS name_embedding
-            """
+        query: LiteralString = """
+            MATCH (n:Entity {uuid: $uuid})
+            RETURN n.name_embedding AS name_embedding
+        """
         records, _, _ = await driver.execute_query(
             query,
             uuid=self.uuid,
@@ -503,6 +500,11 @@ class EntityNode(Node):
                 entity_data=entity_data,
             )
 
+        if driver.provider == GraphProvider.NEPTUNE and driver.aoss_knn:  # pyright: ignore reportAttributeAccessIssue
+            await driver.save_to_aoss(  # pyright: ignore reportAttributeAccessIssue
+                'node_name_and_summary', [entity_data]
+            )
+
         logger.debug(f'Saved Node to Graph: {self.uuid}')
 
         return result
@@ -595,8 +597,15 @@ class CommunityNode(Node):
     async def save(self, driver: GraphDriver):
         if driver.provider == GraphProvider.NEPTUNE:
             await driver.save_to_aoss(  # pyright: ignore reportAttributeAccessIssue
-                'communities',
-                [{'name': self.name, 'uuid': self.uuid, 'group_id': self.group_id}],
+                'community_name',
+                [
+                    {
+                        'name': self.name,
+                        'uuid': self.uuid,
+                        'group_id': self.group_id,
+                        'name_embedding': self.name_embedding,
+                    }
+                ],
             )
         result = await driver.execute_query(
             get_community_node_save_query(driver.provider),  # type: ignore
@@ -622,16 +631,10 @@ class CommunityNode(Node):
         return self.name_embedding
 
     async def load_name_embedding(self, driver: GraphDriver):
-        if driver.provider == GraphProvider.NEPTUNE:
-            query: LiteralString = """
-                MATCH (c:Community {uuid: $uuid})
-                RETURN [x IN split(c.name_embedding, ",") | toFloat(x)] as name_embedding
-            """
-        else:
-            query: LiteralString = """
+        query: LiteralString = """
             MATCH (c:Community {uuid: $uuid})
             RETURN c.name_embedding AS name_embedding
-            """
+        """
 
         records, _, _ = await driver.execute_query(
             query,
@@ -752,6 +755,7 @@ def get_episodic_node_from_record(record: Any) -> EpisodicNode:
 
 
 def get_entity_node_from_record(record: Any, provider: GraphProvider) -> EntityNode:
+    mention_count = None
     if provider == GraphProvider.KUZU:
         attributes = json.loads(record['attributes']) if record['attributes'] else {}
     else:
@@ -763,6 +767,7 @@ def get_entity_node_from_record(record: Any, provider: GraphProvider) -> EntityN
         attributes.pop('summary', None)
         attributes.pop('created_at', None)
         attributes.pop('labels', None)
+        mention_count = attributes.pop('mention_count', None)
 
     labels = record.get('labels', [])
     group_id = record.get('group_id')
@@ -778,6 +783,7 @@ def get_entity_node_from_record(record: Any, provider: GraphProvider) -> EntityN
         created_at=parse_db_date(record['created_at']),  # type: ignore
         summary=record['summary'],
         attributes=attributes,
+        mention_count=mention_count,
     )
 
     return entity_node
@@ -804,3 +810,17 @@ async def create_entity_node_embeddings(embedder: EmbedderClient, nodes: list[En
     name_embeddings = await embedder.create_batch([node.name for node in filtered_nodes])
     for node, name_embedding in zip(filtered_nodes, name_embeddings, strict=True):
         node.name_embedding = name_embedding
+
+
+async def create_community_node_embeddings(embedder: EmbedderClient, nodes: list[CommunityNode]):
+    # filter out falsey values from nodes
+    filtered_nodes = [node for node in nodes if node.name]
+
+    if not filtered_nodes:
+        return
+
+    name_embeddings = await embedder.create_batch(
+        [node.name.replace('\n', ' ') for node in filtered_nodes]
+    )
+    for node, name_embedding in zip(filtered_nodes, name_embeddings, strict=True):
+        node.name_embedding = name_embedding
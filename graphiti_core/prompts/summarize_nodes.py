@@ -36,12 +36,14 @@ class SummaryDescription(BaseModel):
 
 class Prompt(Protocol):
     summarize_pair: PromptVersion
+    summarize_many: PromptVersion
     summarize_context: PromptVersion
     summary_description: PromptVersion
 
 
 class Versions(TypedDict):
     summarize_pair: PromptFunction
+    summarize_many: PromptFunction
     summarize_context: PromptFunction
     summary_description: PromptFunction
 
@@ -66,6 +68,28 @@ def summarize_pair(context: dict[str, Any]) -> list[Message]:
     ]
 
 
+def summarize_many(context: dict[str, Any]) -> list[Message]:
+    return [
+        Message(
+            role='system',
+            content='You are a helpful assistant that combines summaries.',
+        ),
+        Message(
+            role='user',
+            content=f"""
+        Synthesize the information from the following summaries into a single succinct summary.
+        The summaries are ordered from the most to the least connected entity, so favor the earlier
+        summaries when not everything fits.
+
+        IMPORTANT: Keep the summary concise and to the point. SUMMARIES MUST BE LESS THAN 250 CHARACTERS.
+
+        Summaries:
+        {to_prompt_json(context['node_summaries'])}
+        """,
+        ),
+    ]
+
+
 def summarize_context(context: dict[str, Any]) -> list[Message]:
     return [
         Message(
@@ -126,6 +150,7 @@ def summary_description(context: dict[str, Any]) -> list[Message]:
 
 versions: Versions = {
     'summarize_pair': summarize_pair,
+    'summarize_many': summarize_many,
     'summarize_context': summarize_context,
     'summary_description': summary_description,
 }
@@ -85,6 +85,30 @@ async def search(
     if query.strip() == '':
         return SearchResults()
 
+    # if group_ids is empty, set it to None
+    group_ids = group_ids if group_ids and group_ids != [''] else None
+
+    search_cache = clients.search_cache
+    if search_cache is not None:
+        cache_scope = search_cache.make_scope_key(
+            group_ids,
+            config,
+            search_filter,
+            center_node_uuid,
+            bfs_origin_node_uuids,
+            driver._database,
+        )
+        cache_key = search_cache.make_query_key(cache_scope, query, query_vector)
+        cache_generation = search_cache.generation(group_ids)
+        cached_results = search_cache.get(cache_key, cache_generation)
+        if cached_results is None and search_cache.similarity_threshold is not None:
+            if query_vector is None:
+                query_vector = await embedder.create(input_data=[query.replace('\n', ' ')])
+            cached_results = search_cache.get_similar(cache_scope, query_vector, cache_generation)
+        if cached_results is not None:
+            logger.debug(f'search cache hit for query {query}')
+            return cached_results
+
     if (
         config.edge_config
         and EdgeSearchMethod.cosine_similarity in config.edge_config.search_methods
@@ -108,8 +132,6 @@ async def search(
     else:
         search_vector = [0.0] * EMBEDDING_DIM
 
-    # if group_ids is empty, set it to None
-    group_ids = group_ids if group_ids and group_ids != [''] else None
     (
         (edges, edge_reranker_scores),
         (nodes, node_reranker_scores),
@@ -176,6 +198,9 @@ async def search(
         community_reranker_scores=community_reranker_scores,
     )
 
+    if search_cache is not None:
+        search_cache.set(cache_key, cache_generation, results, cache_scope, query_vector)
+
     latency = (time() - start) * 1000
 
     logger.debug(f'search returned context for query {query} in {latency} ms')
@@ -292,7 +317,11 @@ async def edge_search(
         source_uuids = [source_node_uuid for source_node_uuid in source_to_edge_uuid_map]
 
         reranked_node_uuids, edge_scores = await node_distance_reranker(
-            driver, source_uuids, center_node_uuid, min_score=reranker_min_score
+            driver,
+            source_uuids,
+            center_node_uuid,
+            min_score=reranker_min_score,
+            max_depth=config.node_distance_max_depth,
         )
 
         for node_uuid in reranked_node_uuids:
@@ -409,6 +438,7 @@ async def node_search(
             rrf(search_result_uuids, min_score=reranker_min_score)[0],
             center_node_uuid,
             min_score=reranker_min_score,
+            max_depth=config.node_distance_max_depth,
         )
 
     reranked_nodes = [node_uuid_map[uuid] for uuid in reranked_uuids]
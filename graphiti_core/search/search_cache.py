@@ -0,0 +1,246 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import BaseModel
+
+from graphiti_core.helpers import normalize_l2
+from graphiti_core.search.search_config import SearchConfig, SearchResults
+from graphiti_core.search.search_filters import SearchFilters
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEARCH_CACHE_SIZE = 1024
+DEFAULT_MAX_SIMILAR_QUERIES = 256
+
+Generation = tuple[int, tuple[int, ...]]
+
+
+class SearchCacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    # Exact misses that were served by the cached results of a similar query
+    semantic_hits: int = 0
+    stale: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+@dataclass
+class _CacheEntry:
+    generation: Generation
+    results: SearchResults
+    scope_key: str
+    query_vector: NDArray | None = None
+
+
+class SearchCache:
+    """In-memory LRU cache of search results, invalidated by writes to the searched groups.
+
+    Every group has a generation counter that the write paths of Graphiti bump through
+    invalidate(). A cached result is only served while the generations of the groups it was
+    computed for are unchanged, so a write never has to find the entries it affects. Searches
+    across all groups are invalidated by a write to any group.
+
+    If similarity_threshold is set, a query that misses the cache is also matched against the
+    embeddings of recent queries with the same groups, config and filters. The results of the most
+    similar one are reused if its cosine similarity is at least the threshold, so paraphrased
+    queries skip the database and rerankers. This costs a query embedding on every exact miss.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_SEARCH_CACHE_SIZE,
+        similarity_threshold: float | None = None,
+        max_similar_queries: int = DEFAULT_MAX_SIMILAR_QUERIES,
+    ):
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1')
+        if similarity_threshold is not None and not 0 < similarity_threshold <= 1:
+            raise ValueError('similarity_threshold must be in (0, 1]')
+        self.max_size = max_size
+        self.similarity_threshold = similarity_threshold
+        self.max_similar_queries = max_similar_queries
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        # Keys of the entries with a query vector, per scope and in insertion order
+        self._scopes: dict[str, dict[str, None]] = {}
+        self._group_generations: dict[str, int] = {}
+        # Bumped by every write, searches across all groups depend on it
+        self._write_count = 0
+        # Bumped by writes that are not scoped to a group, invalidates every entry
+        self._epoch = 0
+        self._stats = SearchCacheStats()
+
+    @staticmethod
+    def make_scope_key(
+        group_ids: list[str] | None,
+        config: SearchConfig,
+        search_filter: SearchFilters,
+        center_node_uuid: str | None = None,
+        bfs_origin_node_uuids: list[str] | None = None,
+        database: str | None = None,
+    ) -> str:
+        """Hash of everything a search depends on except the query itself."""
+        scope_data: dict[str, Any] = {
+            'group_ids': sorted(group_ids) if group_ids else None,
+            'config': config.model_dump(mode='json'),
+            'search_filter': search_filter.model_dump(mode='json'),
+            'center_node_uuid': center_node_uuid,
+            'bfs_origin_node_uuids': bfs_origin_node_uuids,
+            'database': database,
+        }
+        return hashlib.sha256(json.dumps(scope_data, sort_keys=True).encode()).hexdigest()
+
+    @staticmethod
+    def make_query_key(scope_key: str, query: str, query_vector: list[float] | None = None) -> str:
+        key_data: dict[str, Any] = {'scope': scope_key, 'query': query}
+        if query_vector is not None:
+            key_data['query_vector'] = hashlib.sha256(
+                np.asarray(query_vector, dtype=np.float32).tobytes()
+            ).hexdigest()
+
+        return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+
+    @classmethod
+    def make_key(
+        cls,
+        query: str,
+        group_ids: list[str] | None,
+        config: SearchConfig,
+        search_filter: SearchFilters,
+        center_node_uuid: str | None = None,
+        bfs_origin_node_uuids: list[str] | None = None,
+        query_vector: list[float] | None = None,
+        database: str | None = None,
+    ) -> str:
+        scope_key = cls.make_scope_key(
+            group_ids, config, search_filter, center_node_uuid, bfs_origin_node_uuids, database
+        )
+        return cls.make_query_key(scope_key, query, query_vector)
+
+    def generation(self, group_ids: list[str] | None) -> Generation:
+        """Snapshot of the write generation that results for these groups depend on."""
+        if not group_ids:
+            return self._epoch, (self._write_count,)
+        return self._epoch, tuple(
+            self._group_generations.get(group_id, 0) for group_id in sorted(group_ids)
+        )
+
+    def invalidate(self, group_ids: list[str] | None = None):
+        """Record a write to the given groups, or to every group if group_ids is None."""
+        self._write_count += 1
+        if group_ids is None:
+            self._epoch += 1
+            return
+        for group_id in set(group_ids):
+            self._group_generations[group_id] = self._group_generations.get(group_id, 0) + 1
+
+    def get(self, key: str, generation: Generation) -> SearchResults | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+
+        if entry.generation != generation:
+            self._remove(key)
+            self._stats.stale += 1
+            self._stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return entry.results.model_copy(deep=True)
+
+    def get_similar(
+        self, scope_key: str, query_vector: list[float], generation: Generation
+    ) -> SearchResults | None:
+        """Return the cached results of the most similar query in the scope, if it is close enough."""
+        if self.similarity_threshold is None:
+            return None
+
+        candidates: list[tuple[str, NDArray]] = []
+        for key in self._scopes.get(scope_key, {}):
+            entry = self._entries[key]
+            if entry.generation == generation and entry.query_vector is not None:
+                candidates.append((key, entry.query_vector))
+        if not candidates:
+            return None
+
+        similarities = np.stack([vector for _, vector in candidates]) @ normalize_l2(query_vector)
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity_threshold:
+            return None
+
+        key = candidates[best][0]
+        self._entries.move_to_end(key)
+        self._stats.semantic_hits += 1
+        logger.debug(f'search cache matched a similar query with similarity {similarities[best]}')
+        return self._entries[key].results.model_copy(deep=True)
+
+    def set(
+        self,
+        key: str,
+        generation: Generation,
+        results: SearchResults,
+        scope_key: str = '',
+        query_vector: list[float] | None = None,
+    ):
+        """Cache results that were computed against the given generation snapshot.
+
+        Results of a search that overlapped a write are stored under the generation from before the
+        write, so they are never served. Results stored with a query vector can be served to
+        similar queries in the same scope.
+        """
+        self._remove(key)
+        entry = _CacheEntry(generation, results.model_copy(deep=True), scope_key)
+        self._entries[key] = entry
+
+        if self.similarity_threshold is not None and query_vector is not None:
+            entry.query_vector = normalize_l2(query_vector)
+            scope = self._scopes.setdefault(scope_key, {})
+            scope[key] = None
+            if len(scope) > self.max_similar_queries:
+                oldest_key = next(iter(scope))
+                del scope[oldest_key]
+                self._entries[oldest_key].query_vector = None
+
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+            self._stats.evictions += 1
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None or entry.query_vector is None:
+            return
+        scope = self._scopes[entry.scope_key]
+        del scope[key]
+        if not scope:
+            del self._scopes[entry.scope_key]
+
+    def clear(self):
+        self._entries.clear()
+        self._scopes.clear()
+
+    def stats(self) -> SearchCacheStats:
+        return self._stats.model_copy(update={'size': len(self._entries)})
@@ -16,6 +16,7 @@ limitations under the License.
 
 import logging
 from collections import defaultdict
+from collections.abc import AsyncIterator
 from time import time
 from typing import Any
 
@@ -34,6 +35,7 @@ from graphiti_core.graph_queries import (
     get_vector_cosine_func_query,
 )
 from graphiti_core.helpers import (
+    decode_embedding_matrix,
     lucene_sanitize,
     normalize_l2,
     semaphore_gather,
@@ -64,7 +66,11 @@ RELEVANT_SCHEMA_LIMIT = 10
 DEFAULT_MIN_SCORE = 0.6
 DEFAULT_MMR_LAMBDA = 0.5
 MAX_SEARCH_DEPTH = 3
+# Largest BFS frontier node_distance_reranker expands before scoring unfound nodes as unreachable
+MAX_DISTANCE_FRONTIER = 1000
 MAX_QUERY_LENGTH = 128
+# AOSS k-NN candidates fetched per result, leaving room for the graph-side filters
+KNN_CANDIDATE_FACTOR = 4
 
 
 def calculate_cosine_similarity(vector1: list[float], vector2: list[float]) -> float:
@@ -81,6 +87,72 @@ def calculate_cosine_similarity(vector1: list[float], vector2: list[float]) -> f
     return dot_product / (norm_vector1 * norm_vector2)
 
 
+def top_k_cosine_similarity(
+    search_vector: list[float], embeddings: list[Any], limit: int, min_score: float
+) -> list[tuple[int, float]]:
+    """
+    Scores stored embeddings against search_vector with a single matrix product.
+
+    Returns (index, score) pairs for the best limit embeddings scoring above min_score, best first.
+    """
+    matrix, indices = decode_embedding_matrix(embeddings, len(search_vector))
+    if limit <= 0 or len(indices) == 0:
+        return []
+
+    query = np.asarray(search_vector, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    scores = np.divide(
+        matrix @ query, norms, out=np.zeros(len(indices), dtype=np.float32), where=norms > 0
+    )
+
+    candidates = np.flatnonzero(scores > min_score)
+    if len(candidates) > limit:
+        candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+    candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
+
+    return [(int(indices[i]), float(scores[i])) for i in candidates]
+
+
+def score_edge_candidates(
+    edges: list[EntityEdge], candidates: list[dict[str, Any]], limit: int, min_score: float
+) -> list[dict[str, Any]]:
+    """
+    Scores candidate rows of (id, embedding, search_edge_uuid) against the edge they were found
+    for, one matrix product per edge, and keeps the best limit candidates of each edge.
+    """
+    rows_by_edge: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for row in candidates:
+        rows_by_edge[row['search_edge_uuid']].append(row)
+
+    input_ids: list[dict[str, Any]] = []
+    for edge in edges:
+        rows = rows_by_edge.get(edge.uuid)
+        if not rows or not edge.fact_embedding:
+            continue
+        for i, score in top_k_cosine_similarity(
+            edge.fact_embedding, [row['embedding'] for row in rows], limit, min_score
+        ):
+            input_ids.append({'id': rows[i]['id'], 'score': score, 'uuid': edge.uuid})
+
+    return input_ids
+
+
+async def aoss_knn_candidates(
+    driver: GraphDriver, index_name: str, search_vector: list[float], limit: int
+) -> list[str] | None:
+    """
+    Returns the uuids of the AOSS k-NN candidates, or None if the driver does not delegate
+    similarity search to AOSS.
+    """
+    if not getattr(driver, 'aoss_knn', False):
+        return None
+
+    res = await driver.run_aoss_knn_query(  # pyright: ignore reportAttributeAccessIssue
+        index_name, search_vector, limit=limit * KNN_CANDIDATE_FACTOR
+    )
+    return [hit['_source']['uuid'] for hit in res.get('hits', {}).get('hits', [])]
+
+
 def fulltext_query(query: str, group_ids: list[str] | None, driver: GraphDriver):
     if driver.provider == GraphProvider.KUZU:
         # Kuzu only supports simple queries.
@@ -208,7 +280,7 @@ async def edge_fulltext_search(
         filter_query = ' WHERE ' + (' AND '.join(filter_queries))
 
     if driver.provider == GraphProvider.NEPTUNE:
-        res = driver.run_aoss_query('edge_name_and_fact', query)  # pyright: ignore reportAttributeAccessIssue
+        res = await driver.run_aoss_query('edge_name_and_fact', query)  # pyright: ignore reportAttributeAccessIssue
         if res['hits']['total']['value'] > 0:
             input_ids = []
             for r in res['hits']['hits']:
@@ -337,6 +409,15 @@ async def edge_similarity_search(
         search_vector_var = f'CAST($search_vector AS FLOAT[{len(search_vector)}])'
 
     if driver.provider == GraphProvider.NEPTUNE:
+        candidate_uuids = await aoss_knn_candidates(
+            driver, 'edge_name_and_fact', search_vector, limit
+        )
+        if candidate_uuids is not None:
+            filter_params['candidate_uuids'] = candidate_uuids
+            filter_query = ' WHERE ' + (
+                ' AND '.join(filter_queries + ['e.uuid IN $candidate_uuids'])
+            )
+
         query = (
             """
                             MATCH (n:Entity)-[e:RELATES_TO]->(m:Entity)
@@ -356,15 +437,13 @@ async def edge_similarity_search(
         )
 
         if len(resp) > 0:
-            # Calculate Cosine similarity then return the edge ids
-            input_ids = []
-            for r in resp:
-                if r['embedding']:
-                    score = calculate_cosine_similarity(
-                        search_vector, list(map(float, r['embedding'].split(',')))
-                    )
-                    if score > min_score:
-                        input_ids.append({'id': r['id'], 'score': score})
+            # Score every candidate at once, then hydrate the best edges
+            input_ids = [
+                {'id': resp[i]['id'], 'score': score}
+                for i, score in top_k_cosine_similarity(
+                    search_vector, [r['embedding'] for r in resp], limit, min_score
+                )
+            ]
 
             # Match the edge ides and return the values
             query = """
@@ -430,6 +509,78 @@ async def edge_similarity_search(
     return edges
 
 
+def _bfs_hop_query(
+    provider: GraphProvider, from_episodes: bool, undirected: bool, group_filter: str
+) -> str:
+    out = '-' if undirected else '->'
+    if provider == GraphProvider.KUZU:
+        # Kuzu stores entity edges as an intermediate node between the two entities
+        entity_hop = f'(origin:Entity {{uuid: frontier_uuid}})-[:RELATES_TO]{out}(:RelatesToNode_)-[:RELATES_TO]{out}(n:Entity)'
+    else:
+        entity_hop = f'(origin:Entity {{uuid: frontier_uuid}})-[:RELATES_TO]{out}(n:Entity)'
+
+    hops = [entity_hop]
+    if from_episodes:
+        hops.append('(origin:Episodic {uuid: frontier_uuid})-[:MENTIONS]->(n:Entity)')
+
+    return '\nUNION\n'.join(
+        f"""
+        UNWIND $frontier_uuids AS frontier_uuid
+        MATCH {hop}
+        WHERE n.group_id = origin.group_id{group_filter}
+        RETURN DISTINCT n.uuid AS uuid
+        """
+        for hop in hops
+    )
+
+
+async def bfs_frontiers(
+    driver: GraphDriver,
+    origin_uuids: list[str],
+    max_depth: int,
+    group_ids: list[str] | None = None,
+    undirected: bool = False,
+) -> AsyncIterator[tuple[int, list[str]]]:
+    """
+    Level-synchronous BFS over RELATES_TO and MENTIONS edges.
+
+    Yields `(hop, frontier)` pairs, starting with the origins at hop 0, where `frontier` holds the
+    Entity uuids first reached at that hop. Each hop is a single query that expands only the
+    deduplicated frontier, so the cost grows with the number of reachable nodes rather than the
+    number of paths. The next hop is only queried when the caller asks for it.
+
+    By default edges are followed from source to target and episode origins are expanded through
+    their MENTIONS edges. With `undirected`, only RELATES_TO edges are followed, in both directions.
+    """
+    group_filter = ''
+    group_params: dict[str, Any] = {}
+    if group_ids is not None:
+        group_filter = ' AND n.group_id IN $group_ids'
+        group_params['group_ids'] = group_ids
+
+    frontier = list(dict.fromkeys(origin_uuids))
+    visited = set(frontier)
+    for hop in range(max_depth + 1):
+        if not frontier:
+            return
+        yield hop, frontier
+        if hop == max_depth:
+            return
+
+        # Only the origins can be episodes, every later frontier holds entities
+        records, _, _ = await driver.execute_query(
+            _bfs_hop_query(driver.provider, hop == 0 and not undirected, undirected, group_filter),
+            frontier_uuids=frontier,
+            routing_='r',
+            **group_params,
+        )
+        frontier = []
+        for record in records:
+            if record['uuid'] not in visited:
+                visited.add(record['uuid'])
+                frontier.append(record['uuid'])
+
+
 async def edge_bfs_search(
     driver: GraphDriver,
     bfs_origin_node_uuids: list[str] | None,
@@ -438,8 +589,8 @@ async def edge_bfs_search(
     group_ids: list[str] | None = None,
     limit: int = RELEVANT_SCHEMA_LIMIT,
 ) -> list[EntityEdge]:
-    # vector similarity search over embedded facts
-    if bfs_origin_node_uuids is None or len(bfs_origin_node_uuids) == 0:
+    # Entity edges reachable within bfs_max_depth hops, ordered by hop distance
+    if bfs_origin_node_uuids is None or len(bfs_origin_node_uuids) == 0 or bfs_max_depth < 1:
         return []
 
     filter_queries, filter_params = edge_search_filter_query_constructor(
@@ -455,100 +606,43 @@ async def edge_bfs_search(
         filter_query = ' WHERE ' + (' AND '.join(filter_queries))
 
     if driver.provider == GraphProvider.KUZU:
-        # Kuzu stores entity edges twice with an intermediate node, so we need to match them
-        # separately for the correct BFS depth.
-        depth = bfs_max_depth * 2 - 1
-        match_queries = [
-            f"""
-            UNWIND $bfs_origin_node_uuids AS origin_uuid
-            MATCH path = (origin:Entity {{uuid: origin_uuid}})-[:RELATES_TO*1..{depth}]->(:RelatesToNode_)
-            UNWIND nodes(path) AS relNode
-            MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_ {{uuid: relNode.uuid}})-[:RELATES_TO]->(m:Entity)
-            """,
-        ]
-        if bfs_max_depth > 1:
-            depth = (bfs_max_depth - 1) * 2 - 1
-            match_queries.append(f"""
-                UNWIND $bfs_origin_node_uuids AS origin_uuid
-                MATCH path = (origin:Episodic {{uuid: origin_uuid}})-[:MENTIONS]->(:Entity)-[:RELATES_TO*1..{depth}]->(:RelatesToNode_)
-                UNWIND nodes(path) AS relNode
-                MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_ {{uuid: relNode.uuid}})-[:RELATES_TO]->(m:Entity)
-            """)
-
-        records = []
-        for match_query in match_queries:
-            sub_records, _, _ = await driver.execute_query(
-                match_query
-                + filter_query
-                + """
-                RETURN DISTINCT
-                """
-                + get_entity_edge_return_query(driver.provider)
-                + """
-                LIMIT $limit
-                """,
-                bfs_origin_node_uuids=bfs_origin_node_uuids,
-                limit=limit,
-                routing_='r',
-                **filter_params,
-            )
-            records.extend(sub_records)
+        match_query = """
+            UNWIND $frontier_uuids AS frontier_uuid
+            MATCH (n:Entity {uuid: frontier_uuid})-[:RELATES_TO]->(e:RelatesToNode_)-[:RELATES_TO]->(m:Entity)
+        """
     else:
-        if driver.provider == GraphProvider.NEPTUNE:
-            query = (
-                f"""
-                UNWIND $bfs_origin_node_uuids AS origin_uuid
-                MATCH path = (origin {{uuid: origin_uuid}})-[:RELATES_TO|MENTIONS *1..{bfs_max_depth}]->(n:Entity)
-                WHERE origin:Entity OR origin:Episodic
-                UNWIND relationships(path) AS rel
-                MATCH (n:Entity)-[e:RELATES_TO {{uuid: rel.uuid}}]-(m:Entity)
-                """
-                + filter_query
-                + """
-                RETURN DISTINCT
-                    e.uuid AS uuid,
-                    e.group_id AS group_id,
-                    startNode(e).uuid AS source_node_uuid,
-                    endNode(e).uuid AS target_node_uuid,
-                    e.created_at AS created_at,
-                    e.name AS name,
-                    e.fact AS fact,
-                    split(e.episodes, ',') AS episodes,
-                    e.expired_at AS expired_at,
-                    e.valid_at AS valid_at,
-                    e.invalid_at AS invalid_at,
-                    properties(e) AS attributes
-                LIMIT $limit
-                """
-            )
-        else:
-            query = (
-                f"""
-                UNWIND $bfs_origin_node_uuids AS origin_uuid
-                MATCH path = (origin {{uuid: origin_uuid}})-[:RELATES_TO|MENTIONS*1..{bfs_max_depth}]->(:Entity)
-                UNWIND relationships(path) AS rel
-                MATCH (n:Entity)-[e:RELATES_TO {{uuid: rel.uuid}}]-(m:Entity)
-                """
-                + filter_query
-                + """
-                RETURN DISTINCT
-                """
-                + get_entity_edge_return_query(driver.provider)
-                + """
-                LIMIT $limit
-                """
-            )
+        match_query = """
+            UNWIND $frontier_uuids AS frontier_uuid
+            MATCH (n:Entity {uuid: frontier_uuid})-[e:RELATES_TO]->(m:Entity)
+        """
 
+    query = (
+        match_query
+        + filter_query
+        + """
+        RETURN DISTINCT
+        """
+        + get_entity_edge_return_query(driver.provider)
+        + """
+        LIMIT $limit
+        """
+    )
+
+    # The edges found at hop k leave the nodes first reached at hop k - 1
+    edges: list[EntityEdge] = []
+    async for _, frontier in bfs_frontiers(
+        driver, bfs_origin_node_uuids, bfs_max_depth - 1, group_ids
+    ):
         records, _, _ = await driver.execute_query(
             query,
-            bfs_origin_node_uuids=bfs_origin_node_uuids,
-            depth=bfs_max_depth,
-            limit=limit,
+            frontier_uuids=frontier,
+            limit=limit - len(edges),
             routing_='r',
             **filter_params,
         )
-
-    edges = [get_entity_edge_from_record(record, driver.provider) for record in records]
+        edges.extend(get_entity_edge_from_record(record, driver.provider) for record in records)
+        if len(edges) >= limit:
+            break
 
     return edges
 
@@ -587,7 +681,7 @@ async def node_fulltext_search(
         yield_query = 'WITH node AS n, score'
 
     if driver.provider == GraphProvider.NEPTUNE:
-        res = driver.run_aoss_query('node_name_and_summary', query, limit=limit)  # pyright: ignore reportAttributeAccessIssue
+        res = await driver.run_aoss_query('node_name_and_summary', query, limit=limit)  # pyright: ignore reportAttributeAccessIssue
         if res['hits']['total']['value'] > 0:
             input_ids = []
             for r in res['hits']['hits']:
@@ -676,6 +770,15 @@ async def node_similarity_search(
         search_vector_var = f'CAST($search_vector AS FLOAT[{len(search_vector)}])'
 
     if driver.provider == GraphProvider.NEPTUNE:
+        candidate_uuids = await aoss_knn_candidates(
+            driver, 'node_name_and_summary', search_vector, limit
+        )
+        if candidate_uuids is not None:
+            filter_params['candidate_uuids'] = candidate_uuids
+            filter_query = ' WHERE ' + (
+                ' AND '.join(filter_queries + ['n.uuid IN $candidate_uuids'])
+            )
+
         query = (
             """
                                                                                                                                     MATCH (n:Entity)
@@ -687,23 +790,21 @@ async def node_similarity_search(
         )
         resp, header, _ = await driver.execute_query(
             query,
-            params=filter_params,
             search_vector=search_vector,
             limit=limit,
             min_score=min_score,
             routing_='r',
+            **filter_params,
         )
 
         if len(resp) > 0:
-            # Calculate Cosine similarity then return the edge ids
-            input_ids = []
-            for r in resp:
-                if r['embedding']:
-                    score = calculate_cosine_similarity(
-                        search_vector, list(map(float, r['embedding'].split(',')))
-                    )
-                    if score > min_score:
-                        input_ids.append({'id': r['id'], 'score': score})
+            # Score every candidate at once, then hydrate the best nodes
+            input_ids = [
+                {'id': resp[i]['id'], 'score': score}
+                for i, score in top_k_cosine_similarity(
+                    search_vector, [r['embedding'] for r in resp], limit, min_score
+                )
+            ]
 
             # Match the edge ides and return the values
             query = (
@@ -772,6 +873,7 @@ async def node_bfs_search(
     group_ids: list[str] | None = None,
     limit: int = RELEVANT_SCHEMA_LIMIT,
 ) -> list[EntityNode]:
+    # Entity nodes reachable within bfs_max_depth hops, ordered by hop distance
     if bfs_origin_node_uuids is None or len(bfs_origin_node_uuids) == 0 or bfs_max_depth < 1:
         return []
 
@@ -781,73 +883,44 @@ async def node_bfs_search(
 
     if group_ids is not None:
         filter_queries.append('n.group_id IN $group_ids')
-        filter_queries.append('origin.group_id IN $group_ids')
         filter_params['group_ids'] = group_ids
 
     filter_query = ''
     if filter_queries:
-        filter_query = ' AND ' + (' AND '.join(filter_queries))
+        filter_query = ' WHERE ' + (' AND '.join(filter_queries))
 
-    match_queries = [
-        f"""
-        UNWIND $bfs_origin_node_uuids AS origin_uuid
-        MATCH (origin {{uuid: origin_uuid}})-[:RELATES_TO|MENTIONS*1..{bfs_max_depth}]->(n:Entity)
-        WHERE n.group_id = origin.group_id
+    query = (
         """
-    ]
+        UNWIND $frontier_uuids AS frontier_uuid
+        MATCH (n:Entity {uuid: frontier_uuid})
+        """
+        + filter_query
+        + """
+        RETURN
+        """
+        + get_entity_node_return_query(driver.provider)
+        + """
+        LIMIT $limit
+        """
+    )
 
-    if driver.provider == GraphProvider.NEPTUNE:
-        match_queries = [
-            f"""
-            UNWIND $bfs_origin_node_uuids AS origin_uuid
-            MATCH (origin {{uuid: origin_uuid}})-[e:RELATES_TO|MENTIONS*1..{bfs_max_depth}]->(n:Entity)
-            WHERE origin:Entity OR origin.Episode
-            AND n.group_id = origin.group_id
-            """
-        ]
+    nodes: list[EntityNode] = []
+    async for hop, frontier in bfs_frontiers(
+        driver, bfs_origin_node_uuids, bfs_max_depth, group_ids
+    ):
+        if hop == 0:
+            continue
 
-    if driver.provider == GraphProvider.KUZU:
-        depth = bfs_max_depth * 2
-        match_queries = [
-            """
-            UNWIND $bfs_origin_node_uuids AS origin_uuid
-            MATCH (origin:Episodic {uuid: origin_uuid})-[:MENTIONS]->(n:Entity)
-            WHERE n.group_id = origin.group_id
-            """,
-            f"""
-            UNWIND $bfs_origin_node_uuids AS origin_uuid
-            MATCH (origin:Entity {{uuid: origin_uuid}})-[:RELATES_TO*2..{depth}]->(n:Entity)
-            WHERE n.group_id = origin.group_id
-            """,
-        ]
-        if bfs_max_depth > 1:
-            depth = (bfs_max_depth - 1) * 2
-            match_queries.append(f"""
-                UNWIND $bfs_origin_node_uuids AS origin_uuid
-                MATCH (origin:Episodic {{uuid: origin_uuid}})-[:MENTIONS]->(:Entity)-[:RELATES_TO*2..{depth}]->(n:Entity)
-                WHERE n.group_id = origin.group_id
-            """)
-
-    records = []
-    for match_query in match_queries:
-        sub_records, _, _ = await driver.execute_query(
-            match_query
-            + filter_query
-            + """
-            RETURN
-            """
-            + get_entity_node_return_query(driver.provider)
-            + """
-            LIMIT $limit
-            """,
-            bfs_origin_node_uuids=bfs_origin_node_uuids,
-            limit=limit,
+        records, _, _ = await driver.execute_query(
+            query,
+            frontier_uuids=frontier,
+            limit=limit - len(nodes),
             routing_='r',
             **filter_params,
         )
-        records.extend(sub_records)
-
-    nodes = [get_entity_node_from_record(record, driver.provider) for record in records]
+        nodes.extend(get_entity_node_from_record(record, driver.provider) for record in records)
+        if len(nodes) >= limit:
+            break
 
     return nodes
 
@@ -876,7 +949,7 @@ async def episode_fulltext_search(
         filter_params['group_ids'] = group_ids
 
     if driver.provider == GraphProvider.NEPTUNE:
-        res = driver.run_aoss_query('episode_content', query, limit=limit)  # pyright: ignore reportAttributeAccessIssue
+        res = await driver.run_aoss_query('episode_content', query, limit=limit)  # pyright: ignore reportAttributeAccessIssue
         if res['hits']['total']['value'] > 0:
             input_ids = []
             for r in res['hits']['hits']:
@@ -960,7 +1033,7 @@ async def community_fulltext_search(
         yield_query = 'WITH node AS c, score'
 
     if driver.provider == GraphProvider.NEPTUNE:
-        res = driver.run_aoss_query('community_name', query, limit=limit)  # pyright: ignore reportAttributeAccessIssue
+        res = await driver.run_aoss_query('community_name', query, limit=limit)  # pyright: ignore reportAttributeAccessIssue
         if res['hits']['total']['value'] > 0:
             # Calculate Cosine similarity then return the edge ids
             input_ids = []
@@ -978,7 +1051,7 @@ async def community_fulltext_search(
                     comm.name AS name,
                     comm.created_at AS created_at,
                     comm.summary AS summary,
-                    [x IN split(comm.name_embedding, ",") | toFloat(x)]AS name_embedding
+                    comm.name_embedding AS name_embedding
                 ORDER BY i.score DESC
                 LIMIT $limit
             """
@@ -1035,13 +1108,22 @@ async def community_similarity_search(
         query_params['group_ids'] = group_ids
 
     if driver.provider == GraphProvider.NEPTUNE:
+        candidate_uuids = await aoss_knn_candidates(driver, 'community_name', search_vector, limit)
+        if candidate_uuids is not None:
+            query_params['candidate_uuids'] = candidate_uuids
+            group_filter_query += (
+                ' AND c.uuid IN $candidate_uuids'
+                if group_filter_query
+                else ' WHERE c.uuid IN $candidate_uuids'
+            )
+
         query = (
             """
-                                                                                                                                    MATCH (n:Community)
+                                                                                                                                    MATCH (c:Community)
                                                                                                                                     """
             + group_filter_query
             + """
-            RETURN DISTINCT id(n) as id, n.name_embedding as embedding
+            RETURN DISTINCT id(c) as id, c.name_embedding as embedding
             """
         )
         resp, header, _ = await driver.execute_query(
@@ -1054,15 +1136,13 @@ async def community_similarity_search(
         )
 
         if len(resp) > 0:
-            # Calculate Cosine similarity then return the edge ids
-            input_ids = []
-            for r in resp:
-                if r['embedding']:
-                    score = calculate_cosine_similarity(
-                        search_vector, list(map(float, r['embedding'].split(',')))
-                    )
-                    if score > min_score:
-                        input_ids.append({'id': r['id'], 'score': score})
+            # Score every candidate at once, then hydrate the best communities
+            input_ids = [
+                {'id': resp[i]['id'], 'score': score}
+                for i, score in top_k_cosine_similarity(
+                    search_vector, [r['embedding'] for r in resp], limit, min_score
+                )
+            ]
 
             # Match the edge ides and return the values
             query = """
@@ -1384,8 +1464,7 @@ async def get_relevant_edges(
             + filter_query
             + """
             WITH e, edge
-            RETURN DISTINCT id(e) as id, e.fact_embedding as source_embedding, edge.uuid as search_edge_uuid,
-            edge.fact_embedding as target_embedding
+            RETURN DISTINCT id(e) as id, e.fact_embedding as embedding, edge.uuid as search_edge_uuid
             """
         )
         resp, _, _ = await driver.execute_query(
@@ -1397,14 +1476,7 @@ async def get_relevant_edges(
             **filter_params,
         )
 
-        # Calculate Cosine similarity then return the edge ids
-        input_ids = []
-        for r in resp:
-            score = calculate_cosine_similarity(
-                list(map(float, r['source_embedding'].split(','))), r['target_embedding']
-            )
-            if score > min_score:
-                input_ids.append({'id': r['id'], 'score': score, 'uuid': r['search_edge_uuid']})
+        input_ids = score_edge_candidates(edges, resp, limit, min_score)
 
         # Match the edge ides and return the values
         query = """
@@ -1422,7 +1494,7 @@ async def get_relevant_edges(
                 name: e.name,
                 group_id: e.group_id,
                 fact: e.fact,
-                fact_embedding: [x IN split(e.fact_embedding, ",") | toFloat(x)],
+                fact_embedding: e.fact_embedding,
                 episodes: split(e.episodes, ","),
                 expired_at: e.expired_at,
                 valid_at: e.valid_at,
@@ -1570,8 +1642,7 @@ async def get_edge_invalidation_candidates(
             + filter_query
             + """
             WITH e, edge
-            RETURN DISTINCT id(e) as id, e.fact_embedding as source_embedding,
-            edge.fact_embedding as target_embedding,
+            RETURN DISTINCT id(e) as id, e.fact_embedding as embedding,
             edge.uuid as search_edge_uuid
             """
         )
@@ -1584,14 +1655,7 @@ async def get_edge_invalidation_candidates(
             **filter_params,
         )
 
-        # Calculate Cosine similarity then return the edge ids
-        input_ids = []
-        for r in resp:
-            score = calculate_cosine_similarity(
-                list(map(float, r['source_embedding'].split(','))), r['target_embedding']
-            )
-            if score > min_score:
-                input_ids.append({'id': r['id'], 'score': score, 'uuid': r['search_edge_uuid']})
+        input_ids = score_edge_candidates(edges, resp, limit, min_score)
 
         # Match the edge ides and return the values
         query = """
@@ -1609,7 +1673,7 @@ async def get_edge_invalidation_candidates(
                 name: e.name,
                 group_id: e.group_id,
                 fact: e.fact,
-                fact_embedding: [x IN split(e.fact_embedding, ",") | toFloat(x)],
+                fact_embedding: e.fact_embedding,
                 episodes: split(e.episodes, ","),
                 expired_at: e.expired_at,
                 valid_at: e.valid_at,
@@ -1753,37 +1817,26 @@ async def node_distance_reranker(
     node_uuids: list[str],
     center_node_uuid: str,
     min_score: float = 0,
+    max_depth: int = MAX_SEARCH_DEPTH,
+    max_frontier: int = MAX_DISTANCE_FRONTIER,
 ) -> tuple[list[str], list[float]]:
     # filter out node_uuid center node node uuid
     filtered_uuids = list(filter(lambda node_uuid: node_uuid != center_node_uuid, node_uuids))
     scores: dict[str, float] = {center_node_uuid: 0.0}
 
-    query = """
-    UNWIND $node_uuids AS node_uuid
-    MATCH (center:Entity {uuid: $center_uuid})-[:RELATES_TO]-(n:Entity {uuid: node_uuid})
-    RETURN 1 AS score, node_uuid AS uuid
-    """
-    if driver.provider == GraphProvider.KUZU:
-        query = """
-        UNWIND $node_uuids AS node_uuid
-        MATCH (center:Entity {uuid: $center_uuid})-[:RELATES_TO]->(e:RelatesToNode_)-[:RELATES_TO]->(n:Entity {uuid: node_uuid})
-        RETURN 1 AS score, node_uuid AS uuid
-        """
-
-    # Find the shortest path to center node
-    results, header, _ = await driver.execute_query(
-        query,
-        node_uuids=filtered_uuids,
-        center_uuid=center_node_uuid,
-        routing_='r',
-    )
-    if driver.provider == GraphProvider.FALKORDB:
-        results = [dict(zip(header, row, strict=True)) for row in results]
-
-    for result in results:
-        uuid = result['uuid']
-        score = result['score']
-        scores[uuid] = score
+    # Find the shortest hop distance to the center node, stopping once every node is found. Nodes
+    # that are unreachable would otherwise expand the whole neighborhood up to max_depth, so a
+    # frontier larger than max_frontier is not expanded any further.
+    remaining = set(filtered_uuids)
+    async for hop, frontier in bfs_frontiers(
+        driver, [center_node_uuid], max_depth if remaining else 0, undirected=True
+    ):
+        for uuid in frontier:
+            if uuid in remaining:
+                scores[uuid] = hop
+                remaining.remove(uuid)
+        if not remaining or len(frontier) > max_frontier:
+            break
 
     for uuid in filtered_uuids:
         if uuid not in scores:
@@ -1809,19 +1862,38 @@ async def episode_mentions_reranker(
     sorted_uuids, _ = rrf(node_uuids)
     scores: dict[str, float] = {}
 
-    # Find the shortest path to center node
-    results, _, _ = await driver.execute_query(
-        """
-        UNWIND $node_uuids AS node_uuid
-        MATCH (episode:Episodic)-[r:MENTIONS]->(n:Entity {uuid: node_uuid})
-        RETURN count(*) AS score, n.uuid AS uuid
-        """,
-        node_uuids=sorted_uuids,
-        routing_='r',
-    )
+    # Read the maintained mention counts, Kuzu has no column for them
+    uncounted_uuids = sorted_uuids
+    if driver.provider != GraphProvider.KUZU:
+        results, _, _ = await driver.execute_query(
+            """
+            UNWIND $node_uuids AS node_uuid
+            MATCH (n:Entity {uuid: node_uuid})
+            RETURN n.uuid AS uuid, n.mention_count AS score
+            """,
+            node_uuids=sorted_uuids,
+            routing_='r',
+        )
 
-    for result in results:
-        scores[result['uuid']] = result['score']
+        for result in results:
+            if result['score'] is not None and result['score'] > 0:
+                scores[result['uuid']] = result['score']
+        uncounted_uuids = [result['uuid'] for result in results if result['score'] is None]
+
+    # Nodes written before mention counts were maintained fall back to counting their MENTIONS
+    if uncounted_uuids:
+        results, _, _ = await driver.execute_query(
+            """
+            UNWIND $node_uuids AS node_uuid
+            MATCH (episode:Episodic)-[r:MENTIONS]->(n:Entity {uuid: node_uuid})
+            RETURN count(*) AS score, n.uuid AS uuid
+            """,
+            node_uuids=uncounted_uuids,
+            routing_='r',
+        )
+
+        for result in results:
+            scores[result['uuid']] = result['score']
 
     for uuid in sorted_uuids:
         if uuid not in scores:
@@ -1881,14 +1953,6 @@ async def get_embeddings_for_nodes(
 ) -> dict[str, list[float]]:
     if driver.graph_operations_interface:
         return await driver.graph_operations_interface.node_load_embeddings_bulk(driver, nodes)
-    elif driver.provider == GraphProvider.NEPTUNE:
-        query = """
-        MATCH (n:Entity)
-        WHERE n.uuid IN $node_uuids
-        RETURN DISTINCT
-            n.uuid AS uuid,
-            split(n.name_embedding, ",") AS name_embedding
-        """
     else:
         query = """
         MATCH (n:Entity)
@@ -1916,22 +1980,13 @@ async def get_embeddings_for_nodes(
 async def get_embeddings_for_communities(
     driver: GraphDriver, communities: list[CommunityNode]
 ) -> dict[str, list[float]]:
-    if driver.provider == GraphProvider.NEPTUNE:
-        query = """
-        MATCH (c:Community)
-        WHERE c.uuid IN $community_uuids
-        RETURN DISTINCT
-            c.uuid AS uuid,
-            split(c.name_embedding, ",") AS name_embedding
-        """
-    else:
-        query = """
-        MATCH (c:Community)
-        WHERE c.uuid IN $community_uuids
-        RETURN DISTINCT
-            c.uuid AS uuid,
-            c.name_embedding AS name_embedding
-        """
+    query = """
+    MATCH (c:Community)
+    WHERE c.uuid IN $community_uuids
+    RETURN DISTINCT
+        c.uuid AS uuid,
+        c.name_embedding AS name_embedding
+    """
     results, _, _ = await driver.execute_query(
         query,
         community_uuids=[community.uuid for community in communities],
@@ -1953,14 +2008,6 @@ async def get_embeddings_for_edges(
 ) -> dict[str, list[float]]:
     if driver.graph_operations_interface:
         return await driver.graph_operations_interface.edge_load_embeddings_bulk(driver, edges)
-    elif driver.provider == GraphProvider.NEPTUNE:
-        query = """
-        MATCH (n:Entity)-[e:RELATES_TO]-(m:Entity)
-        WHERE e.uuid IN $edge_uuids
-        RETURN DISTINCT
-            e.uuid AS uuid,
-            split(e.fact_embedding, ",") AS fact_embedding
-        """
     else:
         match_query = """
             MATCH (n:Entity)-[e:RELATES_TO]-(m:Entity)
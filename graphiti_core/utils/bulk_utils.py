@@ -17,6 +17,7 @@ limitations under the License.
 import json
 import logging
 import typing
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
 from datetime import datetime
 
 import numpy as np
@@ -28,19 +29,34 @@ from graphiti_core.driver.driver import (
     GraphDriverSession,
     GraphProvider,
 )
-from graphiti_core.edges import Edge, EntityEdge, EpisodicEdge, create_entity_edge_embeddings
+from graphiti_core.edges import (
+    CommunityEdge,
+    Edge,
+    EntityEdge,
+    EpisodicEdge,
+    create_entity_edge_embeddings,
+)
 from graphiti_core.embedder import EmbedderClient
 from graphiti_core.graphiti_types import GraphitiClients
 from graphiti_core.helpers import normalize_l2, semaphore_gather
 from graphiti_core.models.edges.edge_db_queries import (
+    get_community_edge_save_bulk_query,
     get_entity_edge_save_bulk_query,
     get_episodic_edge_save_bulk_query,
 )
 from graphiti_core.models.nodes.node_db_queries import (
+    ENTITY_MENTION_COUNT_UPDATE,
+    get_community_node_save_bulk_query,
     get_entity_node_save_bulk_query,
     get_episode_node_save_bulk_query,
 )
-from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode
+from graphiti_core.nodes import (
+    CommunityNode,
+    EntityNode,
+    EpisodeType,
+    EpisodicNode,
+    create_community_node_embeddings,
+)
 from graphiti_core.utils.datetime_utils import convert_datetimes_to_strings
 from graphiti_core.utils.maintenance.dedup_helpers import (
     DedupResolutionState,
@@ -125,6 +141,35 @@ async def retrieve_previous_episodes_bulk(
     return episode_tuples
 
 
+async def iter_episode_chunks(
+    episodes: Iterable[RawEpisode] | AsyncIterable[RawEpisode], chunk_size: int = CHUNK_SIZE
+) -> AsyncIterator[list[RawEpisode]]:
+    """Group a (possibly async and unbounded) episode source into lists of at most chunk_size.
+
+    Only the chunk currently being filled is held in memory, so callers can stream arbitrarily
+    large backfills without materializing them.
+    """
+    if chunk_size < 1:
+        raise ValueError(f'chunk_size must be a positive integer, got {chunk_size}')
+
+    chunk: list[RawEpisode] = []
+    if isinstance(episodes, AsyncIterable):
+        async for episode in episodes:
+            chunk.append(episode)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    else:
+        for episode in episodes:
+            chunk.append(episode)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+
+    if chunk:
+        yield chunk
+
+
 async def add_nodes_and_edges_bulk(
     driver: GraphDriver,
     episodic_nodes: list[EpisodicNode],
@@ -220,6 +265,13 @@ async def add_nodes_and_edges_bulk_tx(
             None, driver, tx, [edge.model_dump() for edge in episodic_edges]
         )
         await driver.graph_operations_interface.edge_save_bulk(None, driver, tx, edges)
+        if driver.provider != GraphProvider.KUZU:
+            # The interface writes the MENTIONS edges with its own queries, which do not maintain
+            # the mention counts, so recount the mentioned entities
+            await tx.run(
+                ENTITY_MENTION_COUNT_UPDATE,
+                node_uuids=list({edge.target_node_uuid for edge in episodic_edges}),
+            )
 
     elif driver.provider == GraphProvider.KUZU:
         # FIXME: Kuzu's UNWIND does not currently support STRUCT[] type properly, so we insert the data one by one instead for now.
@@ -250,6 +302,74 @@ async def add_nodes_and_edges_bulk_tx(
             entity_edges=edges,
         )
 
+    if driver.provider == GraphProvider.NEPTUNE and driver.aoss_knn:  # pyright: ignore reportAttributeAccessIssue
+        # Similarity search reads the nearest neighbors from AOSS
+        await driver.save_to_aoss('node_name_and_summary', nodes)  # pyright: ignore reportAttributeAccessIssue
+        await driver.save_to_aoss('edge_name_and_fact', edges)  # pyright: ignore reportAttributeAccessIssue
+
+
+async def add_communities_bulk(
+    driver: GraphDriver,
+    community_nodes: list[CommunityNode],
+    community_edges: list[CommunityEdge],
+    embedder: EmbedderClient,
+):
+    """Save communities and their HAS_MEMBER edges with one query each.
+
+    Communities without a name embedding are embedded with a single batch call first. Kuzu
+    inserts the rows with COPY, so on Kuzu the communities and edges must be new.
+    """
+    await create_community_node_embeddings(
+        embedder, [node for node in community_nodes if node.name_embedding is None]
+    )
+
+    if driver.provider == GraphProvider.NEPTUNE and community_nodes:
+        await driver.save_to_aoss(  # pyright: ignore reportAttributeAccessIssue
+            'community_name',
+            [
+                {
+                    'name': node.name,
+                    'uuid': node.uuid,
+                    'group_id': node.group_id,
+                    'name_embedding': node.name_embedding,
+                }
+                for node in community_nodes
+            ],
+        )
+
+    session = driver.session()
+    try:
+        await session.execute_write(
+            add_communities_bulk_tx, community_nodes, community_edges, driver=driver
+        )
+    finally:
+        await session.close()
+
+
+async def add_communities_bulk_tx(
+    tx: GraphDriverSession,
+    community_nodes: list[CommunityNode],
+    community_edges: list[CommunityEdge],
+    driver: GraphDriver,
+):
+    communities = [
+        {
+            'uuid': node.uuid,
+            'name': node.name,
+            'group_id': node.group_id,
+            'summary': node.summary,
+            'created_at': node.created_at,
+            'name_embedding': node.name_embedding,
+        }
+        for node in community_nodes
+    ]
+    edges = [edge.model_dump() for edge in community_edges]
+
+    if communities:
+        await tx.run(get_community_node_save_bulk_query(driver.provider), communities=communities)
+    if edges:
+        await tx.run(get_community_edge_save_bulk_query(driver.provider), community_edges=edges)
+
 
 async def extract_nodes_and_edges_bulk(
     clients: GraphitiClients,
@@ -258,12 +378,14 @@ async def extract_nodes_and_edges_bulk(
     entity_types: dict[str, type[BaseModel]] | None = None,
     excluded_entity_types: list[str] | None = None,
     edge_types: dict[str, type[BaseModel]] | None = None,
+    max_coroutines: int | None = None,
 ) -> tuple[list[list[EntityNode]], list[list[EntityEdge]]]:
     extracted_nodes_bulk: list[list[EntityNode]] = await semaphore_gather(
         *[
             extract_nodes(clients, episode, previous_episodes, entity_types, excluded_entity_types)
             for episode, previous_episodes in episode_tuples
-        ]
+        ],
+        max_coroutines=max_coroutines,
     )
 
     extracted_edges_bulk: list[list[EntityEdge]] = await semaphore_gather(
@@ -278,7 +400,8 @@ async def extract_nodes_and_edges_bulk(
                 edge_types=edge_types,
             )
             for i, (episode, previous_episodes) in enumerate(episode_tuples)
-        ]
+        ],
+        max_coroutines=max_coroutines,
     )
 
     return extracted_nodes_bulk, extracted_edges_bulk
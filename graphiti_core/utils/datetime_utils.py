@@ -42,14 +42,36 @@ def ensure_utc(dt: datetime | None) -> datetime | None:
     return dt
 
 
+def _is_numeric_sequence(obj: list | tuple) -> bool:
+    # Exact type checks keep bools, which are ints, out of numeric sequences
+    return all(type(item) is float or type(item) is int for item in obj)
+
+
 def convert_datetimes_to_strings(obj):
-    if isinstance(obj, dict):
-        return {k: convert_datetimes_to_strings(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_datetimes_to_strings(item) for item in obj]
-    elif isinstance(obj, tuple):
-        return tuple(convert_datetimes_to_strings(item) for item in obj)
-    elif isinstance(obj, datetime):
+    """
+    Returns obj with every datetime replaced by its ISO string.
+
+    Only the containers that hold a datetime are copied, the others are returned as they are.
+    Sequences made only of numbers, such as embeddings, cannot hold a datetime and are returned
+    without walking their items.
+    """
+    if isinstance(obj, datetime):
         return obj.isoformat()
+    elif isinstance(obj, dict):
+        converted = None
+        for k, v in obj.items():
+            new_v = convert_datetimes_to_strings(v)
+            if new_v is not v:
+                if converted is None:
+                    converted = dict(obj)
+                converted[k] = new_v
+        return obj if converted is None else converted
+    elif isinstance(obj, list | tuple):
+        if not obj or _is_numeric_sequence(obj):
+            return obj
+        items = [convert_datetimes_to_strings(item) for item in obj]
+        if all(new is old for new, old in zip(items, obj, strict=True)):
+            return obj
+        return tuple(items) if isinstance(obj, tuple) else items
     else:
         return obj
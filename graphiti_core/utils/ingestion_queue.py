@@ -0,0 +1,399 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_RETRY_BACKOFF = 1.0
+DEFAULT_MAX_RETRY_BACKOFF = 300.0
+
+
+class QueuedJob(BaseModel):
+    id: int = Field(description='sequence number of the job, increasing in enqueue order')
+    group_id: str = Field(description='partition of the graph the job belongs to')
+    payload: dict[str, Any] = Field(description='JSON-serializable job arguments')
+    attempts: int = Field(description='number of previous failed attempts')
+    enqueued_at: datetime = Field(description='datetime the job was added to the queue')
+
+
+class DeadLetter(QueuedJob):
+    failed_at: datetime = Field(description='datetime the job was dead-lettered')
+    last_error: str | None = Field(description='error raised by the final attempt')
+
+
+class IngestionQueue(ABC):
+    """
+    A persistent, group-partitioned FIFO of ingestion jobs.
+
+    Jobs within a group are delivered one at a time in enqueue order: the next job of a group
+    is only claimable once the previous one has been acknowledged or dead-lettered. Delivery is
+    at-least-once, so a job that was claimed but never acknowledged (for example because the
+    process crashed) is delivered again after `recover`.
+    """
+
+    @abstractmethod
+    async def put(self, group_id: str, payload: dict[str, Any]) -> int:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def claim(self) -> QueuedJob | None:
+        """Claim the oldest runnable job of a group that has no job in progress."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def ack(self, job: QueuedJob) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def fail(self, job: QueuedJob, error: str) -> bool:
+        """Record a failed attempt. Returns True if the job will be retried."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def recover(self) -> int:
+        """Make jobs left in progress by a previous consumer claimable again."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def depths(self) -> dict[str, int]:
+        """Number of unacknowledged jobs per group."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def runnable_groups(self) -> int:
+        """Number of groups whose next job can be claimed now."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def dead_letters(self, group_id: str | None = None) -> list[DeadLetter]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def close(self) -> None:
+        raise NotImplementedError()
+
+
+# The first job of every group, if it is waiting and its retry backoff has elapsed. A group with
+# a job in progress has that job at its head, so it is never runnable.
+_RUNNABLE_HEADS = """
+    FROM ingestion_jobs AS j
+    JOIN (
+        SELECT group_id, MIN(id) AS head_id FROM ingestion_jobs GROUP BY group_id
+    ) AS heads ON j.id = heads.head_id
+    WHERE j.status = 'pending' AND j.available_at <= ?
+"""
+
+
+class SQLiteIngestionQueue(IngestionQueue):
+    """
+    SQLite implementation of `IngestionQueue`.
+
+    The database is opened in WAL mode and every state change is committed before the call
+    returns, so acknowledged `put`s survive a process crash or restart. The queue assumes a
+    single consuming process: `recover` returns every in-progress job to the queue.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+        max_retry_backoff: float = DEFAULT_MAX_RETRY_BACKOFF,
+    ):
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be at least 1')
+
+        self.path = path
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+
+        # Groups are claimed least-recently-served first so a busy group cannot starve others
+        self._last_claimed: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS ingestion_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                group_id TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                available_at REAL NOT NULL,
+                enqueued_at REAL NOT NULL,
+                last_error TEXT
+            );
+            CREATE INDEX IF NOT EXISTS ingestion_jobs_group_id ON ingestion_jobs (group_id, id);
+            CREATE TABLE IF NOT EXISTS ingestion_dead_letters (
+                id INTEGER PRIMARY KEY,
+                group_id TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                attempts INTEGER NOT NULL,
+                enqueued_at REAL NOT NULL,
+                failed_at REAL NOT NULL,
+                last_error TEXT
+            );
+            """
+        )
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        def locked():
+            with self._lock:
+                return func(*args)
+
+        return await asyncio.to_thread(locked)
+
+    def _put(self, group_id: str, payload: dict[str, Any]) -> int:
+        now = time.time()
+        cursor = self._conn.execute(
+            """
+            INSERT INTO ingestion_jobs (group_id, payload, available_at, enqueued_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            (group_id, json.dumps(payload), now, now),
+        )
+        return cursor.lastrowid or 0
+
+    def _claim(self) -> QueuedJob | None:
+        self._conn.execute('BEGIN IMMEDIATE')
+        try:
+            rows = self._conn.execute(
+                f'SELECT j.id, j.group_id, j.payload, j.attempts, j.enqueued_at {_RUNNABLE_HEADS}',
+                (time.time(),),
+            ).fetchall()
+            if not rows:
+                self._conn.execute('COMMIT')
+                return None
+
+            job_id, group_id, payload, attempts, enqueued_at = min(
+                rows, key=lambda row: (self._last_claimed.get(row[1], 0.0), row[0])
+            )
+            self._conn.execute(
+                "UPDATE ingestion_jobs SET status = 'processing' WHERE id = ?", (job_id,)
+            )
+            self._conn.execute('COMMIT')
+        except BaseException:
+            self._conn.execute('ROLLBACK')
+            raise
+
+        self._last_claimed[group_id] = time.monotonic()
+        return QueuedJob(
+            id=job_id,
+            group_id=group_id,
+            payload=json.loads(payload),
+            attempts=attempts,
+            enqueued_at=datetime.fromtimestamp(enqueued_at, timezone.utc),
+        )
+
+    def _ack(self, job_id: int):
+        self._conn.execute('DELETE FROM ingestion_jobs WHERE id = ?', (job_id,))
+
+    def _fail(self, job_id: int, error: str) -> bool:
+        self._conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = self._conn.execute(
+                'SELECT attempts FROM ingestion_jobs WHERE id = ?', (job_id,)
+            ).fetchone()
+            if row is None:
+                self._conn.execute('COMMIT')
+                return False
+
+            attempts = row[0] + 1
+            retry = attempts < self.max_attempts
+            if retry:
+                backoff = min(self.max_retry_backoff, self.retry_backoff * 2 ** (attempts - 1))
+                self._conn.execute(
+                    """
+                    UPDATE ingestion_jobs
+                    SET status = 'pending', attempts = ?, available_at = ?, last_error = ?
+                    WHERE id = ?
+                    """,
+                    (attempts, time.time() + backoff, error, job_id),
+                )
+            else:
+                self._conn.execute(
+                    """
+                    INSERT INTO ingestion_dead_letters
+                        (id, group_id, payload, attempts, enqueued_at, failed_at, last_error)
+                    SELECT id, group_id, payload, ?, enqueued_at, ?, ?
+                    FROM ingestion_jobs WHERE id = ?
+                    """,
+                    (attempts, time.time(), error, job_id),
+                )
+                self._conn.execute('DELETE FROM ingestion_jobs WHERE id = ?', (job_id,))
+            self._conn.execute('COMMIT')
+        except BaseException:
+            self._conn.execute('ROLLBACK')
+            raise
+
+        return retry
+
+    def _recover(self) -> int:
+        cursor = self._conn.execute(
+            "UPDATE ingestion_jobs SET status = 'pending' WHERE status = 'processing'"
+        )
+        return cursor.rowcount
+
+    def _depths(self) -> dict[str, int]:
+        rows = self._conn.execute(
+            'SELECT group_id, COUNT(*) FROM ingestion_jobs GROUP BY group_id'
+        ).fetchall()
+        return {group_id: count for group_id, count in rows}
+
+    def _runnable_groups(self) -> int:
+        row = self._conn.execute(f'SELECT COUNT(*) {_RUNNABLE_HEADS}', (time.time(),)).fetchone()
+        return row[0]
+
+    def _dead_letters(self, group_id: str | None) -> list[DeadLetter]:
+        rows = self._conn.execute(
+            """
+            SELECT id, group_id, payload, attempts, enqueued_at, failed_at, last_error
+            FROM ingestion_dead_letters
+            WHERE ? IS NULL OR group_id = ?
+            ORDER BY id
+            """,
+            (group_id, group_id),
+        ).fetchall()
+        return [
+            DeadLetter(
+                id=row[0],
+                group_id=row[1],
+                payload=json.loads(row[2]),
+                attempts=row[3],
+                enqueued_at=datetime.fromtimestamp(row[4], timezone.utc),
+                failed_at=datetime.fromtimestamp(row[5], timezone.utc),
+                last_error=row[6],
+            )
+            for row in rows
+        ]
+
+    async def put(self, group_id: str, payload: dict[str, Any]) -> int:
+        return await self._run(self._put, group_id, payload)
+
+    async def claim(self) -> QueuedJob | None:
+        return await self._run(self._claim)
+
+    async def ack(self, job: QueuedJob) -> None:
+        await self._run(self._ack, job.id)
+
+    async def fail(self, job: QueuedJob, error: str) -> bool:
+        return await self._run(self._fail, job.id, error)
+
+    async def recover(self) -> int:
+        return await self._run(self._recover)
+
+    async def depths(self) -> dict[str, int]:
+        return await self._run(self._depths)
+
+    async def runnable_groups(self) -> int:
+        return await self._run(self._runnable_groups)
+
+    async def dead_letters(self, group_id: str | None = None) -> list[DeadLetter]:
+        return await self._run(self._dead_letters, group_id)
+
+    async def close(self) -> None:
+        await self._run(self._conn.close)
+
+
+class IngestionWorkerPool:
+    """
+    Runs `concurrency` workers that claim jobs from an `IngestionQueue` and pass them to
+    `handler`. Jobs are acknowledged when the handler returns and retried or dead-lettered
+    when it raises. Jobs interrupted by `stop` are redelivered after the next `start`.
+    """
+
+    def __init__(
+        self,
+        queue: IngestionQueue,
+        handler: Callable[[QueuedJob], Awaitable[None]],
+        concurrency: int = 1,
+        poll_interval: float = 1.0,
+    ):
+        if concurrency < 1:
+            raise ValueError('concurrency must be at least 1')
+
+        self.queue = queue
+        self.handler = handler
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.tasks: list[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self.tasks)
+
+    async def put(self, group_id: str, payload: dict[str, Any]) -> int:
+        job_id = await self.queue.put(group_id, payload)
+        self._wakeup.set()
+        return job_id
+
+    async def worker(self):
+        # asyncio.wait_for can swallow a cancellation on Python < 3.12, so also check a flag
+        while not self._stopping:
+            self._wakeup.clear()
+            job = await self.queue.claim()
+            if job is None:
+                # Wait for new work, or poll again for retries whose backoff has elapsed
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                continue
+
+            try:
+                await self.handler(job)
+            except Exception as e:
+                retry = await self.queue.fail(job, repr(e))
+                logger.error(
+                    f'Ingestion job {job.id} for group {job.group_id} failed on attempt '
+                    f'{job.attempts + 1} ({"will retry" if retry else "dead-lettered"}): {e}'
+                )
+            else:
+                await self.queue.ack(job)
+
+            # The next job of the group may now be claimable by an idle worker
+            self._wakeup.set()
+
+    async def start(self):
+        recovered = await self.queue.recover()
+        if recovered:
+            logger.info(f'Recovered {recovered} interrupted ingestion jobs')
+        self._stopping = False
+        self.tasks = [asyncio.create_task(self.worker()) for _ in range(self.concurrency)]
+
+    async def stop(self):
+        self._stopping = True
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
@@ -1,5 +1,5 @@
 from .edge_operations import build_episodic_edges, extract_edges
-from .graph_data_operations import clear_data, retrieve_episodes
+from .graph_data_operations import backfill_mention_counts, clear_data, retrieve_episodes
 from .node_operations import extract_nodes
 
 __all__ = [
@@ -7,5 +7,6 @@ __all__ = [
     'build_episodic_edges',
     'extract_nodes',
     'clear_data',
+    'backfill_mention_counts',
     'retrieve_episodes',
 ]
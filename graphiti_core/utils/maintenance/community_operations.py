@@ -1,12 +1,18 @@
 import asyncio
 import logging
-from collections import defaultdict
+from collections import defaultdict, deque
+from collections.abc import Callable
+from enum import Enum
+from typing import Any
 
+import numpy as np
+from numpy.typing import NDArray
 from pydantic import BaseModel
 
 from graphiti_core.driver.driver import GraphDriver, GraphProvider
 from graphiti_core.edges import CommunityEdge
 from graphiti_core.embedder import EmbedderClient
+from graphiti_core.embedder.client import estimate_tokens
 from graphiti_core.helpers import semaphore_gather
 from graphiti_core.llm_client import LLMClient
 from graphiti_core.models.nodes.node_db_queries import COMMUNITY_NODE_RETURN
@@ -17,118 +23,396 @@ from graphiti_core.utils.datetime_utils import utc_now
 from graphiti_core.utils.maintenance.edge_operations import build_community_edges
 
 MAX_COMMUNITY_BUILD_CONCURRENCY = 10
+# Source entities per projection query for groups too large to project at once
+PROJECTION_PAGE_SIZE = 10_000
+MAX_LABEL_PROPAGATION_ITERATIONS = 100
+MAX_LOUVAIN_LEVELS = 20
+# Minimum Jaccard similarity of members for an incremental build to keep a community
+DEFAULT_MEMBERSHIP_SIMILARITY_THRESHOLD = 0.9
+# Seconds community updates are collected before they are applied together
+DEFAULT_COMMUNITY_UPDATE_WINDOW = 5.0
+# Estimated tokens of member summaries per community summarization call
+COMMUNITY_SUMMARY_TOKEN_BUDGET = 4000
+MAX_SUMMARIES_PER_CALL = 32
+MAX_COMMUNITY_SUMMARY_CALLS = 16
 
 logger = logging.getLogger(__name__)
 
 
+class CommunityDetectionAlgorithm(Enum):
+    label_propagation = 'label_propagation'
+    louvain = 'louvain'
+
+
 class Neighbor(BaseModel):
     node_uuid: str
     edge_count: int
 
 
+async def get_community_projection(
+    driver: GraphDriver, group_id: str, page_size: int = PROJECTION_PAGE_SIZE
+) -> dict[str, list[Neighbor]]:
+    """Return every entity of the group with its neighbors in the group and their edge counts.
+
+    The projection is read as an aggregated (n.uuid, m.uuid, count) edge list. Groups with more
+    than page_size entities are read in pages of page_size source entities.
+    """
+    records, _, _ = await driver.execute_query(
+        """
+        MATCH (n:Entity {group_id: $group_id})
+        RETURN n.uuid AS uuid
+        ORDER BY n.uuid DESC
+        """,
+        group_id=group_id,
+        routing_='r',
+    )
+
+    projection: dict[str, list[Neighbor]] = {record['uuid']: [] for record in records}
+    if not projection:
+        return projection
+
+    match_query = """
+        MATCH (n:Entity {group_id: $group_id})-[e:RELATES_TO]-(m:Entity {group_id: $group_id})
+    """
+    if driver.provider == GraphProvider.KUZU:
+        match_query = """
+        MATCH (n:Entity {group_id: $group_id})-[:RELATES_TO]-(e:RelatesToNode_)-[:RELATES_TO]-(m:Entity {group_id: $group_id})
+        """
+
+    uuids = list(projection.keys())
+    pages = (
+        [None]
+        if len(uuids) <= page_size
+        else [uuids[i : i + page_size] for i in range(0, len(uuids), page_size)]
+    )
+    for page in pages:
+        page_query = '' if page is None else 'WHERE n.uuid IN $uuids'
+        records, _, _ = await driver.execute_query(
+            match_query
+            + page_query
+            + """
+            WITH n.uuid AS source_uuid, m.uuid AS target_uuid, count(e) AS count
+            RETURN
+                source_uuid,
+                target_uuid,
+                count
+            """,
+            group_id=group_id,
+            uuids=page,
+            routing_='r',
+        )
+
+        for record in records:
+            neighbors = projection.get(record['source_uuid'])
+            if neighbors is not None and record['target_uuid'] in projection:
+                neighbors.append(
+                    Neighbor(node_uuid=record['target_uuid'], edge_count=record['count'])
+                )
+
+    return projection
+
+
+async def get_entity_group_ids(driver: GraphDriver) -> list[str]:
+    group_id_values, _, _ = await driver.execute_query(
+        """
+        MATCH (n:Entity)
+        WHERE n.group_id IS NOT NULL
+        RETURN
+            collect(DISTINCT n.group_id) AS group_ids
+        """
+    )
+
+    return group_id_values[0]['group_ids'] if group_id_values else []
+
+
 async def get_community_clusters(
-    driver: GraphDriver, group_ids: list[str] | None
+    driver: GraphDriver,
+    group_ids: list[str] | None,
+    algorithm: CommunityDetectionAlgorithm = CommunityDetectionAlgorithm.label_propagation,
+    resolution: float = 1.0,
+    max_community_size: int | None = None,
 ) -> list[list[EntityNode]]:
+    """Cluster the entities of every group, with the members of each cluster ranked by degree."""
     community_clusters: list[list[EntityNode]] = []
 
     if group_ids is None:
-        group_id_values, _, _ = await driver.execute_query(
-            """
-            MATCH (n:Entity)
-            WHERE n.group_id IS NOT NULL
-            RETURN
-                collect(DISTINCT n.group_id) AS group_ids
-            """
-        )
-
-        group_ids = group_id_values[0]['group_ids'] if group_id_values else []
+        group_ids = await get_entity_group_ids(driver)
 
     for group_id in group_ids:
-        projection: dict[str, list[Neighbor]] = {}
+        projection = await get_community_projection(driver, group_id)
+        if not projection:
+            continue
+
+        cluster_uuids = detect_communities(
+            projection, algorithm, resolution=resolution, max_community_size=max_community_size
+        )
+
+        # Hydrate the members of every cluster with a single query
         nodes = await EntityNode.get_by_group_ids(driver, [group_id])
-        for node in nodes:
-            match_query = """
-                MATCH (n:Entity {group_id: $group_id, uuid: $uuid})-[e:RELATES_TO]-(m: Entity {group_id: $group_id})
-            """
-            if driver.provider == GraphProvider.KUZU:
-                match_query = """
-                MATCH (n:Entity {group_id: $group_id, uuid: $uuid})-[:RELATES_TO]-(e:RelatesToNode_)-[:RELATES_TO]-(m: Entity {group_id: $group_id})
-                """
-            records, _, _ = await driver.execute_query(
-                match_query
-                + """
-                WITH count(e) AS count, m.uuid AS uuid
-                RETURN
-                    uuid,
-                    count
-                """,
-                uuid=node.uuid,
-                group_id=group_id,
-            )
+        nodes_by_uuid = {node.uuid: node for node in nodes}
+        degrees = {
+            uuid: sum(neighbor.edge_count for neighbor in neighbors)
+            for uuid, neighbors in projection.items()
+        }
+        for cluster in cluster_uuids:
+            ranked_cluster = sorted(cluster, key=lambda uuid: -degrees[uuid])
+            members = [nodes_by_uuid[uuid] for uuid in ranked_cluster if uuid in nodes_by_uuid]
+            if members:
+                community_clusters.append(members)
 
-            projection[node.uuid] = [
-                Neighbor(node_uuid=record['uuid'], edge_count=record['count']) for record in records
-            ]
+    return community_clusters
 
-        cluster_uuids = label_propagation(projection)
 
-        community_clusters.extend(
-            list(
-                await semaphore_gather(
-                    *[EntityNode.get_by_uuids(driver, cluster) for cluster in cluster_uuids]
-                )
-            )
-        )
+def build_csr_adjacency(
+    projection: dict[str, list[Neighbor]],
+) -> tuple[list[str], NDArray[np.int64], NDArray[np.int64], NDArray[np.float64]]:
+    """Map the projection to integer node ids and CSR (indptr, indices, weights) arrays.
 
-    return community_clusters
+    Node ids follow the order of the projection. Neighbors that are not in the projection are
+    dropped.
+    """
+    uuids = list(projection.keys())
+    node_ids = {uuid: i for i, uuid in enumerate(uuids)}
+
+    indptr = np.zeros(len(uuids) + 1, dtype=np.int64)
+    indices: list[int] = []
+    weights: list[int] = []
+    for i, neighbors in enumerate(projection.values()):
+        for neighbor in neighbors:
+            neighbor_id = node_ids.get(neighbor.node_uuid)
+            if neighbor_id is not None:
+                indices.append(neighbor_id)
+                weights.append(neighbor.edge_count)
+        indptr[i + 1] = len(indices)
+
+    return (
+        uuids,
+        indptr,
+        np.asarray(indices, dtype=np.int64),
+        np.asarray(weights, dtype=np.float64),
+    )
 
 
-def label_propagation(projection: dict[str, list[Neighbor]]) -> list[list[str]]:
+def label_propagation(
+    projection: dict[str, list[Neighbor]],
+    max_iterations: int = MAX_LABEL_PROPAGATION_ITERATIONS,
+    tolerance: float = 0.0,
+) -> list[list[str]]:
     # Implement the label propagation community detection algorithm.
     # 1. Start with each node being assigned its own community
     # 2. Each node will take on the community of the plurality of its neighbors
-    # 3. Ties are broken by going to the largest community
-    # 4. Continue until no communities change during propagation
-
-    community_map = {uuid: i for i, uuid in enumerate(projection.keys())}
+    # 3. Ties are broken by going to the largest community id, so results are deterministic for
+    #    a given projection order
+    # 4. Continue until the fraction of nodes that change community is at most tolerance, or
+    #    max_iterations rounds have run, since synchronous updates can oscillate
+    uuids, indptr, indices, weights = build_csr_adjacency(projection)
+    num_nodes = len(uuids)
+    if num_nodes == 0:
+        return []
+
+    rows = np.repeat(np.arange(num_nodes, dtype=np.int64), np.diff(indptr))
+    has_neighbors = np.diff(indptr) > 0
+    labels = np.arange(num_nodes, dtype=np.int64)
+
+    for _ in range(max_iterations):
+        new_labels = labels.copy()
+        if len(indices) > 0:
+            # Total edge count of every (node, neighbor community) pair
+            pair_keys, pair_index = np.unique(
+                rows * num_nodes + labels[indices], return_inverse=True
+            )
+            pair_weights = np.bincount(pair_index, weights=weights)
+            pair_rows = pair_keys // num_nodes
+            pair_labels = pair_keys % num_nodes
+
+            # The last pair of every node after sorting by (node, weight, community) is its
+            # plurality community
+            order = np.lexsort((pair_labels, pair_weights, pair_rows))
+            pair_rows = pair_rows[order]
+            is_last = np.r_[pair_rows[1:] != pair_rows[:-1], True]
+            best_rows = pair_rows[is_last]
+            best_labels = pair_labels[order][is_last]
+            best_weights = pair_weights[order][is_last]
+
+            new_labels[best_rows] = np.where(
+                best_weights > 1, best_labels, np.maximum(best_labels, labels[best_rows])
+            )
 
-    while True:
-        no_change = True
-        new_community_map: dict[str, int] = {}
+        changed = int(np.count_nonzero(new_labels[has_neighbors] != labels[has_neighbors]))
+        labels = new_labels
+        if changed <= tolerance * num_nodes:
+            break
+    else:
+        logger.warning(f'label propagation did not converge after {max_iterations} iterations')
 
-        for uuid, neighbors in projection.items():
-            curr_community = community_map[uuid]
+    community_cluster_map: dict[int, list[str]] = defaultdict(list)
+    for uuid, community in zip(uuids, labels.tolist(), strict=True):
+        community_cluster_map[community].append(uuid)
 
-            community_candidates: dict[int, int] = defaultdict(int)
-            for neighbor in neighbors:
-                community_candidates[community_map[neighbor.node_uuid]] += neighbor.edge_count
-            community_lst = [
-                (count, community) for community, count in community_candidates.items()
-            ]
+    clusters = [cluster for cluster in community_cluster_map.values()]
+    return clusters
 
-            community_lst.sort(reverse=True)
-            candidate_rank, community_candidate = community_lst[0] if community_lst else (0, -1)
-            if community_candidate != -1 and candidate_rank > 1:
-                new_community = community_candidate
-            else:
-                new_community = max(community_candidate, curr_community)
 
-            new_community_map[uuid] = new_community
+def _aggregate_csr(
+    indptr: NDArray[np.int64],
+    indices: NDArray[np.int64],
+    weights: NDArray[np.float64],
+    labels: NDArray[np.int64],
+    num_communities: int,
+) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.float64]]:
+    """Collapse every community into a single node, summing the weights between communities."""
+    rows = np.repeat(np.arange(len(indptr) - 1, dtype=np.int64), np.diff(indptr))
+    pair_keys, pair_index = np.unique(
+        labels[rows] * num_communities + labels[indices], return_inverse=True
+    )
+    pair_weights = np.bincount(pair_index, weights=weights)
+    pair_rows = pair_keys // num_communities
+
+    new_indptr = np.zeros(num_communities + 1, dtype=np.int64)
+    np.cumsum(np.bincount(pair_rows, minlength=num_communities), out=new_indptr[1:])
+    return (
+        new_indptr,
+        (pair_keys % num_communities).astype(np.int64),
+        np.asarray(pair_weights, dtype=np.float64),
+    )
 
-            if new_community != curr_community:
-                no_change = False
 
-        if no_change:
-            break
+def _louvain_local_moves(
+    indptr: NDArray[np.int64],
+    indices: NDArray[np.int64],
+    weights: NDArray[np.float64],
+    node_sizes: NDArray[np.int64],
+    total_weight: float,
+    resolution: float,
+    max_community_size: int | None,
+) -> tuple[NDArray[np.int64], bool]:
+    num_nodes = len(indptr) - 1
+    degrees = np.bincount(
+        np.repeat(np.arange(num_nodes), np.diff(indptr)), weights=weights, minlength=num_nodes
+    )
 
-        community_map = new_community_map
+    # Moves are sequential, so the loop runs on plain lists, which beat NumPy calls on the
+    # handful of neighbors each node has
+    indptr_list: list[int] = indptr.tolist()
+    indices_list: list[int] = indices.tolist()
+    weights_list: list[float] = weights.tolist()
+    degrees_list: list[float] = degrees.tolist()
+    sizes_list: list[int] = node_sizes.tolist()
+    labels = list(range(num_nodes))
+    community_degrees = list(degrees_list)
+    community_sizes = list(sizes_list)
+    max_size = max_community_size if max_community_size is not None else sum(sizes_list)
+
+    # Nodes are revisited only after a neighbor changes community, as in fast local moving
+    queue = deque(range(num_nodes))
+    queued = [True] * num_nodes
+    moved = False
+    while queue:
+        node = queue.popleft()
+        queued[node] = False
+        current = labels[node]
+        degree = degrees_list[node]
+        size = sizes_list[node]
+        scale = resolution * degree / total_weight
+
+        links: dict[int, float] = {}
+        for position in range(indptr_list[node], indptr_list[node + 1]):
+            neighbor = indices_list[position]
+            if neighbor != node:
+                community = labels[neighbor]
+                links[community] = links.get(community, 0.0) + weights_list[position]
+
+        # Take the node out of its community, then move it to the neighboring community with the
+        # largest modularity gain. Ties keep the node where it is, otherwise go to the smallest
+        # community id.
+        community_degrees[current] -= degree
+        community_sizes[current] -= size
+
+        best = current
+        best_gain = links.get(current, 0.0) - community_degrees[current] * scale
+        for community in sorted(links):
+            if community == current or community_sizes[community] + size > max_size:
+                continue
+            gain = links[community] - community_degrees[community] * scale
+            if gain > best_gain + 1e-12:
+                best = community
+                best_gain = gain
+
+        labels[node] = best
+        community_degrees[best] += degree
+        community_sizes[best] += size
+        if best != current:
+            moved = True
+            for position in range(indptr_list[node], indptr_list[node + 1]):
+                neighbor = indices_list[position]
+                if not queued[neighbor] and labels[neighbor] != best:
+                    queued[neighbor] = True
+                    queue.append(neighbor)
+
+    return np.asarray(labels, dtype=np.int64), moved
+
+
+def louvain(
+    projection: dict[str, list[Neighbor]],
+    resolution: float = 1.0,
+    max_community_size: int | None = None,
+    max_levels: int = MAX_LOUVAIN_LEVELS,
+) -> list[list[str]]:
+    """Detect communities by greedily maximizing modularity with the Louvain method.
+
+    Every level moves nodes one at a time, starting in projection order, to the neighboring
+    community with the largest modularity gain until no move improves it, and then collapses each
+    community into a single node for the next level. Higher resolutions favor smaller communities. Moves that
+    would grow a community beyond max_community_size entities are never made.
+    """
+    if resolution <= 0:
+        raise ValueError('resolution must be positive')
+    if max_community_size is not None and max_community_size < 1:
+        raise ValueError('max_community_size must be at least 1')
+
+    uuids, indptr, indices, weights = build_csr_adjacency(projection)
+    num_nodes = len(uuids)
+    if num_nodes == 0:
+        return []
+
+    total_weight = float(weights.sum())
+    # Community of every entity, and number of entities in every node of the current level
+    membership = np.arange(num_nodes, dtype=np.int64)
+    node_sizes = np.ones(num_nodes, dtype=np.int64)
+
+    if total_weight > 0:
+        for _ in range(max_levels):
+            labels, moved = _louvain_local_moves(
+                indptr, indices, weights, node_sizes, total_weight, resolution, max_community_size
+            )
+            if not moved:
+                break
+
+            _, labels = np.unique(labels, return_inverse=True)
+            num_communities = int(labels.max()) + 1
+            membership = labels[membership]
+            node_sizes = np.bincount(labels, weights=node_sizes).astype(np.int64)
+            indptr, indices, weights = _aggregate_csr(
+                indptr, indices, weights, labels, num_communities
+            )
 
-    community_cluster_map = defaultdict(list)
-    for uuid, community in community_map.items():
+    community_cluster_map: dict[int, list[str]] = defaultdict(list)
+    for uuid, community in zip(uuids, membership.tolist(), strict=True):
         community_cluster_map[community].append(uuid)
 
-    clusters = [cluster for cluster in community_cluster_map.values()]
-    return clusters
+    return list(community_cluster_map.values())
+
+
+def detect_communities(
+    projection: dict[str, list[Neighbor]],
+    algorithm: CommunityDetectionAlgorithm = CommunityDetectionAlgorithm.label_propagation,
+    resolution: float = 1.0,
+    max_community_size: int | None = None,
+) -> list[list[str]]:
+    if algorithm == CommunityDetectionAlgorithm.louvain:
+        return louvain(projection, resolution=resolution, max_community_size=max_community_size)
+
+    return label_propagation(projection)
 
 
 async def summarize_pair(llm_client: LLMClient, summary_pair: tuple[str, str]) -> str:
@@ -164,32 +448,99 @@ async def generate_summary_description(llm_client: LLMClient, summary: str) -> s
     return description
 
 
-async def build_community(
-    llm_client: LLMClient, community_cluster: list[EntityNode]
-) -> tuple[CommunityNode, list[CommunityEdge]]:
-    summaries = [entity.summary for entity in community_cluster]
-    length = len(summaries)
-    while length > 1:
-        odd_one_out: str | None = None
-        if length % 2 == 1:
-            odd_one_out = summaries.pop()
-            length -= 1
-        new_summaries: list[str] = list(
-            await semaphore_gather(
-                *[
-                    summarize_pair(llm_client, (str(left_summary), str(right_summary)))
-                    for left_summary, right_summary in zip(
-                        summaries[: int(length / 2)], summaries[int(length / 2) :], strict=False
-                    )
-                ]
-            )
+def pack_summaries(
+    summaries: list[str],
+    token_budget: int = COMMUNITY_SUMMARY_TOKEN_BUDGET,
+    max_summaries_per_call: int = MAX_SUMMARIES_PER_CALL,
+) -> list[list[str]]:
+    """Split summaries, in order, into groups that each fit in one summarization call."""
+    if max_summaries_per_call < 2:
+        raise ValueError('max_summaries_per_call must be at least 2')
+
+    groups: list[list[str]] = []
+    group: list[str] = []
+    group_tokens = 0
+    for summary in summaries:
+        tokens = estimate_tokens(summary)
+        # A group always takes at least two summaries, so that every round reduces them
+        if len(group) > 1 and (
+            group_tokens + tokens > token_budget or len(group) >= max_summaries_per_call
+        ):
+            groups.append(group)
+            group = []
+            group_tokens = 0
+        group.append(summary)
+        group_tokens += tokens
+
+    if group:
+        groups.append(group)
+
+    return groups
+
+
+async def summarize_many(llm_client: LLMClient, summaries: list[str]) -> str:
+    if len(summaries) == 1:
+        return summaries[0]
+
+    context = {
+        'node_summaries': [{'summary': summary} for summary in summaries],
+    }
+
+    llm_response = await llm_client.generate_response(
+        prompt_library.summarize_nodes.summarize_many(context),
+        response_model=Summary,
+        prompt_name='summarize_nodes.summarize_many',
+    )
+
+    return llm_response.get('summary', '')
+
+
+async def reduce_summaries(
+    llm_client: LLMClient,
+    summaries: list[str],
+    token_budget: int = COMMUNITY_SUMMARY_TOKEN_BUDGET,
+    max_summaries_per_call: int = MAX_SUMMARIES_PER_CALL,
+    max_calls: int = MAX_COMMUNITY_SUMMARY_CALLS,
+) -> str:
+    """Reduce summaries to one with k-ary map-reduce rounds of at most max_calls LLM calls in total.
+
+    Every round packs as many summaries as fit in token_budget into each call. When the remaining
+    calls cannot cover a round, the summaries at the end are dropped, so summaries should be
+    ordered from the most to the least important.
+    """
+    if max_calls < 1:
+        raise ValueError('max_calls must be at least 1')
+
+    summaries = [summary for summary in summaries if summary]
+    calls = 0
+    while len(summaries) > 1:
+        groups = pack_summaries(summaries, token_budget, max_summaries_per_call)
+        if len(groups) > 1:
+            # Keep one call for the final reduction
+            groups = groups[: max(max_calls - calls - 1, 1)]
+
+        summaries = list(
+            await semaphore_gather(*[summarize_many(llm_client, group) for group in groups])
         )
-        if odd_one_out is not None:
-            new_summaries.append(odd_one_out)
-        summaries = new_summaries
-        length = len(summaries)
+        calls += sum(1 for group in groups if len(group) > 1)
+
+    return summaries[0] if summaries else ''
 
-    summary = summaries[0]
+
+async def build_community(
+    llm_client: LLMClient,
+    community_cluster: list[EntityNode],
+    token_budget: int = COMMUNITY_SUMMARY_TOKEN_BUDGET,
+    max_summary_calls: int = MAX_COMMUNITY_SUMMARY_CALLS,
+) -> tuple[CommunityNode, list[CommunityEdge]]:
+    # Clusters from get_community_clusters are ranked by degree, so very large clusters are
+    # summarized from their most connected entities
+    summary = await reduce_summaries(
+        llm_client,
+        [entity.summary for entity in community_cluster],
+        token_budget=token_budget,
+        max_calls=max_summary_calls,
+    )
     name = await generate_summary_description(llm_client, summary)
     now = utc_now()
     community_node = CommunityNode(
@@ -210,8 +561,13 @@ async def build_communities(
     driver: GraphDriver,
     llm_client: LLMClient,
     group_ids: list[str] | None,
+    algorithm: CommunityDetectionAlgorithm = CommunityDetectionAlgorithm.label_propagation,
+    resolution: float = 1.0,
+    max_community_size: int | None = None,
 ) -> tuple[list[CommunityNode], list[CommunityEdge]]:
-    community_clusters = await get_community_clusters(driver, group_ids)
+    community_clusters = await get_community_clusters(
+        driver, group_ids, algorithm, resolution, max_community_size
+    )
 
     semaphore = asyncio.Semaphore(MAX_COMMUNITY_BUILD_CONCURRENCY)
 
@@ -234,12 +590,166 @@ async def build_communities(
     return community_nodes, community_edges
 
 
-async def remove_communities(driver: GraphDriver):
+def match_community_clusters(
+    clusters: list[set[str]],
+    memberships: dict[str, set[str]],
+    similarity_threshold: float = DEFAULT_MEMBERSHIP_SIMILARITY_THRESHOLD,
+) -> dict[int, str]:
+    """Match new clusters to existing communities by the Jaccard similarity of their members.
+
+    Pairs are matched greedily from the most similar, so every cluster and every community is used
+    at most once, and only pairs with a similarity of at least similarity_threshold are matched.
+    Returns the uuid of the matched community by cluster index.
+    """
+    member_communities: dict[str, list[str]] = defaultdict(list)
+    for community_uuid, members in memberships.items():
+        for member_uuid in members:
+            member_communities[member_uuid].append(community_uuid)
+
+    candidates: list[tuple[float, int, str]] = []
+    for cluster_index, cluster in enumerate(clusters):
+        overlapping = {
+            community_uuid
+            for member_uuid in cluster
+            for community_uuid in member_communities.get(member_uuid, [])
+        }
+        for community_uuid in overlapping:
+            members = memberships[community_uuid]
+            similarity = len(cluster & members) / len(cluster | members)
+            if similarity >= similarity_threshold:
+                candidates.append((similarity, cluster_index, community_uuid))
+
+    candidates.sort(key=lambda candidate: (-candidate[0], candidate[1], candidate[2]))
+
+    matches: dict[int, str] = {}
+    matched_communities: set[str] = set()
+    for _, cluster_index, community_uuid in candidates:
+        if cluster_index in matches or community_uuid in matched_communities:
+            continue
+        matches[cluster_index] = community_uuid
+        matched_communities.add(community_uuid)
+
+    return matches
+
+
+async def build_communities_incremental(
+    driver: GraphDriver,
+    llm_client: LLMClient,
+    group_ids: list[str] | None,
+    algorithm: CommunityDetectionAlgorithm = CommunityDetectionAlgorithm.label_propagation,
+    resolution: float = 1.0,
+    max_community_size: int | None = None,
+    similarity_threshold: float = DEFAULT_MEMBERSHIP_SIMILARITY_THRESHOLD,
+) -> tuple[list[CommunityNode], list[CommunityEdge]]:
+    """Rebuild the communities of the groups, re-summarizing only clusters that changed.
+
+    Clusters whose members match an existing community with a Jaccard similarity of at least
+    similarity_threshold keep that community and its summary, and only their HAS_MEMBER edges are
+    updated. Every other cluster gets a new community, and existing communities that match no
+    cluster are deleted. The obsolete communities and member edges are deleted here with one query
+    each. Returns the new communities and the new member edges, which still have to be saved.
+    """
+    if group_ids is None:
+        group_ids = await get_entity_group_ids(driver)
+
+    community_clusters = await get_community_clusters(
+        driver, group_ids, algorithm, resolution, max_community_size
+    )
+    existing_communities: list[CommunityNode] = await CommunityNode.get_by_group_ids(
+        driver, group_ids
+    )
+    existing_edges: list[CommunityEdge] = await CommunityEdge.get_by_group_ids(driver, group_ids)
+
+    communities_by_uuid = {community.uuid: community for community in existing_communities}
+    member_edges: dict[str, dict[str, CommunityEdge]] = defaultdict(dict)
+    for edge in existing_edges:
+        # Communities can also have communities as members, which no cluster contains
+        if (
+            edge.source_node_uuid in communities_by_uuid
+            and edge.target_node_uuid not in communities_by_uuid
+        ):
+            member_edges[edge.source_node_uuid][edge.target_node_uuid] = edge
+
+    matches = match_community_clusters(
+        [{entity.uuid for entity in cluster} for cluster in community_clusters],
+        {
+            community_uuid: set(member_edges.get(community_uuid, {}))
+            for community_uuid in communities_by_uuid
+        },
+        similarity_threshold,
+    )
+
+    semaphore = asyncio.Semaphore(MAX_COMMUNITY_BUILD_CONCURRENCY)
+
+    async def limited_build_community(cluster):
+        async with semaphore:
+            return await build_community(llm_client, cluster)
+
+    changed_clusters = [cluster for i, cluster in enumerate(community_clusters) if i not in matches]
+    communities: list[tuple[CommunityNode, list[CommunityEdge]]] = list(
+        await semaphore_gather(*[limited_build_community(cluster) for cluster in changed_clusters])
+    )
+
+    community_nodes: list[CommunityNode] = []
+    community_edges: list[CommunityEdge] = []
+    for community in communities:
+        community_nodes.append(community[0])
+        community_edges.extend(community[1])
+
+    # Update the members of the communities that are kept
+    now = utc_now()
+    removed_edge_uuids: list[str] = []
+    for cluster_index, community_uuid in matches.items():
+        cluster = community_clusters[cluster_index]
+        members = member_edges.get(community_uuid, {})
+        cluster_uuids = {entity.uuid for entity in cluster}
+        added_members = [entity for entity in cluster if entity.uuid not in members]
+        if added_members:
+            community_edges.extend(
+                build_community_edges(added_members, communities_by_uuid[community_uuid], now)
+            )
+        removed_edge_uuids.extend(
+            edge.uuid for member_uuid, edge in members.items() if member_uuid not in cluster_uuids
+        )
+
+    kept_community_uuids = set(matches.values())
+    obsolete_community_uuids = [
+        community_uuid
+        for community_uuid in communities_by_uuid
+        if community_uuid not in kept_community_uuids
+    ]
+
+    if obsolete_community_uuids:
+        await CommunityNode.delete_by_uuids(driver, obsolete_community_uuids)
+    if removed_edge_uuids:
+        await CommunityEdge.delete_by_uuids(driver, removed_edge_uuids)
+
+    logger.info(
+        f'Incremental community build kept {len(matches)} communities, '
+        f'created {len(community_nodes)} and removed {len(obsolete_community_uuids)}'
+    )
+
+    return community_nodes, community_edges
+
+
+async def remove_communities(driver: GraphDriver, group_ids: list[str] | None = None):
+    """Delete the communities of the given groups, or of every group if group_ids is None."""
+    if group_ids is None:
+        await driver.execute_query(
+            """
+            MATCH (c:Community)
+            DETACH DELETE c
+            """
+        )
+        return
+
     await driver.execute_query(
         """
         MATCH (c:Community)
+        WHERE c.group_id IN $group_ids
         DETACH DELETE c
-        """
+        """,
+        group_ids=group_ids,
     )
 
 
@@ -329,3 +839,257 @@ async def update_community(
     await community.save(driver)
 
     return [community], community_edges
+
+
+async def determine_entity_communities(
+    driver: GraphDriver, entities: list[EntityNode]
+) -> dict[str, tuple[CommunityNode, bool]]:
+    """Bulk version of determine_entity_community, keyed by entity uuid.
+
+    Entities with no community of their own and no neighbors in a community are left out.
+    """
+    entity_uuids = [entity.uuid for entity in entities]
+    if not entity_uuids:
+        return {}
+
+    records, _, _ = await driver.execute_query(
+        """
+        MATCH (c:Community)-[:HAS_MEMBER]->(n:Entity)
+        WHERE n.uuid IN $entity_uuids
+        RETURN
+            n.uuid AS entity_uuid,
+        """
+        + COMMUNITY_NODE_RETURN,
+        entity_uuids=entity_uuids,
+        routing_='r',
+    )
+
+    entity_communities: dict[str, tuple[CommunityNode, bool]] = {}
+    for record in records:
+        if record['entity_uuid'] not in entity_communities:
+            entity_communities[record['entity_uuid']] = (
+                get_community_node_from_record(record),
+                False,
+            )
+
+    # Entities without a community join the mode community of their neighbors
+    unassigned_uuids = [uuid for uuid in entity_uuids if uuid not in entity_communities]
+    if not unassigned_uuids:
+        return entity_communities
+
+    match_query = """
+        MATCH (c:Community)-[:HAS_MEMBER]->(m:Entity)-[:RELATES_TO]-(n:Entity)
+    """
+    if driver.provider == GraphProvider.KUZU:
+        match_query = """
+        MATCH (c:Community)-[:HAS_MEMBER]->(m:Entity)-[:RELATES_TO]-(e:RelatesToNode_)-[:RELATES_TO]-(n:Entity)
+        """
+    records, _, _ = await driver.execute_query(
+        match_query
+        + """
+        WHERE n.uuid IN $entity_uuids
+        RETURN
+            n.uuid AS entity_uuid,
+        """
+        + COMMUNITY_NODE_RETURN,
+        entity_uuids=unassigned_uuids,
+        routing_='r',
+    )
+
+    neighbor_communities: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    communities_by_uuid: dict[str, CommunityNode] = {}
+    for record in records:
+        community = get_community_node_from_record(record)
+        communities_by_uuid.setdefault(community.uuid, community)
+        neighbor_communities[record['entity_uuid']][community.uuid] += 1
+
+    for entity_uuid, community_counts in neighbor_communities.items():
+        # max keeps the first community with the highest count, as determine_entity_community does
+        community_uuid = max(community_counts, key=lambda uuid: community_counts[uuid])
+        entity_communities[entity_uuid] = (communities_by_uuid[community_uuid], True)
+
+    return entity_communities
+
+
+async def update_communities_bulk(
+    driver: GraphDriver,
+    llm_client: LLMClient,
+    embedder: EmbedderClient,
+    entities: list[EntityNode],
+) -> tuple[list[CommunityNode], list[CommunityEdge]]:
+    """Add the summaries of the entities to their communities with one summarization per community.
+
+    Unlike calling update_community for every entity, entities of the same community are folded
+    into its summary together, so a community is summarized, embedded and saved only once.
+    """
+    # The latest version of an entity wins
+    entities = list({entity.uuid: entity for entity in entities}.values())
+    entity_communities = await determine_entity_communities(driver, entities)
+
+    communities_by_uuid: dict[str, CommunityNode] = {}
+    members_by_community: dict[str, list[tuple[EntityNode, bool]]] = defaultdict(list)
+    for entity in entities:
+        entity_community = entity_communities.get(entity.uuid)
+        if entity_community is None:
+            continue
+        community, is_new = entity_community
+        communities_by_uuid.setdefault(community.uuid, community)
+        members_by_community[community.uuid].append((entity, is_new))
+
+    async def update(
+        community: CommunityNode, members: list[tuple[EntityNode, bool]]
+    ) -> list[CommunityEdge]:
+        community.summary = await reduce_summaries(
+            llm_client, [community.summary] + [entity.summary for entity, _ in members]
+        )
+        community.name = await generate_summary_description(llm_client, community.summary)
+
+        new_members = [entity for entity, is_new in members if is_new]
+        community_edges = (
+            build_community_edges(new_members, community, utc_now()) if new_members else []
+        )
+
+        await community.generate_name_embedding(embedder)
+        await community.save(driver)
+        await semaphore_gather(*[edge.save(driver) for edge in community_edges])
+
+        return community_edges
+
+    results: list[list[CommunityEdge]] = list(
+        await semaphore_gather(
+            *[
+                update(communities_by_uuid[community_uuid], members)
+                for community_uuid, members in members_by_community.items()
+            ],
+            max_coroutines=MAX_COMMUNITY_BUILD_CONCURRENCY,
+        )
+    )
+
+    return list(communities_by_uuid.values()), [edge for edges in results for edge in edges]
+
+
+class CommunityUpdateBatcher:
+    """Debounces community updates across episodes and applies them in batches.
+
+    Entities added with add() are collected per group and applied with update_communities_bulk window
+    seconds after the first pending addition, so every community is summarized at most once per
+    window however many of its members were touched. Flushes never overlap, which keeps
+    concurrent episodes from racing on the same community. Call close() to apply pending updates
+    before shutting down.
+    """
+
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        embedder: EmbedderClient,
+        window: float = DEFAULT_COMMUNITY_UPDATE_WINDOW,
+        on_flush: Callable[[list[str]], Any] | None = None,
+    ):
+        if window < 0:
+            raise ValueError('window must not be negative')
+
+        self.llm_client = llm_client
+        self.embedder = embedder
+        self.window = window
+        self.on_flush = on_flush
+        self._pending: dict[str, tuple[GraphDriver, dict[str, EntityNode]]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._lock = asyncio.Lock()
+
+    @property
+    def pending_count(self) -> int:
+        return sum(len(entities) for _, entities in self._pending.values())
+
+    def add(self, driver: GraphDriver, entities: list[EntityNode]):
+        """Queue community updates for the entities, using driver to apply them."""
+        for entity in entities:
+            _, pending_entities = self._pending.setdefault(entity.group_id, (driver, {}))
+            pending_entities[entity.uuid] = entity
+
+        if self._pending and self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.window, self._start_flush)
+
+    def _start_flush(self):
+        self._timer = None
+        task = asyncio.create_task(self._flush_in_background())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush_in_background(self):
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f'Error applying community updates: {e}')
+
+    async def flush(self) -> tuple[list[CommunityNode], list[CommunityEdge]]:
+        """Apply every pending community update now.
+
+        Groups are updated one at a time. The updates of a group that fails, and of the groups not
+        reached yet if the flush is cancelled, are queued again for the next window, and the first
+        error is raised once the remaining groups have been updated.
+        """
+        async with self._lock:
+            pending, self._pending = self._pending, {}
+            if not pending:
+                return [], []
+
+            community_nodes: list[CommunityNode] = []
+            community_edges: list[CommunityEdge] = []
+            attempted: list[str] = []
+            applied: set[str] = set()
+            errors: list[Exception] = []
+            try:
+                for group_id, (driver, entities) in pending.items():
+                    attempted.append(group_id)
+                    try:
+                        nodes, edges = await update_communities_bulk(
+                            driver, self.llm_client, self.embedder, list(entities.values())
+                        )
+                    except Exception as e:
+                        logger.error(f'Error applying community updates of group {group_id}: {e}')
+                        errors.append(e)
+                        continue
+                    applied.add(group_id)
+                    community_nodes.extend(nodes)
+                    community_edges.extend(edges)
+            finally:
+                self._requeue(
+                    {
+                        group_id: group_pending
+                        for group_id, group_pending in pending.items()
+                        if group_id not in applied
+                    }
+                )
+                if self.on_flush is not None and attempted:
+                    self.on_flush(attempted)
+
+            if errors:
+                raise errors[0]
+
+            return community_nodes, community_edges
+
+    def _requeue(self, pending: dict[str, tuple[GraphDriver, dict[str, EntityNode]]]):
+        # Entities added since the flush started are newer than the requeued ones and win
+        for group_id, (driver, entities) in pending.items():
+            newer_driver, newer_entities = self._pending.get(group_id, (driver, {}))
+            self._pending[group_id] = (newer_driver, {**entities, **newer_entities})
+
+        if self._pending and self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.window, self._start_flush)
+
+    async def close(self):
+        """Apply the pending updates and wait for background flushes to finish."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        try:
+            await self.flush()
+            if self._tasks:
+                await asyncio.gather(*self._tasks)
+        finally:
+            # Updates that failed stay pending, but nothing retries them after closing
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
@@ -21,12 +21,14 @@ from typing_extensions import LiteralString
 
 from graphiti_core.driver.driver import GraphDriver, GraphProvider
 from graphiti_core.models.nodes.node_db_queries import (
+    ENTITY_MENTION_COUNT_UPDATE,
     EPISODIC_NODE_RETURN,
     EPISODIC_NODE_RETURN_NEPTUNE,
 )
 from graphiti_core.nodes import EpisodeType, EpisodicNode, get_episodic_node_from_record
 
 EPISODE_WINDOW_LEN = 3
+MENTION_COUNT_BACKFILL_BATCH_SIZE = 1000
 
 logger = logging.getLogger(__name__)
 
@@ -118,3 +120,53 @@ async def retrieve_episodes(
 
     episodes = [get_episodic_node_from_record(record) for record in result]
     return list(reversed(episodes))  # Return in chronological order
+
+
+async def backfill_mention_counts(
+    driver: GraphDriver,
+    group_ids: list[str] | None = None,
+    batch_size: int = MENTION_COUNT_BACKFILL_BATCH_SIZE,
+) -> int:
+    """
+    Count the MENTIONS edges of entities that were saved before mention counts were maintained.
+
+    New MENTIONS edges only increment counts that already exist, so entities without a count keep
+    falling back to aggregating their MENTIONS edges at query time until they are backfilled.
+
+    Args:
+        driver (GraphDriver): The graph driver instance.
+        group_ids (list[str], optional): The group ids to backfill, all groups if not provided.
+        batch_size (int, optional): The number of entities recounted per query.
+
+    Returns:
+        int: The number of entities that were backfilled.
+    """
+    # Kuzu has no mention_count column, its mention counts are aggregated at query time
+    if driver.provider == GraphProvider.KUZU:
+        return 0
+
+    group_filter = ''
+    query_params: dict = {}
+    if group_ids:
+        group_filter = ' AND n.group_id IN $group_ids'
+        query_params['group_ids'] = group_ids
+
+    backfilled = 0
+    while True:
+        records, _, _ = await driver.execute_query(
+            f"""
+            MATCH (n:Entity)
+            WHERE n.mention_count IS NULL{group_filter}
+            RETURN n.uuid AS uuid
+            LIMIT $limit
+            """,
+            limit=batch_size,
+            **query_params,
+        )
+        if not records:
+            return backfilled
+
+        await driver.execute_query(
+            ENTITY_MENTION_COUNT_UPDATE, node_uuids=[record['uuid'] for record in records]
+        )
+        backfilled += len(records)
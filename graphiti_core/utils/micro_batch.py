@@ -0,0 +1,146 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_BATCH_WAIT = 0.005
+
+
+@dataclass
+class _BatchRequest(Generic[T]):
+    items: list[T]
+    future: Future = field(default_factory=Future)
+
+
+class MicroBatchWorker(Generic[T, R]):
+    """Runs a batch function on a dedicated thread, merging concurrent submissions into batches.
+
+    The worker collects submitted items until it has batch_size of them or batch_wait seconds have
+    passed since the first one, calls process once for the whole batch and hands every submitter
+    its own slice of the results. This suits models that are much cheaper per item in large
+    batches and that should not compete with the default executor, such as local transformers.
+    """
+
+    def __init__(
+        self,
+        process: Callable[[list[T]], list[R]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_wait: float = DEFAULT_BATCH_WAIT,
+        initializer: Callable[[], Any] | None = None,
+        name: str = 'micro-batch',
+    ):
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
+
+        self.process = process
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.initializer = initializer
+        self.name = name
+        self._requests: queue.Queue[_BatchRequest[T] | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start the worker thread. submit() starts it on first use."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+
+    async def submit(self, items: list[T]) -> list[R]:
+        if not items:
+            return []
+
+        self.start()
+        request: _BatchRequest[T] = _BatchRequest(items=items)
+        self._requests.put(request)
+        return await asyncio.wrap_future(request.future)
+
+    def close(self):
+        """Stop the worker thread once the submitted items have been processed."""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None:
+            self._requests.put(None)
+            thread.join()
+
+    def _run(self):
+        if self.initializer is not None:
+            try:
+                self.initializer()
+            except Exception as e:
+                logger.error(f'Error initializing {self.name} worker: {e}')
+
+        stopping = False
+        while not stopping:
+            request = self._requests.get()
+            if request is None:
+                break
+
+            batch = [request]
+            num_items = len(request.items)
+            deadline = time.monotonic() + self.batch_wait
+            while num_items < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    request = self._requests.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if request is None:
+                    stopping = True
+                    break
+                batch.append(request)
+                num_items += len(request.items)
+
+            self._process_batch(batch)
+
+    def _process_batch(self, batch: list[_BatchRequest[T]]):
+        # Skip requests whose callers were cancelled while queued
+        batch = [request for request in batch if request.future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        items = [item for request in batch for item in request.items]
+        try:
+            results = self.process(items)
+        except Exception as e:
+            logger.error(f'Error in {self.name} batch of {len(items)} items: {e}')
+            for request in batch:
+                request.future.set_exception(e)
+            return
+
+        offset = 0
+        for request in batch:
+            request.future.set_result(list(results[offset : offset + len(request.items)]))
+            offset += len(request.items)
@@ -226,6 +226,17 @@ class GraphitiAppConfig(BaseModel):
             self.episode_id_prefix = ''
 
 
+class QueueConfig(BaseModel):
+    """Durable episode queue configuration."""
+
+    path: str = Field(default='graphiti_queue.db', description='SQLite queue database path')
+    workers: int = Field(default=10, description='Number of groups processed in parallel')
+    max_attempts: int = Field(default=5, description='Attempts before an episode is dead-lettered')
+    retry_backoff: float = Field(
+        default=1.0, description='Initial retry delay in seconds, doubled on every attempt'
+    )
+
+
 class GraphitiConfig(BaseSettings):
     """Graphiti configuration with YAML and environment support."""
 
@@ -234,6 +245,7 @@ class GraphitiConfig(BaseSettings):
     embedder: EmbedderConfig = Field(default_factory=EmbedderConfig)
     database: DatabaseConfig = Field(default_factory=DatabaseConfig)
     graphiti: GraphitiAppConfig = Field(default_factory=GraphitiAppConfig)
+    queue: QueueConfig = Field(default_factory=QueueConfig)
 
     # Additional server options
     destroy_graph: bool = Field(default=False, description='Clear graph on startup')
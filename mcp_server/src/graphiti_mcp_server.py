@@ -391,7 +391,6 @@ async def add_memory(
             content=episode_body,
             source_description=source_description,
             episode_type=episode_type,
-            entity_types=graphiti_service.entity_types,
             uuid=uuid or None,  # Ensure None is passed if uuid is None
         )
 
@@ -885,7 +884,7 @@ async def initialize_server() -> ServerConfig:
 
     # Initialize services
     graphiti_service = GraphitiService(config, SEMAPHORE_LIMIT)
-    queue_service = QueueService()
+    queue_service = QueueService(config.queue)
     await graphiti_service.initialize()
 
     # Set global client for backward compatibility
@@ -893,7 +892,7 @@ async def initialize_server() -> ServerConfig:
     semaphore = graphiti_service.semaphore
 
     # Initialize queue service with the client
-    await queue_service.initialize(graphiti_client)
+    await queue_service.initialize(graphiti_client, graphiti_service.entity_types)
 
     # Set MCP server settings
     if config.server.host:
@@ -910,43 +909,49 @@ async def run_mcp_server():
     # Initialize the server
     mcp_config = await initialize_server()
 
-    # Run the server with configured transport
-    logger.info(f'Starting MCP server with transport: {mcp_config.transport}')
-    if mcp_config.transport == 'stdio':
-        await mcp.run_stdio_async()
-    elif mcp_config.transport == 'sse':
-        logger.info(
-            f'Running MCP server with SSE transport on {mcp.settings.host}:{mcp.settings.port}'
-        )
-        logger.info(f'Access the server at: http://{mcp.settings.host}:{mcp.settings.port}/sse')
-        await mcp.run_sse_async()
-    elif mcp_config.transport == 'http':
-        # Use localhost for display if binding to 0.0.0.0
-        display_host = 'localhost' if mcp.settings.host == '0.0.0.0' else mcp.settings.host
-        logger.info(
-            f'Running MCP server with streamable HTTP transport on {mcp.settings.host}:{mcp.settings.port}'
-        )
-        logger.info('=' * 60)
-        logger.info('MCP Server Access Information:')
-        logger.info(f'  Base URL: http://{display_host}:{mcp.settings.port}/')
-        logger.info(f'  MCP Endpoint: http://{display_host}:{mcp.settings.port}/mcp/')
-        logger.info('  Transport: HTTP (streamable)')
-
-        # Show FalkorDB Browser UI access if enabled
-        if os.environ.get('BROWSER', '1') == '1':
-            logger.info(f'  FalkorDB Browser UI: http://{display_host}:3000/')
-
-        logger.info('=' * 60)
-        logger.info('For MCP clients, connect to the /mcp/ endpoint above')
-
-        # Configure uvicorn logging to match our format
-        configure_uvicorn_logging()
-
-        await mcp.run_streamable_http_async()
-    else:
-        raise ValueError(
-            f'Unsupported transport: {mcp_config.transport}. Use "sse", "stdio", or "http"'
-        )
+    try:
+        # Run the server with configured transport
+        logger.info(f'Starting MCP server with transport: {mcp_config.transport}')
+        if mcp_config.transport == 'stdio':
+            await mcp.run_stdio_async()
+        elif mcp_config.transport == 'sse':
+            logger.info(
+                f'Running MCP server with SSE transport on {mcp.settings.host}:{mcp.settings.port}'
+            )
+            logger.info(f'Access the server at: http://{mcp.settings.host}:{mcp.settings.port}/sse')
+            await mcp.run_sse_async()
+        elif mcp_config.transport == 'http':
+            # Use localhost for display if binding to 0.0.0.0
+            display_host = 'localhost' if mcp.settings.host == '0.0.0.0' else mcp.settings.host
+            logger.info(
+                f'Running MCP server with streamable HTTP transport on {mcp.settings.host}:{mcp.settings.port}'
+            )
+            logger.info('=' * 60)
+            logger.info('MCP Server Access Information:')
+            logger.info(f'  Base URL: http://{display_host}:{mcp.settings.port}/')
+            logger.info(f'  MCP Endpoint: http://{display_host}:{mcp.settings.port}/mcp/')
+            logger.info('  Transport: HTTP (streamable)')
+
+            # Show FalkorDB Browser UI access if enabled
+            if os.environ.get('BROWSER', '1') == '1':
+                logger.info(f'  FalkorDB Browser UI: http://{display_host}:3000/')
+
+            logger.info('=' * 60)
+            logger.info('For MCP clients, connect to the /mcp/ endpoint above')
+
+            # Configure uvicorn logging to match our format
+            configure_uvicorn_logging()
+
+            await mcp.run_streamable_http_async()
+        else:
+            raise ValueError(
+                f'Unsupported transport: {mcp_config.transport}. Use "sse", "stdio", or "http"'
+            )
+    finally:
+        # Stop the queue workers and close the queue database, unprocessed episodes are
+        # resumed on the next start
+        if queue_service is not None:
+            await queue_service.close()
 
 
 def main():
@@ -1,102 +1,79 @@
 """Queue service for managing episode processing."""
 
-import asyncio
 import logging
-from collections.abc import Awaitable, Callable
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Any
 
+from graphiti_core.nodes import EpisodeType
+from graphiti_core.utils.datetime_utils import utc_now
+from graphiti_core.utils.ingestion_queue import (
+    IngestionQueue,
+    IngestionWorkerPool,
+    QueuedJob,
+    SQLiteIngestionQueue,
+)
+
+from config.schema import QueueConfig
+
 logger = logging.getLogger(__name__)
 
 
 class QueueService:
-    """Service for managing sequential episode processing queues by group_id."""
+    """Service for durable, sequential episode processing by group_id.
 
-    def __init__(self):
+    Episodes are persisted to a SQLite queue before they are acknowledged. Episodes within a
+    group are processed one at a time in the order they were added, failed episodes are retried
+    with exponential backoff and dead-lettered once they run out of attempts, and episodes that
+    were interrupted by a restart are processed again when the service is initialized.
+    """
+
+    def __init__(self, config: QueueConfig | None = None):
         """Initialize the queue service."""
-        # Dictionary to store queues for each group_id
-        self._episode_queues: dict[str, asyncio.Queue] = {}
-        # Dictionary to track if a worker is running for each group_id
-        self._queue_workers: dict[str, bool] = {}
-        # Store the graphiti client after initialization
+        self._config = config or QueueConfig()
+        self._queue: IngestionQueue | None = None
+        self._pool: IngestionWorkerPool | None = None
+        # Store the graphiti client and entity types after initialization
         self._graphiti_client: Any = None
+        self._entity_types: Any = None
 
-    async def add_episode_task(
-        self, group_id: str, process_func: Callable[[], Awaitable[None]]
-    ) -> int:
-        """Add an episode processing task to the queue.
-
-        Args:
-            group_id: The group ID for the episode
-            process_func: The async function to process the episode
-
-        Returns:
-            The position in the queue
-        """
-        # Initialize queue for this group_id if it doesn't exist
-        if group_id not in self._episode_queues:
-            self._episode_queues[group_id] = asyncio.Queue()
-
-        # Add the episode processing function to the queue
-        await self._episode_queues[group_id].put(process_func)
-
-        # Start a worker for this queue if one isn't already running
-        if not self._queue_workers.get(group_id, False):
-            asyncio.create_task(self._process_episode_queue(group_id))
-
-        return self._episode_queues[group_id].qsize()
-
-    async def _process_episode_queue(self, group_id: str) -> None:
-        """Process episodes for a specific group_id sequentially.
-
-        This function runs as a long-lived task that processes episodes
-        from the queue one at a time.
-        """
-        logger.info(f'Starting episode queue worker for group_id: {group_id}')
-        self._queue_workers[group_id] = True
-
-        try:
-            while True:
-                # Get the next episode processing function from the queue
-                # This will wait if the queue is empty
-                process_func = await self._episode_queues[group_id].get()
-
-                try:
-                    # Process the episode
-                    await process_func()
-                except Exception as e:
-                    logger.error(
-                        f'Error processing queued episode for group_id {group_id}: {str(e)}'
-                    )
-                finally:
-                    # Mark the task as done regardless of success/failure
-                    self._episode_queues[group_id].task_done()
-        except asyncio.CancelledError:
-            logger.info(f'Episode queue worker for group_id {group_id} was cancelled')
-        except Exception as e:
-            logger.error(f'Unexpected error in queue worker for group_id {group_id}: {str(e)}')
-        finally:
-            self._queue_workers[group_id] = False
-            logger.info(f'Stopped episode queue worker for group_id: {group_id}')
-
-    def get_queue_size(self, group_id: str) -> int:
-        """Get the current queue size for a group_id."""
-        if group_id not in self._episode_queues:
+    async def get_queue_size(self, group_id: str) -> int:
+        """Get the number of unprocessed episodes for a group_id."""
+        if self._queue is None:
             return 0
-        return self._episode_queues[group_id].qsize()
+        return (await self._queue.depths()).get(group_id, 0)
 
-    def is_worker_running(self, group_id: str) -> bool:
-        """Check if a worker is running for a group_id."""
-        return self._queue_workers.get(group_id, False)
+    def is_worker_running(self) -> bool:
+        """Check if the queue workers are running."""
+        return self._pool is not None and self._pool.running
 
-    async def initialize(self, graphiti_client: Any) -> None:
-        """Initialize the queue service with a graphiti client.
+    async def initialize(self, graphiti_client: Any, entity_types: Any = None) -> None:
+        """Initialize the queue service with a graphiti client and start processing.
 
         Args:
             graphiti_client: The graphiti client instance to use for processing episodes
+            entity_types: Entity types for extraction
         """
         self._graphiti_client = graphiti_client
-        logger.info('Queue service initialized with graphiti client')
+        self._entity_types = entity_types
+        self._queue = SQLiteIngestionQueue(
+            self._config.path,
+            max_attempts=self._config.max_attempts,
+            retry_backoff=self._config.retry_backoff,
+        )
+        self._pool = IngestionWorkerPool(
+            self._queue, self._process_episode, concurrency=self._config.workers
+        )
+        await self._pool.start()
+        logger.info(f'Queue service initialized with graphiti client (queue: {self._config.path})')
+
+    async def close(self) -> None:
+        """Stop processing. Unprocessed episodes are resumed on the next initialize()."""
+        if self._pool is not None:
+            await self._pool.stop()
+        if self._queue is not None:
+            await self._queue.close()
+        self._pool = None
+        self._queue = None
 
     async def add_episode(
         self,
@@ -104,8 +81,7 @@ class QueueService:
         name: str,
         content: str,
         source_description: str,
-        episode_type: Any,
-        entity_types: Any,
+        episode_type: EpisodeType,
         uuid: str | None,
     ) -> int:
         """Add an episode for processing.
@@ -116,37 +92,49 @@ class QueueService:
             content: Episode content
             source_description: Description of the episode source
             episode_type: Type of the episode
-            entity_types: Entity types for extraction
             uuid: Episode UUID
 
         Returns:
             The position in the queue
         """
-        if self._graphiti_client is None:
+        if self._pool is None or self._queue is None:
             raise RuntimeError('Queue service not initialized. Call initialize() first.')
 
-        async def process_episode():
-            """Process the episode using the graphiti client."""
-            try:
-                logger.info(f'Processing episode {uuid} for group {group_id}')
-
-                # Process the episode using the graphiti client
-                await self._graphiti_client.add_episode(
-                    name=name,
-                    episode_body=content,
-                    source_description=source_description,
-                    source=episode_type,
-                    group_id=group_id,
-                    reference_time=datetime.now(timezone.utc),
-                    entity_types=entity_types,
-                    uuid=uuid,
-                )
-
-                logger.info(f'Successfully processed episode {uuid} for group {group_id}')
-
-            except Exception as e:
-                logger.error(f'Failed to process episode {uuid} for group {group_id}: {str(e)}')
-                raise
-
-        # Use the existing add_episode_task method to queue the processing
-        return await self.add_episode_task(group_id, process_episode)
+        await self._pool.put(
+            group_id,
+            {
+                'name': name,
+                'content': content,
+                'source_description': source_description,
+                'source': episode_type.value,
+                'uuid': uuid,
+                'reference_time': utc_now().isoformat(),
+            },
+        )
+        return await self.get_queue_size(group_id)
+
+    async def _process_episode(self, job: QueuedJob) -> None:
+        """Process a queued episode using the graphiti client."""
+        payload = job.payload
+        uuid = payload['uuid']
+        group_id = job.group_id
+
+        try:
+            logger.info(f'Processing episode {uuid} for group {group_id}')
+
+            await self._graphiti_client.add_episode(
+                name=payload['name'],
+                episode_body=payload['content'],
+                source_description=payload['source_description'],
+                source=EpisodeType(payload['source']),
+                group_id=group_id,
+                reference_time=datetime.fromisoformat(payload['reference_time']),
+                entity_types=self._entity_types,
+                uuid=uuid,
+            )
+
+            logger.info(f'Successfully processed episode {uuid} for group {group_id}')
+
+        except Exception as e:
+            logger.error(f'Failed to process episode {uuid} for group {group_id}: {str(e)}')
+            raise
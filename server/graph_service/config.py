@@ -23,6 +23,10 @@ class Settings(BaseSettings):
     neo4j_user: str
     neo4j_password: str
     graphiti_api_key: str | None = Field(None)
+    ingest_worker_concurrency: int = Field(4, ge=1)
+    ingest_queue_path: str = 'ingest_queue.db'
+    ingest_max_attempts: int = Field(5, ge=1)
+    ingest_retry_backoff: float = Field(1.0, ge=0)
 
     model_config = SettingsConfigDict(env_file='.env', extra='ignore')
 
@@ -3,6 +3,8 @@ from .ingest import (
     AddEntityNodeRequest,
     AddMessagesRequest,
     BuildCommunitiesRequest,
+    GroupQueueMetrics,
+    IngestQueueMetrics,
     SearchNodeRequest,
     UpdateEntityNodeRequest,
 )
@@ -24,6 +26,8 @@ __all__ = [
     'AddMessagesRequest',
     'AddEntityNodeRequest',
     'BuildCommunitiesRequest',
+    'GroupQueueMetrics',
+    'IngestQueueMetrics',
     'SearchNodeRequest',
     'UpdateEntityNodeRequest',
     'SearchResults',
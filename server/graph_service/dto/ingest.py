@@ -30,3 +30,24 @@ class UpdateEntityNodeRequest(BaseModel):
     summary: str | None = Field(None, description='The new summary of the node')
     labels: list[str] | None = Field(None, description='The new labels of the node')
     attributes: dict | None = Field(None, description='The new attributes of the node')
+
+
+class GroupQueueMetrics(BaseModel):
+    queue_depth: int = Field(default=0, description='Jobs waiting to be processed for the group')
+    in_flight: int = Field(default=0, description='Jobs currently being processed for the group')
+    processed: int = Field(default=0, description='Jobs that completed successfully')
+    failed: int = Field(default=0, description='Attempts that raised an exception')
+    dead_lettered: int = Field(default=0, description='Jobs that ran out of retry attempts')
+    avg_wait_ms: float = Field(default=0.0, description='Mean time a job spent in the queue')
+    avg_process_ms: float = Field(default=0.0, description='Mean time spent running a job')
+    max_process_ms: float = Field(default=0.0, description='Longest time spent running a job')
+
+
+class IngestQueueMetrics(BaseModel):
+    concurrency: int = Field(..., description='Number of workers processing ingestion jobs')
+    runnable_groups: int = Field(
+        ..., description='Groups whose next job can be claimed by a worker now'
+    )
+    groups: dict[str, GroupQueueMetrics] = Field(
+        default_factory=dict, description='Queue metrics keyed by group id'
+    )
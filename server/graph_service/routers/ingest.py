@@ -1,48 +1,164 @@
-import asyncio
+import logging
+import time
+from collections import Counter, defaultdict
 from contextlib import asynccontextmanager
-from functools import partial
 
 from fastapi import APIRouter, FastAPI, status
 from graphiti_core.nodes import EpisodeType  # type: ignore
 from graphiti_core.utils.bulk_utils import RawEpisode
+from graphiti_core.utils.ingestion_queue import (
+    IngestionQueue,
+    IngestionWorkerPool,
+    QueuedJob,
+    SQLiteIngestionQueue,
+)
 from graphiti_core.utils.maintenance.graph_data_operations import clear_data  # type: ignore
 
+from graph_service.config import Settings, get_settings
 from graph_service.dto import (
     AddEntityNodeRequest,
     AddMessagesRequest,
     BuildCommunitiesRequest,
     EntityNodeResult,
+    GroupQueueMetrics,
+    IngestQueueMetrics,
     Message,
     Result,
     SearchNodeRequest,
     UpdateEntityNodeRequest,
 )
-from graph_service.zep_graphiti import ZepGraphitiDep, get_entity_node_result_from_node
+from graph_service.zep_graphiti import (
+    ZepGraphiti,
+    ZepGraphitiDep,
+    create_graphiti,
+    get_entity_node_result_from_node,
+)
 
+logger = logging.getLogger(__name__)
 
-class AsyncWorker:
+
+class GroupQueueStats:
     def __init__(self):
-        self.queue = asyncio.Queue()
-        self.task = None
+        self.in_flight = 0
+        self.processed = 0
+        self.failed = 0
+        self.total_wait = 0.0
+        self.total_process = 0.0
+        self.max_process = 0.0
+
+    def record(self, wait: float, duration: float, success: bool):
+        if success:
+            self.processed += 1
+        else:
+            self.failed += 1
+        self.total_wait += wait
+        self.total_process += duration
+        self.max_process = max(self.max_process, duration)
+
+    def to_metrics(self, queue_depth: int, dead_lettered: int) -> GroupQueueMetrics:
+        completed = self.processed + self.failed
+        return GroupQueueMetrics(
+            queue_depth=queue_depth,
+            in_flight=self.in_flight,
+            processed=self.processed,
+            failed=self.failed,
+            dead_lettered=dead_lettered,
+            avg_wait_ms=self.total_wait / completed * 1000 if completed else 0.0,
+            avg_process_ms=self.total_process / completed * 1000 if completed else 0.0,
+            max_process_ms=self.max_process * 1000,
+        )
+
+
+async def add_message(graphiti: ZepGraphiti, group_id: str, m: Message):
+    await graphiti.add_episode(
+        uuid=m.uuid,
+        group_id=group_id,
+        name=m.name,
+        episode_body=f'{m.role or ""}({m.role_type}): {m.content}',
+        reference_time=m.timestamp,
+        source=EpisodeType.message,
+        source_description=m.source_description,
+    )
+
+
+class AsyncWorker:
+    """
+    Durable, sharded worker pool for ingestion jobs.
 
-    async def worker(self):
-        while True:
-            try:
-                print(f'Got a job: (size of remaining queue: {self.queue.qsize()})')
-                job = await self.queue.get()
-                await job()
-            except asyncio.CancelledError:
-                break
+    Messages are persisted to a SQLite queue before they are acknowledged, and are processed in
+    order per group while up to `concurrency` groups are processed in parallel. Failed jobs are
+    retried with exponential backoff and dead-lettered once they run out of attempts. Jobs that
+    were interrupted by a shutdown or crash are processed again on the next startup.
+    """
+
+    def __init__(self):
+        self.queue: IngestionQueue | None = None
+        self.pool: IngestionWorkerPool | None = None
+        self.graphiti: ZepGraphiti | None = None
+        self.stats: dict[str, GroupQueueStats] = defaultdict(GroupQueueStats)
+
+    async def put(self, group_id: str, message: Message):
+        if self.pool is None:
+            raise RuntimeError('Ingestion worker is not running')
+        await self.pool.put(group_id, {'message': message.model_dump(mode='json')})
+
+    async def process(self, job: QueuedJob):
+        if self.graphiti is None:
+            raise RuntimeError('Ingestion worker is not running')
+
+        message = Message.model_validate(job.payload['message'])
+        logger.debug(f'Got a job for group {job.group_id} (attempt {job.attempts + 1})')
+
+        stats = self.stats[job.group_id]
+        stats.in_flight += 1
+        wait = time.time() - job.enqueued_at.timestamp()
+        start = time.perf_counter()
+        success = False
+        try:
+            await add_message(self.graphiti, job.group_id, message)
+            success = True
+        finally:
+            stats.in_flight -= 1
+            stats.record(wait, time.perf_counter() - start, success)
+
+    async def metrics(self) -> IngestQueueMetrics:
+        depths = await self.queue.depths() if self.queue else {}
+        dead_letters = await self.queue.dead_letters() if self.queue else []
+        dead_lettered = Counter(dead_letter.group_id for dead_letter in dead_letters)
+
+        groups = set(depths) | set(dead_lettered) | set(self.stats)
+        return IngestQueueMetrics(
+            concurrency=self.pool.concurrency if self.pool else 0,
+            runnable_groups=await self.queue.runnable_groups() if self.queue else 0,
+            groups={
+                group_id: self.stats[group_id].to_metrics(
+                    depths.get(group_id, 0), dead_lettered[group_id]
+                )
+                for group_id in sorted(groups)
+            },
+        )
 
-    async def start(self):
-        self.task = asyncio.create_task(self.worker())
+    async def start(self, settings: Settings):
+        self.queue = SQLiteIngestionQueue(
+            settings.ingest_queue_path,
+            max_attempts=settings.ingest_max_attempts,
+            retry_backoff=settings.ingest_retry_backoff,
+        )
+        self.graphiti = create_graphiti(settings)
+        self.pool = IngestionWorkerPool(
+            self.queue, self.process, concurrency=settings.ingest_worker_concurrency
+        )
+        await self.pool.start()
 
     async def stop(self):
-        if self.task:
-            self.task.cancel()
-            await self.task
-        while not self.queue.empty():
-            self.queue.get_nowait()
+        # Jobs still pending or in progress remain in the queue and are resumed on startup
+        if self.pool:
+            await self.pool.stop()
+        if self.queue:
+            await self.queue.close()
+        if self.graphiti:
+            await self.graphiti.close()
+        self.pool = self.queue = self.graphiti = None
 
 
 async_worker = AsyncWorker()
@@ -50,7 +166,7 @@ async_worker = AsyncWorker()
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
-    await async_worker.start()
+    await async_worker.start(get_settings())
     yield
     await async_worker.stop()
 
@@ -59,27 +175,19 @@ router = APIRouter(lifespan=lifespan)
 
 
 @router.post('/messages', status_code=status.HTTP_202_ACCEPTED)
-async def add_messages(
-    request: AddMessagesRequest,
-    graphiti: ZepGraphitiDep,
-):
-    async def add_messages_task(m: Message):
-        await graphiti.add_episode(
-            uuid=m.uuid,
-            group_id=request.group_id,
-            name=m.name,
-            episode_body=f'{m.role or ""}({m.role_type}): {m.content}',
-            reference_time=m.timestamp,
-            source=EpisodeType.message,
-            source_description=m.source_description,
-        )
-
+async def add_messages(request: AddMessagesRequest):
+    # Messages are committed to the durable queue before the request is acknowledged
     for m in request.messages:
-        await async_worker.queue.put(partial(add_messages_task, m))
+        await async_worker.put(request.group_id, m)
 
     return Result(message='Messages added to processing queue', success=True)
 
 
+@router.get('/messages/queue', status_code=status.HTTP_200_OK, response_model=IngestQueueMetrics)
+async def get_queue_metrics():
+    return await async_worker.metrics()
+
+
 @router.post('/ingest/batch', status_code=status.HTTP_200_OK)
 async def ingest_batch(
     request: AddMessagesRequest,
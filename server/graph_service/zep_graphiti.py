@@ -245,20 +245,20 @@ def _get_reranker(settings: ZepEnvDep) -> CrossEncoderClient | None:
         return None
 
 
-async def get_graphiti(settings: ZepEnvDep):
-    llm_client = _get_llm_client(settings)
-    embedder = _get_embedder(settings)
-    reranker = _get_reranker(settings)
-
-    client = ZepGraphiti(
+def create_graphiti(settings: ZepEnvDep) -> ZepGraphiti:
+    return ZepGraphiti(
         uri=settings.neo4j_uri,
         user=settings.neo4j_user,
         password=settings.neo4j_password,
-        llm_client=llm_client,
-        embedder=embedder,
-        cross_encoder=reranker,
+        llm_client=_get_llm_client(settings),
+        embedder=_get_embedder(settings),
+        cross_encoder=_get_reranker(settings),
     )
 
+
+async def get_graphiti(settings: ZepEnvDep):
+    client = create_graphiti(settings)
+
     try:
         yield client
     finally:
@@ -266,18 +266,7 @@ async def get_graphiti(settings: ZepEnvDep):
 
 
 async def initialize_graphiti(settings: ZepEnvDep):
-    llm_client = _get_llm_client(settings)
-    embedder = _get_embedder(settings)
-    reranker = _get_reranker(settings)
-
-    client = ZepGraphiti(
-        uri=settings.neo4j_uri,
-        user=settings.neo4j_user,
-        password=settings.neo4j_password,
-        llm_client=llm_client,
-        embedder=embedder,
-        cross_encoder=reranker,
-    )
+    client = create_graphiti(settings)
     await client.build_indices_and_constraints()
 
 
@@ -0,0 +1,99 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from graphiti_core.cross_encoder.bge_reranker_client import BGERerankerClient
+
+
+class FakeCrossEncoder:
+    """Scores a pair by the length of its passage and records every batch."""
+
+    def __init__(self, model_name: str):
+        self.batches: list[list[list[str]]] = []
+        self.threads: set[str] = set()
+
+    def predict(self, pairs, batch_size=32):
+        self.batches.append(pairs)
+        self.threads.add(threading.current_thread().name)
+        if any(passage == 'fail' for _, passage in pairs):
+            raise RuntimeError('predict failed')
+        # Like sentence-transformers, scores come back as a NumPy array
+        return np.array([float(len(passage)) for _, passage in pairs], dtype=np.float32)
+
+
+@pytest.fixture
+def make_client():
+    clients: list[BGERerankerClient] = []
+
+    def make(**kwargs) -> BGERerankerClient:
+        with patch(
+            'graphiti_core.cross_encoder.bge_reranker_client.CrossEncoder', FakeCrossEncoder
+        ):
+            client = BGERerankerClient(**kwargs)
+        clients.append(client)
+        return client
+
+    yield make
+
+    for client in clients:
+        client.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_batches(make_client):
+    client = make_client(batch_size=64, batch_wait=0.2)
+
+    results = await asyncio.gather(
+        client.rank('query 1', ['a', 'ccc', 'bb']),
+        client.rank('query 2', ['dddd', 'e']),
+    )
+
+    assert results == [
+        [('ccc', 3.0), ('bb', 2.0), ('a', 1.0)],
+        [('dddd', 4.0), ('e', 1.0)],
+    ]
+    assert len(client.model.batches) == 1
+    assert client.model.threads == {'bge-reranker'}
+
+
+@pytest.mark.asyncio
+async def test_batches_are_capped_at_batch_size(make_client):
+    client = make_client(batch_size=2, batch_wait=0.2)
+
+    await asyncio.gather(*[client.rank(f'query {i}', ['a', 'bb']) for i in range(3)])
+
+    assert [len(batch) for batch in client.model.batches] == [2, 2, 2]
+
+
+@pytest.mark.asyncio
+async def test_errors_are_raised_to_every_request_in_the_batch(make_client):
+    client = make_client(batch_wait=0.2)
+
+    results = await asyncio.gather(
+        client.rank('query 1', ['fail', 'a']),
+        client.rank('query 2', ['b']),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    # The worker keeps serving requests after a failed batch
+    assert await client.rank('query 3', ['a', 'bb']) == [('bb', 2.0), ('a', 1.0)]
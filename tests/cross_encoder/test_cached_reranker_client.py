@@ -0,0 +1,91 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import pytest
+
+from graphiti_core.cross_encoder.cached_reranker_client import CachedCrossEncoderClient
+from graphiti_core.cross_encoder.client import CrossEncoderClient
+
+
+class LengthRerankerClient(CrossEncoderClient):
+    """Scores passages by length and records every call."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
+        self.calls.append(passages)
+        if len(passages) <= 1:
+            return [(passage, 1.0) for passage in passages]
+        return sorted(
+            [(passage, float(len(passage))) for passage in passages],
+            key=lambda x: x[1],
+            reverse=True,
+        )
+
+
+@pytest.mark.asyncio
+async def test_rank_only_scores_uncached_passages():
+    inner = LengthRerankerClient()
+    client = CachedCrossEncoderClient(inner)
+
+    assert await client.rank('query', ['a', 'bbb']) == [('bbb', 3.0), ('a', 1.0)]
+    assert await client.rank('query', ['cc', 'a', 'bbb', 'dddd']) == [
+        ('dddd', 4.0),
+        ('bbb', 3.0),
+        ('cc', 2.0),
+        ('a', 1.0),
+    ]
+    assert inner.calls == [['a', 'bbb'], ['cc', 'dddd']]
+
+    # Repeat queries never reach the wrapped client
+    await client.rank('query', ['dddd', 'a'])
+    assert len(inner.calls) == 2
+    assert (client.hits, client.misses) == (4, 4)
+
+    # Scores are per query
+    await client.rank('other query', ['a', 'bbb'])
+    assert inner.calls[-1] == ['a', 'bbb']
+
+
+@pytest.mark.asyncio
+async def test_lone_uncached_passage_is_ranked_with_a_cached_one():
+    inner = LengthRerankerClient()
+    client = CachedCrossEncoderClient(inner)
+
+    await client.rank('query', ['a', 'bbb'])
+    assert await client.rank('query', ['a', 'bbb', 'cc']) == [
+        ('bbb', 3.0),
+        ('cc', 2.0),
+        ('a', 1.0),
+    ]
+    assert inner.calls[-1] == ['cc', 'a']
+
+    # A single passage on its own is not scored by the wrapped client, so it is not cached
+    await client.rank('new query', ['eeeee'])
+    assert await client.rank('new query', ['eeeee', 'a']) == [('eeeee', 5.0), ('a', 1.0)]
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used_scores():
+    inner = LengthRerankerClient()
+    client = CachedCrossEncoderClient(inner, max_size=2)
+
+    await client.rank('query', ['a', 'bb'])
+    await client.rank('query', ['ccc', 'dddd'])
+    await client.rank('query', ['a', 'bb'])
+
+    assert inner.calls[-1] == ['a', 'bb']
@@ -349,5 +349,67 @@ class TestGeminiRerankerClientRanking:
         assert all(score == 0.0 for _, score in result)
 
 
+class TestGeminiRerankerClientListwise:
+    """Tests for the listwise ranking mode of GeminiRerankerClient."""
+
+    @pytest.fixture
+    def listwise_client(self, mock_gemini_client):
+        config = LLMConfig(api_key='test_api_key', model='test-model')
+        client = GeminiRerankerClient(config=config, listwise=True, listwise_chunk_size=2)
+        client.client = mock_gemini_client
+        return client
+
+    @pytest.mark.asyncio
+    async def test_rank_scores_each_chunk_in_one_request(self, listwise_client, mock_gemini_client):
+        """Test that every chunk of passages is scored with a single request."""
+        mock_gemini_client.aio.models.generate_content.side_effect = [
+            create_mock_response('[1]: 20\n[2]: 90'),
+            create_mock_response('1: 55'),
+        ]
+
+        result = await listwise_client.rank('Test query', ['Passage 1', 'Passage 2', 'Passage 3'])
+
+        assert result == [('Passage 2', 0.9), ('Passage 3', 0.55), ('Passage 1', 0.2)]
+        assert mock_gemini_client.aio.models.generate_content.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rank_falls_back_to_pointwise_for_missing_passages(
+        self, listwise_client, mock_gemini_client
+    ):
+        """Test that passages left out of the listwise answer are scored individually."""
+        mock_gemini_client.aio.models.generate_content.side_effect = [
+            create_mock_response('1: 70'),
+            create_mock_response('40'),
+        ]
+
+        result = await listwise_client.rank('Test query', ['Passage 1', 'Passage 2'])
+
+        assert result == [('Passage 1', 0.7), ('Passage 2', 0.4)]
+        assert mock_gemini_client.aio.models.generate_content.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rank_falls_back_to_pointwise_on_error(self, listwise_client, mock_gemini_client):
+        """Test that a failed listwise request is retried pointwise."""
+        mock_gemini_client.aio.models.generate_content.side_effect = [
+            Exception('Malformed response'),
+            create_mock_response('10'),
+            create_mock_response('30'),
+        ]
+
+        result = await listwise_client.rank('Test query', ['Passage 1', 'Passage 2'])
+
+        assert result == [('Passage 2', 0.3), ('Passage 1', 0.1)]
+
+    @pytest.mark.asyncio
+    async def test_rank_rate_limit_error(self, listwise_client, mock_gemini_client):
+        """Test that rate limit errors are not retried pointwise."""
+        mock_gemini_client.aio.models.generate_content.side_effect = Exception(
+            'Rate limit exceeded'
+        )
+
+        with pytest.raises(RateLimitError):
+            await listwise_client.rank('Test query', ['Passage 1', 'Passage 2'])
+
+
 if __name__ == '__main__':
     pytest.main(['-v', 'test_gemini_reranker_client.py'])
@@ -0,0 +1,114 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# Running tests: pytest -xvs tests/cross_encoder/test_openai_reranker_client.py
+
+import math
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.cross_encoder.openai_reranker_client import OpenAIRerankerClient
+from graphiti_core.llm_client import LLMConfig
+
+
+@pytest.fixture
+def mock_openai_client():
+    """Fixture to mock the OpenAI client."""
+    mock_client = MagicMock()
+    mock_client.chat.completions.create = AsyncMock()
+    return mock_client
+
+
+@pytest.fixture
+def listwise_client(mock_openai_client):
+    """Fixture to create a listwise OpenAIRerankerClient with a mocked client."""
+    config = LLMConfig(api_key='test_api_key', model='test-model')
+    return OpenAIRerankerClient(
+        config=config, client=mock_openai_client, listwise=True, listwise_chunk_size=2
+    )
+
+
+def create_listwise_response(content: str) -> MagicMock:
+    """Helper function to create a mock chat completion with text content."""
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = content
+    return mock_response
+
+
+def create_pointwise_response(token: str, probability: float) -> MagicMock:
+    """Helper function to create a mock chat completion with a single top logprob."""
+    top_logprob = MagicMock()
+    top_logprob.token = token
+    top_logprob.logprob = math.log(probability)
+
+    mock_response = MagicMock()
+    mock_response.choices[0].logprobs.content[0].top_logprobs = [top_logprob]
+    return mock_response
+
+
+class TestOpenAIRerankerClientListwise:
+    """Tests for the listwise ranking mode of OpenAIRerankerClient."""
+
+    @pytest.mark.asyncio
+    async def test_rank_scores_each_chunk_in_one_request(self, listwise_client, mock_openai_client):
+        """Test that every chunk of passages is scored with a single request."""
+        mock_openai_client.chat.completions.create.side_effect = [
+            create_listwise_response('[1]: 20\n[2]: 90'),
+            create_listwise_response('1: 55'),
+        ]
+
+        result = await listwise_client.rank('Test query', ['Passage 1', 'Passage 2', 'Passage 3'])
+
+        assert result == [('Passage 2', 0.9), ('Passage 3', 0.55), ('Passage 1', 0.2)]
+        assert mock_openai_client.chat.completions.create.call_count == 2
+        for call in mock_openai_client.chat.completions.create.call_args_list:
+            assert 'logprobs' not in call.kwargs
+
+    @pytest.mark.asyncio
+    async def test_rank_rescores_chunk_pointwise_on_partial_answer(
+        self, listwise_client, mock_openai_client
+    ):
+        """Test that a chunk with passages missing from the answer is scored pointwise."""
+        mock_openai_client.chat.completions.create.side_effect = [
+            create_listwise_response('1: 70'),
+            create_pointwise_response('True', 0.25),
+            create_pointwise_response('False', 0.6),
+        ]
+
+        result = await listwise_client.rank('Test query', ['Passage 1', 'Passage 2'])
+
+        assert [passage for passage, _ in result] == ['Passage 2', 'Passage 1']
+        assert [score for _, score in result] == pytest.approx([0.4, 0.25])
+        assert mock_openai_client.chat.completions.create.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_rank_falls_back_to_pointwise_on_error(self, listwise_client, mock_openai_client):
+        """Test that a failed listwise request is retried pointwise."""
+        mock_openai_client.chat.completions.create.side_effect = [
+            Exception('Malformed response'),
+            create_pointwise_response('True', 0.1),
+            create_pointwise_response('True', 0.3),
+        ]
+
+        result = await listwise_client.rank('Test query', ['Passage 1', 'Passage 2'])
+
+        assert [passage for passage, _ in result] == ['Passage 2', 'Passage 1']
+        assert [score for _, score in result] == pytest.approx([0.3, 0.1])
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', 'test_openai_reranker_client.py'])
@@ -160,6 +160,51 @@ class TestFalkorDriver:
         call_args = mock_graph.query.call_args[0]
         assert call_args[1]['created_at'] == test_datetime.isoformat()
 
+    @pytest.mark.asyncio
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    async def test_execute_query_pads_short_rows(self):
+        """Test that fields missing from a row are returned as None."""
+        mock_graph = MagicMock()
+        mock_result = MagicMock()
+        mock_result.header = [('col1', 'column1'), ('col2', 'column2')]
+        mock_result.result_set = [['a', 'b'], ['c'], ['d', 'e', 'extra']]
+        mock_graph.query = AsyncMock(return_value=mock_result)
+        self.mock_client.select_graph.return_value = mock_graph
+
+        records, _, _ = await self.driver.execute_query('MATCH (n) RETURN n')
+
+        assert records == [
+            {'column1': 'a', 'column2': 'b'},
+            {'column1': 'c', 'column2': None},
+            {'column1': 'd', 'column2': 'e'},
+        ]
+
+    @pytest.mark.asyncio
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    async def test_execute_query_passes_embeddings_without_copying(self):
+        """Test that numeric arrays are passed through instead of being walked and copied."""
+        mock_graph = MagicMock()
+        mock_result = MagicMock()
+        mock_result.header = []
+        mock_result.result_set = []
+        mock_graph.query = AsyncMock(return_value=mock_result)
+        self.mock_client.select_graph.return_value = mock_graph
+
+        test_datetime = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        embedding = [0.1] * 1024
+        nodes = [{'uuid': 'a', 'name_embedding': embedding, 'created_at': test_datetime}]
+
+        await self.driver.execute_query(
+            'UNWIND $nodes AS node RETURN node', nodes=nodes, search_vector=embedding
+        )
+
+        params = mock_graph.query.call_args[0][1]
+        assert params['search_vector'] is embedding
+        assert params['nodes'][0]['name_embedding'] is embedding
+        assert params['nodes'][0]['created_at'] == test_datetime.isoformat()
+        # The caller's parameters are left untouched
+        assert nodes[0]['created_at'] == test_datetime
+
     @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
     def test_session_creation(self):
         """Test session creation with specific database."""
@@ -342,6 +387,37 @@ class TestDatetimeConversion:
         assert result_tuple[0] == 'test'
         assert result_tuple[1] == test_datetime.isoformat()
 
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    def test_convert_returns_containers_without_datetimes_as_is(self):
+        """Test that only containers holding a datetime are copied."""
+        from graphiti_core.driver.falkordb_driver import convert_datetimes_to_strings
+
+        test_datetime = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        unchanged = {'name': 'test', 'embedding': [0.1, 0.2], 'labels': ['Entity']}
+        input_dict = {'unchanged': unchanged, 'changed': {'created_at': test_datetime}}
+
+        result = convert_datetimes_to_strings(input_dict)
+
+        assert result is not input_dict
+        assert result['unchanged'] is unchanged
+        assert result['changed'] == {'created_at': test_datetime.isoformat()}
+        assert input_dict['changed']['created_at'] == test_datetime
+
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    def test_convert_mixed_list_starting_with_number(self):
+        """Test that lists starting with a number are walked unless they are all numbers."""
+        from graphiti_core.driver.falkordb_driver import convert_datetimes_to_strings
+
+        test_datetime = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        embedding = [0.1, 2, 0.3]
+
+        assert convert_datetimes_to_strings([3, test_datetime]) == [3, test_datetime.isoformat()]
+        assert convert_datetimes_to_strings((True, test_datetime)) == (
+            True,
+            test_datetime.isoformat(),
+        )
+        assert convert_datetimes_to_strings(embedding) is embedding
+
     @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
     def test_convert_single_datetime(self):
         """Test datetime conversion for single datetime object."""
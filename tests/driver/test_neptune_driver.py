@@ -0,0 +1,151 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from graphiti_core.helpers import encode_embedding
+from graphiti_core.nodes import EntityNode
+
+try:
+    from graphiti_core.driver.neptune_driver import NeptuneDriver, aoss_indices
+
+    HAS_NEPTUNE = True
+except ImportError:
+    NeptuneDriver = None
+    HAS_NEPTUNE = False
+
+pytestmark = pytest.mark.skipif(not HAS_NEPTUNE, reason='Neptune dependencies are not installed')
+
+
+@pytest.fixture
+def driver():
+    with (
+        patch('graphiti_core.driver.neptune_driver.NeptuneGraph'),
+        patch('graphiti_core.driver.neptune_driver.boto3'),
+        patch('graphiti_core.driver.neptune_driver.Urllib3AWSV4SignerAuth'),
+        patch('graphiti_core.driver.neptune_driver.OpenSearch'),
+    ):
+        driver = NeptuneDriver('neptune-db://test-host', 'aoss-host', max_workers=4)
+    yield driver
+    driver._executor.shutdown(wait=True)
+
+
+@pytest.mark.asyncio
+async def test_execute_query_runs_off_the_event_loop(driver):
+    loop_thread = threading.get_ident()
+    query_threads: list[int] = []
+
+    def query(cypher_query, params):
+        query_threads.append(threading.get_ident())
+        time.sleep(0.1)
+        return [{'uuid': params['uuid']}]
+
+    driver.client.query = MagicMock(side_effect=query)
+
+    start = time.monotonic()
+    results = await asyncio.gather(
+        *[driver.execute_query('RETURN $uuid AS uuid', uuid=str(i)) for i in range(4)]
+    )
+
+    # The queries run concurrently on the pool instead of one after another on the loop
+    assert time.monotonic() - start < 0.3
+    assert [records for records, _, _ in results] == [[{'uuid': str(i)}] for i in range(4)]
+    assert loop_thread not in query_threads
+
+
+@pytest.mark.asyncio
+async def test_run_aoss_query_does_not_mutate_index_definitions(driver):
+    driver.aoss_client.search = MagicMock(return_value={'hits': {'total': {'value': 0}}})
+
+    await asyncio.gather(
+        driver.run_aoss_query('node_name_and_summary', 'alice', limit=5),
+        driver.run_aoss_query('node_name_and_summary', 'bob', limit=7),
+    )
+
+    bodies = {
+        call.kwargs['body']['query']['multi_match']['query']: call.kwargs['body']
+        for call in driver.aoss_client.search.call_args_list
+    }
+    assert bodies['alice']['size'] == 5
+    assert bodies['bob']['size'] == 7
+    assert aoss_indices[0]['query']['query']['multi_match']['query'] == ''
+
+
+@pytest.mark.asyncio
+async def test_save_to_aoss_runs_bulk_on_the_pool(driver):
+    with patch(
+        'graphiti_core.driver.neptune_driver.helpers.bulk', return_value=(2, 0)
+    ) as mock_bulk:
+        success = await driver.save_to_aoss(
+            'community_name',
+            [{'uuid': 'a', 'name': 'A', 'group_id': 'g'}, {'uuid': 'b', 'name': 'B'}],
+        )
+
+    assert success == 2
+    indexed = mock_bulk.call_args.args[1]
+    assert [item['_id'] for item in indexed] == ['a', 'b']
+
+
+def test_max_workers_must_be_positive():
+    with pytest.raises(ValueError):
+        NeptuneDriver('neptune-db://test-host', 'aoss-host', max_workers=0)
+
+
+@pytest.mark.asyncio
+async def test_embeddings_are_stored_as_blobs(driver):
+    driver.client.query = MagicMock(
+        return_value=[
+            {
+                'uuid': 'a',
+                'name_embedding': encode_embedding([0.5, 1.0]),
+                'matches': [{'fact_embedding': '0.5,1.0'}],
+            }
+        ]
+    )
+    nodes = [{'uuid': 'a', 'name_embedding': [0.5, 1.0]}]
+
+    records, _, _ = await driver.execute_query('RETURN 1', nodes=nodes, search_vector=[0.5, 1.0])
+
+    params = driver.client.query.call_args.kwargs['params']
+    assert params['nodes'][0]['name_embedding'] == encode_embedding([0.5, 1.0])
+    assert params['search_vector'] == [0.5, 1.0]
+    # The caller's parameters are left untouched
+    assert nodes[0]['name_embedding'] == [0.5, 1.0]
+    assert records[0]['name_embedding'] == [0.5, 1.0]
+    assert records[0]['matches'][0]['fact_embedding'] == [0.5, 1.0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('aoss_knn', [False, True])
+async def test_entity_saves_are_indexed_only_for_knn(driver, aoss_knn):
+    driver.aoss_knn = aoss_knn
+    driver.client.query = MagicMock(return_value=[{'uuid': 'a'}])
+    driver.save_to_aoss = AsyncMock(return_value=1)
+    node = EntityNode(uuid='a', name='Alice', group_id='group', name_embedding=[0.5, 1.0])
+
+    await node.save(driver)
+
+    if aoss_knn:
+        index_name, documents = driver.save_to_aoss.await_args.args
+        assert index_name == 'node_name_and_summary'
+        assert documents[0]['name_embedding'] == [0.5, 1.0]
+    else:
+        driver.save_to_aoss.assert_not_awaited()
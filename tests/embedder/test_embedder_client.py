@@ -0,0 +1,118 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+from collections.abc import Iterable
+
+import pytest
+
+from graphiti_core.embedder.client import EmbedderClient, is_rate_limit_error
+from graphiti_core.llm_client import RateLimitError
+
+
+class RecordingEmbedder(EmbedderClient):
+    """Embeds a text as [len(text)] and records every request."""
+
+    max_batch_items = 3
+    max_batch_tokens = 10
+    max_concurrent_batches = 2
+
+    def __init__(self, failing_batches: int = 0, error: Exception | None = None):
+        self.requests: list[list[str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.failing_batches = failing_batches
+        self.error = error or RuntimeError('transient')
+
+    async def create(
+        self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
+    ) -> list[float]:
+        raise NotImplementedError()
+
+    async def _create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        self.requests.append(input_data_list)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if len(input_data_list) > 1 and self.failing_batches > 0:
+                self.failing_batches -= 1
+                raise self.error
+            return [[float(len(text))] for text in input_data_list]
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_create_batch_splits_by_item_and_token_limits() -> None:
+    """Test that sub-batches respect both the item and the token limit."""
+    embedder = RecordingEmbedder()
+    inputs = ['a', 'b', 'c', 'd', 'x' * 27, 'e']
+
+    result = await embedder.create_batch(inputs)
+
+    assert result == [[float(len(text))] for text in inputs]
+    assert sorted(embedder.requests) == sorted([['a', 'b', 'c'], ['d'], ['x' * 27], ['e']])
+
+
+@pytest.mark.asyncio
+async def test_create_batch_bounds_concurrent_requests() -> None:
+    """Test that sub-batches run concurrently up to max_concurrent_batches."""
+    embedder = RecordingEmbedder()
+    inputs = [str(i) for i in range(12)]
+
+    result = await embedder.create_batch(inputs)
+
+    assert result == [[float(len(text))] for text in inputs]
+    assert len(embedder.requests) == 4
+    assert embedder.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_create_batch_retries_failed_sub_batches_individually() -> None:
+    """Test that the inputs of a failed sub-batch are retried one at a time."""
+    embedder = RecordingEmbedder(failing_batches=1)
+    inputs = ['a', 'bb', 'ccc', 'dddd']
+
+    result = await embedder.create_batch(inputs)
+
+    assert result == [[1.0], [2.0], [3.0], [4.0]]
+    assert [len(request) for request in embedder.requests].count(1) >= 3
+
+
+class HTTPStatusError(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f'HTTP {status_code}')
+        self.status_code = status_code
+
+
+@pytest.mark.asyncio
+async def test_create_batch_raises_rate_limit_errors_without_retrying() -> None:
+    """Test that a throttled sub-batch is not retried one input at a time."""
+    embedder = RecordingEmbedder(failing_batches=1, error=RateLimitError())
+
+    with pytest.raises(RateLimitError):
+        await embedder.create_batch(['a', 'bb', 'ccc'])
+
+    assert [len(request) for request in embedder.requests] == [3]
+
+
+def test_is_rate_limit_error() -> None:
+    """Test that rate limit errors are recognized by type name and HTTP status."""
+    assert is_rate_limit_error(RateLimitError())
+    assert is_rate_limit_error(HTTPStatusError(429))
+    assert not is_rate_limit_error(HTTPStatusError(400))
+    assert not is_rate_limit_error(ValueError('input too long'))
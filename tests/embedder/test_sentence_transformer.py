@@ -0,0 +1,96 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import threading
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from graphiti_core.embedder.sentence_transformer import (
+    SentenceTransformerEmbedder,
+    SentenceTransformerEmbedderConfig,
+)
+
+
+class FakeSentenceTransformer:
+    """Embeds a text as [len(text), 1.0, -0.5] and records every batch."""
+
+    def __init__(self, model_name: str, device: str = 'cpu'):
+        self.batches: list[list[str]] = []
+        self.threads: set[str] = set()
+
+    def encode(self, texts, batch_size=32, normalize_embeddings=True, convert_to_numpy=True):
+        self.batches.append(texts)
+        self.threads.add(threading.current_thread().name)
+        return np.array([[float(len(text)), 1.0, -0.5] for text in texts], dtype=np.float32)
+
+
+@pytest.fixture
+def make_embedder() -> Generator[Any, Any, None]:
+    embedders: list[SentenceTransformerEmbedder] = []
+
+    def make(**kwargs) -> SentenceTransformerEmbedder:
+        with patch(
+            'graphiti_core.embedder.sentence_transformer.SentenceTransformer',
+            FakeSentenceTransformer,
+        ):
+            embedder = SentenceTransformerEmbedder(SentenceTransformerEmbedderConfig(**kwargs))
+        embedders.append(embedder)
+        return embedder
+
+    yield make
+
+    for embedder in embedders:
+        embedder.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_batches(make_embedder: Any) -> None:
+    """Test that concurrent create and create_batch calls are embedded in one batch."""
+    embedder = make_embedder(batch_wait=0.2, warmup=False)
+
+    single, batch = await asyncio.gather(
+        embedder.create('abc'),
+        embedder.create_batch(['a', 'ab']),
+    )
+
+    assert single == [3.0, 1.0, -0.5]
+    assert batch == [[1.0, 1.0, -0.5], [2.0, 1.0, -0.5]]
+    assert embedder.model.batches == [['abc', 'a', 'ab']]
+    assert embedder.model.threads == {'sentence-transformer-embedder'}
+
+
+@pytest.mark.asyncio
+async def test_warmup_runs_on_the_worker(make_embedder: Any) -> None:
+    """Test that the model is warmed up before the first request."""
+    embedder = make_embedder(warmup=True)
+
+    await embedder.create('abc')
+
+    assert embedder.model.batches[0] == ['warm up']
+
+
+@pytest.mark.asyncio
+async def test_create_rejects_token_input(make_embedder: Any) -> None:
+    """Test that token id input is rejected."""
+    embedder = make_embedder(warmup=False)
+
+    with pytest.raises(ValueError):
+        await embedder.create([1, 2, 3])
@@ -24,7 +24,12 @@ from dotenv import load_dotenv
 from graphiti_core.driver.driver import GraphDriver, GraphProvider
 from graphiti_core.edges import EntityEdge, EpisodicEdge
 from graphiti_core.embedder.client import EmbedderClient
-from graphiti_core.helpers import lucene_sanitize
+from graphiti_core.helpers import (
+    decode_embedding,
+    decode_embedding_matrix,
+    encode_embedding,
+    lucene_sanitize,
+)
 from graphiti_core.nodes import CommunityNode, EntityNode, EpisodicNode
 from graphiti_core.utils.maintenance.graph_data_operations import clear_data
 
@@ -189,6 +194,31 @@ def test_lucene_sanitize():
         assert assert_result == result
 
 
+def test_embedding_blob_round_trip():
+    embedding = [0.25, -1.5, 3.0]
+
+    assert decode_embedding(encode_embedding(embedding)) == embedding
+    assert decode_embedding(encode_embedding(embedding, 'float16')) == embedding
+    # Embeddings stored before the blob format are comma-joined
+    assert decode_embedding('0.25,-1.5,3.0') == embedding
+    assert decode_embedding('') is None
+
+
+def test_decode_embedding_matrix_skips_empty_and_mismatched_rows():
+    values = [
+        encode_embedding([1.0, 0.0]),
+        None,
+        encode_embedding([0.0, 1.0], 'float16'),
+        encode_embedding([1.0, 2.0, 3.0]),
+        '0.5,0.5',
+    ]
+
+    matrix, indices = decode_embedding_matrix(values, dim=2)
+
+    rows = dict(zip(indices.tolist(), matrix.tolist(), strict=True))
+    assert rows == {0: [1.0, 0.0], 2: [0.0, 1.0], 4: [0.5, 0.5]}
+
+
 async def get_node_count(driver: GraphDriver, uuids: list[str]) -> int:
     results, _, _ = await driver.execute_query(
         """
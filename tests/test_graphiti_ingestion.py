@@ -0,0 +1,415 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from graphiti_core import graphiti as graphiti_module
+from graphiti_core.cross_encoder.client import CrossEncoderClient
+from graphiti_core.driver.driver import GraphDriver, GraphProvider
+from graphiti_core.edges import Edge, EntityEdge
+from graphiti_core.embedder.client import EmbedderClient
+from graphiti_core.graphiti import AddBulkEpisodeResults, AddEpisodeResults, Graphiti
+from graphiti_core.llm_client import LLMClient
+from graphiti_core.nodes import EpisodeType, EpisodicNode, Node
+from graphiti_core.search.search_config import SearchResults
+from graphiti_core.utils.bulk_utils import RawEpisode
+from graphiti_core.utils.datetime_utils import utc_now
+
+
+def _make_graphiti() -> Graphiti:
+    driver = Mock(spec=GraphDriver)
+    driver.provider = GraphProvider.NEO4J
+    driver._database = 'neo4j'
+
+    return Graphiti(
+        graph_driver=driver,
+        llm_client=Mock(spec=LLMClient),
+        embedder=Mock(spec=EmbedderClient),
+        cross_encoder=Mock(spec=CrossEncoderClient),
+    )
+
+
+def _make_raw_episodes(count: int) -> list[RawEpisode]:
+    return [
+        RawEpisode(
+            name=f'episode-{i}',
+            content=f'content {i}',
+            source_description='test',
+            source=EpisodeType.message,
+            reference_time=utc_now(),
+        )
+        for i in range(count)
+    ]
+
+
+def _episode_from_raw(raw: RawEpisode) -> EpisodicNode:
+    return EpisodicNode(
+        name=raw.name,
+        group_id='',
+        labels=[],
+        source=raw.source,
+        content=raw.content,
+        source_description=raw.source_description,
+        valid_at=raw.reference_time,
+    )
+
+
+@pytest.mark.asyncio
+async def test_add_episode_bulk_stream_pipelines_chunks(monkeypatch):
+    graphiti = _make_graphiti()
+    events: list[str] = []
+
+    async def fake_extract(clients, bulk_episodes, group_id, now, *args):
+        names = ','.join(raw.name for raw in bulk_episodes)
+        events.append(f'extract-start:{names}')
+        await asyncio.sleep(0.01)
+        events.append(f'extract-end:{names}')
+        episodes = [_episode_from_raw(raw) for raw in bulk_episodes]
+        return episodes, [(episode, []) for episode in episodes], [], []
+
+    async def fake_resolve(clients, episodes, *args):
+        names = ','.join(episode.name for episode in episodes)
+        events.append(f'resolve-start:{names}')
+        await asyncio.sleep(0.05)
+        events.append(f'resolve-end:{names}')
+        return AddBulkEpisodeResults(
+            episodes=episodes,
+            episodic_edges=[],
+            nodes=[],
+            edges=[],
+            communities=[],
+            community_edges=[],
+        )
+
+    monkeypatch.setattr(graphiti, '_extract_bulk_chunk', fake_extract)
+    monkeypatch.setattr(graphiti, '_resolve_and_save_bulk_chunk', fake_resolve)
+
+    progress = [
+        chunk
+        async for chunk in graphiti.add_episode_bulk_stream(_make_raw_episodes(5), chunk_size=2)
+    ]
+
+    assert [chunk.chunk_index for chunk in progress] == [0, 1, 2]
+    assert [chunk.episodes_processed for chunk in progress] == [2, 4, 5]
+    assert [episode.name for episode in progress[2].episodes] == ['episode-4']
+
+    # Chunks are resolved strictly in order
+    resolve_starts = [event for event in events if event.startswith('resolve-start')]
+    assert resolve_starts == [
+        'resolve-start:episode-0,episode-1',
+        'resolve-start:episode-2,episode-3',
+        'resolve-start:episode-4',
+    ]
+    # Extraction of the next chunk begins before the previous chunk is resolved
+    assert events.index('extract-start:episode-2,episode-3') < events.index(
+        'resolve-end:episode-0,episode-1'
+    )
+    # Extraction never runs ahead by more than one chunk
+    assert events.index('extract-start:episode-4') > events.index(
+        'resolve-start:episode-0,episode-1'
+    )
+
+
+@pytest.mark.asyncio
+async def test_add_episode_bulk_stream_cancels_pending_extraction_on_close(monkeypatch):
+    graphiti = _make_graphiti()
+    cancelled = asyncio.Event()
+
+    async def fake_extract(clients, bulk_episodes, *args):
+        if bulk_episodes[0].name != 'episode-0':
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        episodes = [_episode_from_raw(raw) for raw in bulk_episodes]
+        return episodes, [], [], []
+
+    async def fake_resolve(clients, episodes, *args):
+        return AddBulkEpisodeResults(
+            episodes=episodes,
+            episodic_edges=[],
+            nodes=[],
+            edges=[],
+            communities=[],
+            community_edges=[],
+        )
+
+    monkeypatch.setattr(graphiti, '_extract_bulk_chunk', fake_extract)
+    monkeypatch.setattr(graphiti, '_resolve_and_save_bulk_chunk', fake_resolve)
+
+    stream = graphiti.add_episode_bulk_stream(_make_raw_episodes(4), chunk_size=2)
+    first = await stream.__anext__()
+    assert first.chunk_index == 0
+
+    # Let the extraction of the next chunk start before closing the stream
+    await asyncio.sleep(0)
+    await stream.aclose()
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+def _make_episode_results(episode: EpisodicNode) -> AddEpisodeResults:
+    return AddEpisodeResults(
+        episode=episode,
+        episodic_edges=[],
+        nodes=[],
+        edges=[],
+        communities=[],
+        community_edges=[],
+    )
+
+
+@pytest.mark.asyncio
+async def test_add_episode_stream_overlaps_extraction_and_resolves_in_order(monkeypatch):
+    graphiti = _make_graphiti()
+    events: list[str] = []
+    previous_context: dict[str, list[str]] = {}
+
+    async def fake_retrieve_episodes(reference_time, last_n, group_ids, source, driver=None):
+        return []
+
+    async def fake_extract(clients, episode, previous_episodes, *args):
+        previous_context[episode.name] = [previous.name for previous in previous_episodes]
+        events.append(f'extract-start:{episode.name}')
+        await asyncio.sleep(0.01)
+        events.append(f'extract-end:{episode.name}')
+        return [], []
+
+    async def fake_resolve(clients, episode, *args):
+        events.append(f'resolve-start:{episode.name}')
+        await asyncio.sleep(0.05)
+        events.append(f'resolve-end:{episode.name}')
+        return _make_episode_results(episode), []
+
+    monkeypatch.setattr(graphiti, 'retrieve_episodes', fake_retrieve_episodes)
+    monkeypatch.setattr(graphiti, '_extract_episode', fake_extract)
+    monkeypatch.setattr(graphiti, '_resolve_and_save_episode', fake_resolve)
+
+    results = [result async for result in graphiti.add_episode_stream(_make_raw_episodes(3))]
+
+    assert [result.episode.name for result in results] == ['episode-0', 'episode-1', 'episode-2']
+
+    # Resolution is strictly sequential and in order
+    resolution_events = [event for event in events if event.startswith('resolve')]
+    assert resolution_events == [
+        'resolve-start:episode-0',
+        'resolve-end:episode-0',
+        'resolve-start:episode-1',
+        'resolve-end:episode-1',
+        'resolve-start:episode-2',
+        'resolve-end:episode-2',
+    ]
+    # Extraction of the next episode overlaps with resolution of the current one
+    assert events.index('extract-start:episode-1') < events.index('resolve-end:episode-0')
+    assert events.index('extract-start:episode-2') < events.index('resolve-end:episode-1')
+
+    # Episodes still in the pipeline are part of the previous-episode context
+    assert previous_context['episode-1'] == ['episode-0']
+    assert previous_context['episode-2'] == ['episode-1']
+
+
+@pytest.mark.asyncio
+async def test_add_episode_stream_without_lookahead_is_sequential(monkeypatch):
+    graphiti = _make_graphiti()
+    events: list[str] = []
+
+    async def fake_retrieve_episodes(reference_time, last_n, group_ids, source, driver=None):
+        return []
+
+    async def fake_extract(clients, episode, previous_episodes, *args):
+        events.append(f'extract:{episode.name}')
+        return [], []
+
+    async def fake_resolve(clients, episode, *args):
+        events.append(f'resolve:{episode.name}')
+        return _make_episode_results(episode), []
+
+    monkeypatch.setattr(graphiti, 'retrieve_episodes', fake_retrieve_episodes)
+    monkeypatch.setattr(graphiti, '_extract_episode', fake_extract)
+    monkeypatch.setattr(graphiti, '_resolve_and_save_episode', fake_resolve)
+
+    results = [
+        result
+        async for result in graphiti.add_episode_stream(
+            _make_raw_episodes(2), extraction_lookahead=0
+        )
+    ]
+
+    assert len(results) == 2
+    assert events == [
+        'extract:episode-0',
+        'resolve:episode-0',
+        'extract:episode-1',
+        'resolve:episode-1',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_add_episode_uses_per_call_group_drivers(monkeypatch):
+    graphiti = _make_graphiti()
+    shared_driver = graphiti.driver
+    shared_clients = graphiti.clients
+
+    group_drivers: dict[str, Mock] = {}
+
+    def clone(database):
+        group_driver = Mock(spec=GraphDriver)
+        group_driver.provider = GraphProvider.FALKORDB
+        group_driver._database = database
+        group_drivers[database] = group_driver
+        return group_driver
+
+    shared_driver.clone.side_effect = clone
+
+    seen_drivers: dict[str, list] = {}
+
+    async def fake_retrieve_episodes(reference_time, last_n, group_ids, source, driver=None):
+        seen_drivers.setdefault(group_ids[0], []).append(driver)
+        return []
+
+    async def fake_extract(clients, episode, previous_episodes, *args):
+        # Yield control so that the two calls interleave
+        await asyncio.sleep(0.01)
+        seen_drivers[episode.group_id].append(clients.driver)
+        return [], []
+
+    async def fake_resolve(clients, episode, *args):
+        await asyncio.sleep(0.01)
+        seen_drivers[episode.group_id].append(clients.driver)
+        return _make_episode_results(episode), []
+
+    monkeypatch.setattr(graphiti, 'retrieve_episodes', fake_retrieve_episodes)
+    monkeypatch.setattr(graphiti, '_extract_episode', fake_extract)
+    monkeypatch.setattr(graphiti, '_resolve_and_save_episode', fake_resolve)
+
+    await asyncio.gather(
+        *[
+            graphiti.add_episode(
+                name=f'episode-{group_id}',
+                episode_body='content',
+                source_description='test',
+                reference_time=utc_now(),
+                group_id=group_id,
+            )
+            for group_id in ['tenant_a', 'tenant_b']
+        ]
+    )
+
+    # The shared instance state is never rebound
+    assert graphiti.driver is shared_driver
+    assert graphiti.clients is shared_clients
+    assert graphiti.clients.driver is shared_driver
+
+    # Every stage of each call saw the driver bound to its own group
+    for group_id in ['tenant_a', 'tenant_b']:
+        assert seen_drivers[group_id] == [group_drivers[group_id]] * 3
+
+
+@pytest.mark.asyncio
+async def test_single_group_search_on_falkordb_uses_group_driver(monkeypatch):
+    graphiti = _make_graphiti()
+    graphiti.driver.provider = GraphProvider.FALKORDB
+    group_driver = Mock(spec=GraphDriver)
+    graphiti.driver.clone.return_value = group_driver
+
+    captured: dict = {}
+
+    async def fake_search(clients, query, group_ids, *args, driver=None, **kwargs):
+        captured['driver'] = driver
+        return SearchResults()
+
+    monkeypatch.setattr(graphiti_module, 'search', fake_search)
+
+    await graphiti.search_('query', group_ids=['tenant_a'])
+
+    graphiti.driver.clone.assert_called_once_with(database='tenant_a')
+    assert captured['driver'] is group_driver
+
+
+@pytest.mark.asyncio
+async def test_remove_episode_on_falkordb_uses_group_driver(monkeypatch):
+    graphiti = _make_graphiti()
+    graphiti.driver.provider = GraphProvider.FALKORDB
+
+    group_drivers: dict[str, Mock] = {}
+
+    def clone(database):
+        group_driver = group_drivers.setdefault(database, Mock(spec=GraphDriver))
+        group_driver.provider = GraphProvider.FALKORDB
+        group_driver._database = database
+        return group_driver
+
+    graphiti.driver.clone.side_effect = clone
+
+    # Episodes stored per graph, keyed by the driver that wrote them
+    graphs: dict[int, dict[str, EpisodicNode]] = {}
+    deleted_with: list = []
+
+    async def fake_retrieve_episodes(reference_time, last_n, group_ids, source, driver=None):
+        return []
+
+    async def fake_extract(clients, episode, previous_episodes, *args):
+        return [], []
+
+    async def fake_resolve(clients, episode, *args):
+        graphs.setdefault(id(clients.driver), {})[episode.uuid] = episode
+        return _make_episode_results(episode), []
+
+    async def fake_get_by_uuid(driver, uuid):
+        return graphs[id(driver)][uuid]
+
+    async def fake_get_by_uuids(driver, uuids):
+        return []
+
+    async def fake_get_mentioned_nodes(driver, episodes):
+        return []
+
+    async def fake_delete_by_uuids(driver, uuids):
+        return None
+
+    async def fake_delete(self, driver):
+        deleted_with.append(driver)
+        del graphs[id(driver)][self.uuid]
+
+    monkeypatch.setattr(graphiti, 'retrieve_episodes', fake_retrieve_episodes)
+    monkeypatch.setattr(graphiti, '_extract_episode', fake_extract)
+    monkeypatch.setattr(graphiti, '_resolve_and_save_episode', fake_resolve)
+    monkeypatch.setattr(EpisodicNode, 'get_by_uuid', fake_get_by_uuid)
+    monkeypatch.setattr(EpisodicNode, 'delete', fake_delete)
+    monkeypatch.setattr(EntityEdge, 'get_by_uuids', fake_get_by_uuids)
+    monkeypatch.setattr(graphiti_module, 'get_mentioned_nodes', fake_get_mentioned_nodes)
+    monkeypatch.setattr(Edge, 'delete_by_uuids', fake_delete_by_uuids)
+    monkeypatch.setattr(Node, 'delete_by_uuids', fake_delete_by_uuids)
+
+    result = await graphiti.add_episode(
+        name='episode',
+        episode_body='content',
+        source_description='test',
+        reference_time=utc_now(),
+        group_id='tenant_a',
+    )
+
+    # The episode lives in the group's graph, not in the default one
+    assert result.episode.uuid in graphs[id(group_drivers['tenant_a'])]
+    assert id(graphiti.driver) not in graphs
+
+    await graphiti.remove_episode(result.episode.uuid, group_id='tenant_a')
+
+    assert deleted_with == [group_drivers['tenant_a']]
+    assert graphs[id(group_drivers['tenant_a'])] == {}
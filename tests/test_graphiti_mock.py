@@ -15,7 +15,7 @@ limitations under the License.
 """
 
 from datetime import datetime, timedelta
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import numpy as np
 import pytest
@@ -47,19 +47,24 @@ from graphiti_core.search.search_utils import (
     node_fulltext_search,
     node_similarity_search,
 )
-from graphiti_core.utils.bulk_utils import add_nodes_and_edges_bulk
+from graphiti_core.utils.bulk_utils import add_communities_bulk, add_nodes_and_edges_bulk
 from graphiti_core.utils.maintenance.community_operations import (
+    build_communities_incremental,
     determine_entity_community,
     get_community_clusters,
+    get_community_projection,
     remove_communities,
+    update_communities_bulk,
 )
 from graphiti_core.utils.maintenance.edge_operations import filter_existing_duplicate_of_edges
+from graphiti_core.utils.maintenance.graph_data_operations import backfill_mention_counts
 from tests.helpers_test import (
     GraphProvider,
     assert_entity_edge_equals,
     assert_entity_node_equals,
     assert_episodic_edge_equals,
     assert_episodic_node_equals,
+    embeddings,
     get_edge_count,
     get_node_count,
     group_id,
@@ -450,6 +455,110 @@ async def test_remove_episode(
     assert edge_count == 3
 
 
+@pytest.mark.asyncio
+async def test_remove_episode_keeps_shared_nodes_and_edges(
+    graph_driver, mock_llm_client, mock_embedder, mock_cross_encoder_client
+):
+    graphiti = Graphiti(
+        graph_driver=graph_driver,
+        llm_client=mock_llm_client,
+        embedder=mock_embedder,
+        cross_encoder=mock_cross_encoder_client,
+    )
+
+    now = datetime.now()
+    episodes = [
+        EpisodicNode(
+            name=f'test_episode_{i}',
+            group_id=group_id,
+            labels=[],
+            created_at=now,
+            source=EpisodeType.message,
+            source_description='conversation message',
+            content='Alice likes Bob',
+            valid_at=now,
+        )
+        for i in range(2)
+    ]
+    alice_node = EntityNode(name='Alice', group_id=group_id, labels=[], created_at=now)
+    await alice_node.generate_name_embedding(mock_embedder)
+    bob_node = EntityNode(name='Bob', group_id=group_id, labels=[], created_at=now)
+    await bob_node.generate_name_embedding(mock_embedder)
+    carol_node = EntityNode(name='test_entity_1', group_id=group_id, labels=[], created_at=now)
+    await carol_node.generate_name_embedding(mock_embedder)
+
+    entity_edge = EntityEdge(
+        source_node_uuid=alice_node.uuid,
+        target_node_uuid=bob_node.uuid,
+        created_at=now,
+        name='likes',
+        fact='Alice likes Bob',
+        episodes=[episode.uuid for episode in episodes],
+        group_id=group_id,
+    )
+    await entity_edge.generate_embedding(mock_embedder)
+    for episode in episodes:
+        episode.entity_edges = [entity_edge.uuid]
+
+    # Both episodes mention Alice and Bob, only the second one mentions Carol
+    episodic_edges = [
+        EpisodicEdge(
+            source_node_uuid=episode.uuid,
+            target_node_uuid=node.uuid,
+            created_at=now,
+            group_id=group_id,
+        )
+        for episode in episodes
+        for node in [alice_node, bob_node]
+    ] + [
+        EpisodicEdge(
+            source_node_uuid=episodes[1].uuid,
+            target_node_uuid=carol_node.uuid,
+            created_at=now,
+            group_id=group_id,
+        )
+    ]
+
+    await add_nodes_and_edges_bulk(
+        graph_driver,
+        episodes,
+        episodic_edges,
+        [alice_node, bob_node, carol_node],
+        [entity_edge],
+        mock_embedder,
+    )
+
+    if graph_driver.provider != GraphProvider.KUZU:
+        retrieved_bob = await EntityNode.get_by_uuid(graph_driver, bob_node.uuid)
+        assert retrieved_bob.mention_count == 2
+
+        # Saving a node with a stale count keeps the stored count
+        retrieved_bob.mention_count = 0
+        await retrieved_bob.save(graph_driver)
+        retrieved_bob = await EntityNode.get_by_uuid(graph_driver, bob_node.uuid)
+        assert retrieved_bob.mention_count == 2
+
+        # Nodes written before the count was maintained are recounted by the backfill
+        await graph_driver.execute_query(
+            'MATCH (n:Entity {uuid: $uuid}) REMOVE n.mention_count', uuid=bob_node.uuid
+        )
+        assert await backfill_mention_counts(graph_driver, [group_id]) == 1
+        retrieved_bob = await EntityNode.get_by_uuid(graph_driver, bob_node.uuid)
+        assert retrieved_bob.mention_count == 2
+
+    await graphiti.remove_episode(episodes[1].uuid)
+
+    node_ids = [alice_node.uuid, bob_node.uuid, carol_node.uuid]
+    assert await get_node_count(graph_driver, node_ids) == 2
+    retrieved_bob = await EntityNode.get_by_uuid(graph_driver, bob_node.uuid)
+    if graph_driver.provider != GraphProvider.KUZU:
+        assert retrieved_bob.mention_count == 1
+
+    # The edge survives because it was created by the first episode
+    retrieved_edge = await EntityEdge.get_by_uuid(graph_driver, entity_edge.uuid)
+    assert retrieved_edge.episodes == [episodes[0].uuid]
+
+
 @pytest.mark.asyncio
 async def test_graphiti_retrieve_episodes(
     graph_driver, mock_llm_client, mock_embedder, mock_cross_encoder_client
@@ -833,6 +942,244 @@ async def test_get_community_clusters(graph_driver, mock_embedder):
         ['test_entity_3', 'test_entity_4']
     )
 
+    # Paging the projection by source entity yields the same projection
+    projection = await get_community_projection(graph_driver, group_id)
+    paged_projection = await get_community_projection(graph_driver, group_id, page_size=1)
+    assert paged_projection == projection
+    neighbor_counts = {
+        neighbor.node_uuid: neighbor.edge_count for neighbor in projection[entity_node_1.uuid]
+    }
+    assert neighbor_counts[entity_node_2.uuid] == 1
+    assert entity_node_3.uuid not in projection
+
+
+@pytest.mark.asyncio
+async def test_build_communities_incremental(graph_driver, mock_embedder):
+    if graph_driver.provider == GraphProvider.FALKORDB:
+        pytest.skip('Skipping as test fails on FalkorDB')
+
+    entity_nodes = [
+        EntityNode(
+            name=f'test_entity_{i}',
+            labels=[],
+            created_at=datetime.now(),
+            group_id=group_id,
+            summary=f'summary of test_entity_{i}',
+        )
+        for i in range(1, 5)
+    ]
+    entity_edges = [
+        EntityEdge(
+            source_node_uuid=entity_nodes[i].uuid,
+            target_node_uuid=entity_nodes[i + 1].uuid,
+            name='RELATES_TO',
+            fact=f'test_entity_{i + 1} relates to test_entity_{i + 2}',
+            created_at=datetime.now(),
+            group_id=group_id,
+        )
+        for i in (0, 2)
+    ]
+    for node in entity_nodes:
+        await node.generate_name_embedding(mock_embedder)
+        await node.save(graph_driver)
+    for edge in entity_edges:
+        await edge.generate_embedding(mock_embedder)
+        await edge.save(graph_driver)
+
+    # The first community matches a cluster, the second only covers half of one
+    kept_community = CommunityNode(
+        name='test_community_1', labels=[], created_at=datetime.now(), group_id=group_id
+    )
+    stale_community = CommunityNode(
+        name='test_community_2', labels=[], created_at=datetime.now(), group_id=group_id
+    )
+    other_group_community = CommunityNode(
+        name='test_community_1', labels=[], created_at=datetime.now(), group_id=group_id_2
+    )
+    for community, members in (
+        (kept_community, entity_nodes[:2]),
+        (stale_community, entity_nodes[2:3]),
+        (other_group_community, []),
+    ):
+        await community.generate_name_embedding(mock_embedder)
+        await community.save(graph_driver)
+        for member in members:
+            await CommunityEdge(
+                source_node_uuid=community.uuid,
+                target_node_uuid=member.uuid,
+                created_at=datetime.now(),
+                group_id=group_id,
+            ).save(graph_driver)
+
+    llm_client = Mock(spec=LLMClient)
+    llm_client.generate_response = AsyncMock(
+        return_value={'summary': 'new summary', 'description': 'new community'}
+    )
+
+    community_nodes, community_edges = await build_communities_incremental(
+        graph_driver, llm_client, [group_id]
+    )
+
+    # Only the changed cluster is summarized
+    assert [node.name for node in community_nodes] == ['new community']
+    assert {edge.target_node_uuid for edge in community_edges} == {
+        entity_nodes[2].uuid,
+        entity_nodes[3].uuid,
+    }
+    assert llm_client.generate_response.await_count == 2
+    assert await get_node_count(graph_driver, [kept_community.uuid]) == 1
+    assert await get_node_count(graph_driver, [stale_community.uuid]) == 0
+
+    # Removing the communities of a group leaves the other groups alone
+    await remove_communities(graph_driver, [group_id])
+    assert await get_node_count(graph_driver, [kept_community.uuid]) == 0
+    assert await get_node_count(graph_driver, [other_group_community.uuid]) == 1
+    await remove_communities(graph_driver)
+    assert await get_node_count(graph_driver, [other_group_community.uuid]) == 0
+
+
+@pytest.mark.asyncio
+async def test_update_communities_bulk(graph_driver, mock_embedder):
+    entity_nodes = [
+        EntityNode(
+            name=f'test_entity_{i}',
+            labels=[],
+            created_at=datetime.now(),
+            group_id=group_id,
+            summary=f'summary of test_entity_{i}',
+        )
+        for i in range(1, 4)
+    ]
+    for node in entity_nodes:
+        await node.generate_name_embedding(mock_embedder)
+        await node.save(graph_driver)
+    entity_edge = EntityEdge(
+        source_node_uuid=entity_nodes[1].uuid,
+        target_node_uuid=entity_nodes[2].uuid,
+        name='RELATES_TO',
+        fact='test_entity_2 relates to test_entity_3',
+        created_at=datetime.now(),
+        group_id=group_id,
+    )
+    await entity_edge.generate_embedding(mock_embedder)
+    await entity_edge.save(graph_driver)
+
+    community_node = CommunityNode(
+        name='test_community_1',
+        labels=[],
+        created_at=datetime.now(),
+        group_id=group_id,
+        summary='community summary',
+    )
+    await community_node.generate_name_embedding(mock_embedder)
+    await community_node.save(graph_driver)
+    for member in entity_nodes[:2]:
+        await CommunityEdge(
+            source_node_uuid=community_node.uuid,
+            target_node_uuid=member.uuid,
+            created_at=datetime.now(),
+            group_id=group_id,
+        ).save(graph_driver)
+
+    llm_client = Mock(spec=LLMClient)
+    llm_client.generate_response = AsyncMock(
+        return_value={'summary': 'updated summary', 'description': 'test_community_1'}
+    )
+
+    # A member and a neighbor of a member of the same community update it together
+    communities, community_edges = await update_communities_bulk(
+        graph_driver, llm_client, mock_embedder, [entity_nodes[1], entity_nodes[2]]
+    )
+
+    assert [community.uuid for community in communities] == [community_node.uuid]
+    assert communities[0].summary == 'updated summary'
+    assert [edge.target_node_uuid for edge in community_edges] == [entity_nodes[2].uuid]
+    assert llm_client.generate_response.await_count == 2
+    community, is_new = await determine_entity_community(graph_driver, entity_nodes[2])
+    assert community.uuid == community_node.uuid
+    assert not is_new
+    assert community.summary == 'updated summary'
+
+
+@pytest.mark.asyncio
+async def test_add_communities_bulk(graph_driver, mock_embedder):
+    entity_nodes = [
+        EntityNode(
+            name=f'test_entity_{i}',
+            labels=[],
+            created_at=datetime.now(),
+            group_id=group_id,
+        )
+        for i in range(1, 4)
+    ]
+    for node in entity_nodes:
+        await node.generate_name_embedding(mock_embedder)
+        await node.save(graph_driver)
+
+    community_nodes = [
+        CommunityNode(
+            name=f'test_community_{i}',
+            labels=[],
+            created_at=datetime.now(),
+            group_id=group_id,
+            summary=f'summary of test_community_{i}',
+        )
+        for i in (1, 2)
+    ]
+    community_edges = [
+        CommunityEdge(
+            source_node_uuid=community_nodes[0 if i < 2 else 1].uuid,
+            target_node_uuid=entity_nodes[i].uuid,
+            created_at=datetime.now(),
+            group_id=group_id,
+        )
+        for i in range(3)
+    ]
+    mock_embedder.create_batch = AsyncMock(
+        side_effect=lambda texts: [embeddings[text] for text in texts]
+    )
+
+    await add_communities_bulk(graph_driver, community_nodes, community_edges, mock_embedder)
+
+    # Community names are embedded with a single batch call
+    mock_embedder.create_batch.assert_awaited_once_with(['test_community_1', 'test_community_2'])
+    saved_nodes = await CommunityNode.get_by_uuids(
+        graph_driver, [node.uuid for node in community_nodes]
+    )
+    assert {node.name for node in saved_nodes} == {'test_community_1', 'test_community_2'}
+    for node in saved_nodes:
+        await node.load_name_embedding(graph_driver)
+        assert np.allclose(node.name_embedding, embeddings[node.name])
+    saved_edges = await CommunityEdge.get_by_uuids(
+        graph_driver, [edge.uuid for edge in community_edges]
+    )
+    assert {(edge.source_node_uuid, edge.target_node_uuid) for edge in saved_edges} == {
+        (edge.source_node_uuid, edge.target_node_uuid) for edge in community_edges
+    }
+
+
+@pytest.mark.asyncio
+async def test_add_communities_bulk_indexes_communities_in_aoss(mock_embedder):
+    driver = Mock()
+    driver.provider = GraphProvider.NEPTUNE
+    driver.save_to_aoss = AsyncMock(return_value=1)
+    driver.session.return_value.execute_write = AsyncMock()
+    driver.session.return_value.close = AsyncMock()
+    community_node = CommunityNode(
+        name='test_community_1',
+        labels=[],
+        created_at=datetime.now(),
+        group_id=group_id,
+        name_embedding=embeddings['test_community_1'],
+    )
+
+    await add_communities_bulk(driver, [community_node], [], mock_embedder)
+
+    # Communities go to the index that fulltext search reads
+    index_name, documents = driver.save_to_aoss.await_args.args
+    assert index_name == 'community_name'
+    assert [document['uuid'] for document in documents] == [community_node.uuid]
+
 
 @pytest.mark.asyncio
 async def test_get_mentioned_nodes(graph_driver, mock_embedder):
@@ -1927,6 +2274,69 @@ async def test_node_distance_reranker(graph_driver, mock_embedder):
     assert names == [entity_node_2.name, entity_node_3.name]
     assert np.allclose(reranked_scores, [1.0, 0.0])
 
+    # Distances are graded by hop count and edges are followed in either direction
+    entity_edge_2 = EntityEdge(
+        source_node_uuid=entity_node_2.uuid,
+        target_node_uuid=entity_node_3.uuid,
+        name='RELATES_TO',
+        fact='test_entity_2 relates to test_entity_3',
+        created_at=datetime.now(),
+        group_id=group_id,
+    )
+    await entity_edge_2.generate_embedding(mock_embedder)
+    await entity_edge_2.save(graph_driver)
+
+    reranked_uuids, reranked_scores = await node_distance_reranker(
+        graph_driver,
+        [entity_node_1.uuid, entity_node_2.uuid],
+        entity_node_3.uuid,
+    )
+    names = [uuid_to_name[uuid] for uuid in reranked_uuids]
+    assert names == [entity_node_2.name, entity_node_1.name]
+    assert np.allclose(reranked_scores, [1.0, 0.5])
+
+    reranked_uuids, reranked_scores = await node_distance_reranker(
+        graph_driver,
+        [entity_node_1.uuid, entity_node_2.uuid],
+        entity_node_3.uuid,
+        max_depth=1,
+    )
+    names = [uuid_to_name[uuid] for uuid in reranked_uuids]
+    assert names == [entity_node_2.name, entity_node_1.name]
+    assert np.allclose(reranked_scores, [1.0, 0.0])
+
+    # Frontiers larger than max_frontier are not expanded
+    entity_node_4 = EntityNode(
+        name='test_entity_4',
+        labels=[],
+        created_at=datetime.now(),
+        group_id=group_id,
+    )
+    await entity_node_4.generate_name_embedding(mock_embedder)
+    entity_edge_3 = EntityEdge(
+        source_node_uuid=entity_node_3.uuid,
+        target_node_uuid=entity_node_4.uuid,
+        name='RELATES_TO',
+        fact='test_entity_3 relates to test_entity_4',
+        created_at=datetime.now(),
+        group_id=group_id,
+    )
+    await entity_edge_3.generate_embedding(mock_embedder)
+    await entity_node_4.save(graph_driver)
+    await entity_edge_3.save(graph_driver)
+    uuid_to_name[entity_node_4.uuid] = entity_node_4.name
+
+    for max_frontier, expected_scores in [(2, [1.0, 0.5]), (1, [1.0, 0.0])]:
+        reranked_uuids, reranked_scores = await node_distance_reranker(
+            graph_driver,
+            [entity_node_1.uuid, entity_node_4.uuid],
+            entity_node_2.uuid,
+            max_frontier=max_frontier,
+        )
+        names = [uuid_to_name[uuid] for uuid in reranked_uuids]
+        assert names == [entity_node_1.name, entity_node_4.name]
+        assert np.allclose(reranked_scores, expected_scores)
+
 
 @pytest.mark.asyncio
 async def test_episode_mentions_reranker(graph_driver, mock_embedder):
@@ -326,3 +326,53 @@ async def test_dedupe_edges_bulk_deduplicates_within_episode(monkeypatch):
     for _, compared_against in comparisons_made:
         # Each edge should have access to all 3 edges as candidates
         assert len(compared_against) >= 2  # At least 2 others (self is filtered out)
+
+
+def _make_raw_episode(index: int) -> bulk_utils.RawEpisode:
+    return bulk_utils.RawEpisode(
+        name=f'raw-{index}',
+        content=f'content {index}',
+        source_description='test',
+        source=EpisodeType.message,
+        reference_time=utc_now(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_iter_episode_chunks_groups_sync_iterables():
+    episodes = [_make_raw_episode(i) for i in range(5)]
+
+    chunks = [chunk async for chunk in bulk_utils.iter_episode_chunks(episodes, chunk_size=2)]
+
+    assert [[episode.name for episode in chunk] for chunk in chunks] == [
+        ['raw-0', 'raw-1'],
+        ['raw-2', 'raw-3'],
+        ['raw-4'],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_episode_chunks_consumes_async_iterables_lazily():
+    produced: list[int] = []
+
+    async def source():
+        for i in range(4):
+            produced.append(i)
+            yield _make_raw_episode(i)
+
+    chunks = bulk_utils.iter_episode_chunks(source(), chunk_size=2)
+    first = await chunks.__anext__()
+
+    assert [episode.name for episode in first] == ['raw-0', 'raw-1']
+    # Nothing beyond the first chunk has been pulled from the source yet
+    assert produced == [0, 1]
+
+    rest = [chunk async for chunk in chunks]
+    assert [[episode.name for episode in chunk] for chunk in rest] == [['raw-2', 'raw-3']]
+
+
+@pytest.mark.asyncio
+async def test_iter_episode_chunks_rejects_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        async for _ in bulk_utils.iter_episode_chunks([], chunk_size=0):
+            pass
@@ -0,0 +1,341 @@
+import asyncio
+import random
+from collections import defaultdict
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.nodes import EntityNode
+from graphiti_core.utils.datetime_utils import utc_now
+from graphiti_core.utils.maintenance import community_operations
+from graphiti_core.utils.maintenance.community_operations import (
+    CommunityDetectionAlgorithm,
+    CommunityUpdateBatcher,
+    Neighbor,
+    build_csr_adjacency,
+    detect_communities,
+    label_propagation,
+    louvain,
+    match_community_clusters,
+    pack_summaries,
+    reduce_summaries,
+)
+
+
+def _reference_label_propagation(projection: dict[str, list[Neighbor]]) -> list[list[str]]:
+    # Dict-based implementation that label_propagation has to match
+    community_map = {uuid: i for i, uuid in enumerate(projection.keys())}
+    for _ in range(100):
+        new_community_map: dict[str, int] = {}
+        for uuid, neighbors in projection.items():
+            curr_community = community_map[uuid]
+            community_candidates: dict[int, int] = defaultdict(int)
+            for neighbor in neighbors:
+                community_candidates[community_map[neighbor.node_uuid]] += neighbor.edge_count
+            community_lst = sorted(
+                ((count, community) for community, count in community_candidates.items()),
+                reverse=True,
+            )
+            candidate_rank, community_candidate = community_lst[0] if community_lst else (0, -1)
+            if community_candidate != -1 and candidate_rank > 1:
+                new_community_map[uuid] = community_candidate
+            else:
+                new_community_map[uuid] = max(community_candidate, curr_community)
+
+        if new_community_map == community_map:
+            break
+        community_map = new_community_map
+
+    clusters: dict[int, list[str]] = defaultdict(list)
+    for uuid, community in community_map.items():
+        clusters[community].append(uuid)
+    return list(clusters.values())
+
+
+def _random_projection(num_nodes: int, num_edges: int, seed: int) -> dict[str, list[Neighbor]]:
+    rng = random.Random(seed)
+    counts: dict[tuple[int, int], int] = defaultdict(int)
+    for _ in range(num_edges):
+        source, target = rng.randrange(num_nodes), rng.randrange(num_nodes)
+        if source != target:
+            counts[(source, target)] += 1
+            counts[(target, source)] += 1
+
+    projection: dict[str, list[Neighbor]] = {f'node_{i}': [] for i in range(num_nodes)}
+    for (source, target), count in counts.items():
+        projection[f'node_{source}'].append(Neighbor(node_uuid=f'node_{target}', edge_count=count))
+    return projection
+
+
+def _projection_from_edges(edges: list[tuple[str, str]]) -> dict[str, list[Neighbor]]:
+    projection: dict[str, list[Neighbor]] = defaultdict(list)
+    for source, target in edges:
+        projection[source].append(Neighbor(node_uuid=target, edge_count=1))
+        projection[target].append(Neighbor(node_uuid=source, edge_count=1))
+    return dict(projection)
+
+
+def _two_cliques() -> dict[str, list[Neighbor]]:
+    left = ['a1', 'a2', 'a3', 'a4']
+    right = ['b1', 'b2', 'b3', 'b4']
+    edges = [(u, v) for group in (left, right) for i, u in enumerate(group) for v in group[i + 1 :]]
+    return _projection_from_edges(edges + [('a1', 'b1')])
+
+
+def test_build_csr_adjacency_drops_unknown_neighbors():
+    projection = {
+        'a': [Neighbor(node_uuid='b', edge_count=2), Neighbor(node_uuid='x', edge_count=1)],
+        'b': [Neighbor(node_uuid='a', edge_count=2)],
+        'c': [],
+    }
+
+    uuids, indptr, indices, weights = build_csr_adjacency(projection)
+
+    assert uuids == ['a', 'b', 'c']
+    assert indptr.tolist() == [0, 1, 2, 2]
+    assert indices.tolist() == [1, 0]
+    assert weights.tolist() == [2.0, 2.0]
+
+
+def test_label_propagation_matches_reference():
+    for seed in range(20):
+        projection = _random_projection(num_nodes=40, num_edges=60, seed=seed)
+        assert label_propagation(projection) == _reference_label_propagation(projection)
+
+
+def test_label_propagation_separates_components():
+    projection = {
+        'a': [Neighbor(node_uuid='b', edge_count=1)],
+        'b': [Neighbor(node_uuid='a', edge_count=1)],
+        'c': [Neighbor(node_uuid='d', edge_count=1)],
+        'd': [Neighbor(node_uuid='c', edge_count=1)],
+        'e': [],
+    }
+
+    clusters = label_propagation(projection)
+
+    assert sorted(sorted(cluster) for cluster in clusters) == [['a', 'b'], ['c', 'd'], ['e']]
+
+
+def test_label_propagation_stops_oscillating_at_max_iterations():
+    # Two nodes joined by more than one edge swap communities on every synchronous round
+    projection = {
+        'a': [Neighbor(node_uuid='b', edge_count=2)],
+        'b': [Neighbor(node_uuid='a', edge_count=2)],
+    }
+
+    clusters = label_propagation(projection, max_iterations=5)
+
+    assert sorted(uuid for cluster in clusters for uuid in cluster) == ['a', 'b']
+
+
+def test_label_propagation_empty_projection():
+    assert label_propagation({}) == []
+
+
+def test_louvain_splits_cliques():
+    clusters = louvain(_two_cliques())
+
+    assert sorted(sorted(cluster) for cluster in clusters) == [
+        ['a1', 'a2', 'a3', 'a4'],
+        ['b1', 'b2', 'b3', 'b4'],
+    ]
+
+
+def test_louvain_respects_max_community_size():
+    projection = _random_projection(num_nodes=60, num_edges=200, seed=7)
+
+    clusters = louvain(projection, max_community_size=5)
+
+    assert max(len(cluster) for cluster in clusters) <= 5
+    assert sorted(uuid for cluster in clusters for uuid in cluster) == sorted(projection)
+
+
+def test_louvain_resolution_controls_community_count():
+    projection = _random_projection(num_nodes=60, num_edges=200, seed=3)
+
+    coarse = louvain(projection, resolution=0.5)
+    fine = louvain(projection, resolution=4.0)
+
+    assert len(fine) > len(coarse)
+
+
+def test_louvain_is_deterministic():
+    projection = _random_projection(num_nodes=50, num_edges=120, seed=11)
+
+    assert louvain(projection) == louvain(projection)
+
+
+def test_louvain_without_edges_returns_singletons():
+    assert louvain({'a': [], 'b': []}) == [['a'], ['b']]
+
+
+def test_louvain_rejects_invalid_parameters():
+    with pytest.raises(ValueError):
+        louvain({}, resolution=0)
+    with pytest.raises(ValueError):
+        louvain({}, max_community_size=0)
+
+
+def test_detect_communities_selects_algorithm():
+    projection = _two_cliques()
+
+    assert detect_communities(projection, CommunityDetectionAlgorithm.louvain) == louvain(
+        projection
+    )
+    assert detect_communities(projection) == label_propagation(projection)
+
+
+def test_match_community_clusters_keeps_similar_communities():
+    clusters = [{'a', 'b', 'c'}, {'d', 'e'}, {'f', 'g', 'h', 'i'}]
+    memberships = {
+        'same': {'a', 'b', 'c'},
+        'shrunk': {'d'},
+        'grown': {'f', 'g', 'h', 'i', 'j'},
+        'gone': {'x', 'y'},
+    }
+
+    matches = match_community_clusters(clusters, memberships, similarity_threshold=0.8)
+
+    assert matches == {0: 'same', 2: 'grown'}
+
+
+def test_match_community_clusters_uses_each_community_once():
+    clusters = [{'a', 'b'}, {'a', 'b', 'c'}]
+    memberships = {'community': {'a', 'b'}}
+
+    matches = match_community_clusters(clusters, memberships, similarity_threshold=0.5)
+
+    assert matches == {0: 'community'}
+
+
+def _summarizing_llm_client() -> MagicMock:
+    llm_client = MagicMock()
+    llm_client.generate_response = AsyncMock(return_value={'summary': 'merged'})
+    return llm_client
+
+
+def test_pack_summaries_respects_budget_and_fan_in():
+    summaries = ['x' * 30] * 10
+
+    groups = pack_summaries(summaries, token_budget=35, max_summaries_per_call=3)
+
+    # Every summary is estimated at 11 tokens
+    assert [len(group) for group in groups] == [3, 3, 3, 1]
+    assert [summary for group in groups for summary in group] == summaries
+
+
+def test_pack_summaries_pairs_oversized_summaries():
+    groups = pack_summaries(['x' * 300] * 3, token_budget=10, max_summaries_per_call=8)
+
+    assert [len(group) for group in groups] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_reduce_summaries_uses_k_ary_rounds():
+    llm_client = _summarizing_llm_client()
+
+    summary = await reduce_summaries(
+        llm_client, [f'summary {i}' for i in range(100)], max_summaries_per_call=10
+    )
+
+    assert summary == 'merged'
+    # 10 calls for the members and one for their summaries, instead of 99 pairwise calls
+    assert llm_client.generate_response.await_count == 11
+
+
+@pytest.mark.asyncio
+async def test_reduce_summaries_caps_calls():
+    llm_client = _summarizing_llm_client()
+    summaries = [f'summary {i}' for i in range(100)]
+
+    summary = await reduce_summaries(llm_client, summaries, max_summaries_per_call=4, max_calls=5)
+
+    assert summary == 'merged'
+    assert llm_client.generate_response.await_count == 5
+    # The least important summaries are the ones left out
+    first_call_context = llm_client.generate_response.await_args_list[0].args[0][1].content
+    assert 'summary 0' in first_call_context
+
+
+@pytest.mark.asyncio
+async def test_reduce_summaries_single_summary_needs_no_call():
+    llm_client = _summarizing_llm_client()
+
+    assert await reduce_summaries(llm_client, ['only', '']) == 'only'
+    assert await reduce_summaries(llm_client, []) == ''
+    llm_client.generate_response.assert_not_awaited()
+
+
+def _entity(name: str, group_id: str = 'group', summary: str = '') -> EntityNode:
+    return EntityNode(
+        uuid=name, name=name, group_id=group_id, created_at=utc_now(), summary=summary
+    )
+
+
+@pytest.mark.asyncio
+async def test_community_update_batcher_merges_updates_within_window(monkeypatch):
+    update_communities_bulk = AsyncMock(return_value=([], []))
+    monkeypatch.setattr(community_operations, 'update_communities_bulk', update_communities_bulk)
+    flushed_groups: list[list[str]] = []
+    driver = MagicMock()
+    batcher = CommunityUpdateBatcher(
+        MagicMock(), MagicMock(), window=0.01, on_flush=flushed_groups.append
+    )
+
+    batcher.add(driver, [_entity('a', summary='old'), _entity('b')])
+    batcher.add(driver, [_entity('a', summary='new')])
+    assert batcher.pending_count == 2
+    await asyncio.sleep(0.05)
+
+    update_communities_bulk.assert_awaited_once()
+    entities = update_communities_bulk.await_args.args[3]
+    assert [(entity.uuid, entity.summary) for entity in entities] == [('a', 'new'), ('b', '')]
+    assert flushed_groups == [['group']]
+    assert batcher.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_community_update_batcher_close_applies_pending_updates(monkeypatch):
+    update_communities_bulk = AsyncMock(return_value=([], []))
+    monkeypatch.setattr(community_operations, 'update_communities_bulk', update_communities_bulk)
+    batcher = CommunityUpdateBatcher(MagicMock(), MagicMock(), window=60)
+
+    batcher.add(MagicMock(), [_entity('a'), _entity('b', group_id='other_group')])
+    await batcher.close()
+
+    # One batch per group, without waiting for the window
+    assert update_communities_bulk.await_count == 2
+    assert batcher.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_community_update_batcher_requeues_failed_group(monkeypatch):
+    update_communities_bulk = AsyncMock(side_effect=[RuntimeError('llm down'), ([], [])])
+    monkeypatch.setattr(community_operations, 'update_communities_bulk', update_communities_bulk)
+    flushed_groups: list[list[str]] = []
+    driver = MagicMock()
+    batcher = CommunityUpdateBatcher(
+        MagicMock(), MagicMock(), window=60, on_flush=flushed_groups.append
+    )
+
+    batcher.add(driver, [_entity('a', summary='old'), _entity('b', group_id='other_group')])
+    with pytest.raises(RuntimeError, match='llm down'):
+        await batcher.flush()
+
+    # The other group is still applied and the failed one waits for the next window
+    assert update_communities_bulk.await_count == 2
+    assert update_communities_bulk.await_args.args[3][0].uuid == 'b'
+    assert flushed_groups == [['group', 'other_group']]
+    assert batcher.pending_count == 1
+    assert batcher._timer is not None
+
+    batcher.add(driver, [_entity('a', summary='new'), _entity('c')])
+    update_communities_bulk.side_effect = None
+    update_communities_bulk.return_value = ([], [])
+    await batcher.close()
+
+    entities = update_communities_bulk.await_args.args[3]
+    assert [(entity.uuid, entity.summary) for entity in entities] == [('a', 'new'), ('c', '')]
+    assert batcher.pending_count == 0
+    assert batcher._timer is None
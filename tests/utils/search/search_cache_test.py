@@ -0,0 +1,171 @@
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from graphiti_core.cross_encoder.client import CrossEncoderClient
+from graphiti_core.driver.driver import GraphDriver
+from graphiti_core.edges import EntityEdge
+from graphiti_core.embedder.client import EmbedderClient
+from graphiti_core.graphiti_types import GraphitiClients
+from graphiti_core.llm_client import LLMClient
+from graphiti_core.search.search import search
+from graphiti_core.search.search_cache import SearchCache
+from graphiti_core.search.search_config import SearchResults
+from graphiti_core.search.search_config_recipes import EDGE_HYBRID_SEARCH_RRF
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.tracer import NoOpTracer
+from graphiti_core.utils.datetime_utils import utc_now
+
+
+def _key(cache: SearchCache, query: str, group_ids: list[str] | None) -> str:
+    return cache.make_key(query, group_ids, EDGE_HYBRID_SEARCH_RRF, SearchFilters())
+
+
+def _results(fact: str) -> SearchResults:
+    edge = EntityEdge(
+        source_node_uuid='1',
+        target_node_uuid='2',
+        name='likes',
+        fact=fact,
+        group_id='a',
+        created_at=utc_now(),
+    )
+    return SearchResults(edges=[edge], edge_reranker_scores=[1.0])
+
+
+def test_search_cache_is_invalidated_per_group():
+    cache = SearchCache()
+    for query, group_ids in [('q', ['a']), ('q', ['b']), ('q', None)]:
+        cache.set(_key(cache, query, group_ids), cache.generation(group_ids), _results(query))
+
+    cache.invalidate(['a'])
+
+    assert cache.get(_key(cache, 'q', ['a']), cache.generation(['a'])) is None
+    assert cache.get(_key(cache, 'q', ['b']), cache.generation(['b'])) is not None
+    # Searches across all groups are affected by a write to any group
+    assert cache.get(_key(cache, 'q', None), cache.generation(None)) is None
+
+    cache.invalidate(None)
+    assert cache.get(_key(cache, 'q', ['b']), cache.generation(['b'])) is None
+
+
+def test_search_cache_results_computed_before_a_write_are_not_served():
+    cache = SearchCache()
+    key = _key(cache, 'q', ['a'])
+    generation = cache.generation(['a'])
+    # A write lands while the search is running
+    cache.invalidate(['a'])
+    cache.set(key, generation, _results('q'))
+
+    assert cache.get(key, cache.generation(['a'])) is None
+
+
+def test_search_cache_evicts_least_recently_used():
+    cache = SearchCache(max_size=2)
+    generation = cache.generation(['a'])
+    for query in ['q1', 'q2']:
+        cache.set(_key(cache, query, ['a']), generation, _results(query))
+
+    # Touch q1 so that q2 is the least recently used entry
+    assert cache.get(_key(cache, 'q1', ['a']), generation) is not None
+    cache.set(_key(cache, 'q3', ['a']), generation, _results('q3'))
+
+    assert cache.get(_key(cache, 'q2', ['a']), generation) is None
+    assert cache.get(_key(cache, 'q1', ['a']), generation) is not None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (2, 1, 1, 2)
+
+
+@pytest.mark.asyncio
+async def test_search_serves_repeated_queries_from_cache():
+    driver = Mock(spec=GraphDriver)
+    driver._database = 'default_db'
+    embedder = Mock(spec=EmbedderClient)
+    embedder.create = AsyncMock(return_value=[0.1, 0.2, 0.3])
+    cache = SearchCache()
+    clients = GraphitiClients(
+        driver=driver,
+        llm_client=Mock(spec=LLMClient),
+        embedder=embedder,
+        cross_encoder=Mock(spec=CrossEncoderClient),
+        tracer=NoOpTracer(),
+        search_cache=cache,
+    )
+    results = _results('Alice likes Bob')
+
+    with patch(
+        'graphiti_core.search.search.edge_search',
+        AsyncMock(return_value=(results.edges, results.edge_reranker_scores)),
+    ) as mock_edge_search:
+        for _ in range(2):
+            cached = await search(
+                clients, 'what does Alice like', ['a'], EDGE_HYBRID_SEARCH_RRF, SearchFilters()
+            )
+            assert [edge.fact for edge in cached.edges] == ['Alice likes Bob']
+
+        assert mock_edge_search.call_count == 1
+        assert embedder.create.call_count == 1
+
+        cache.invalidate(['a'])
+        await search(
+            clients, 'what does Alice like', ['a'], EDGE_HYBRID_SEARCH_RRF, SearchFilters()
+        )
+        assert mock_edge_search.call_count == 2
+
+    assert cache.stats().hits == 1
+
+
+def test_search_cache_serves_similar_queries_in_the_same_scope():
+    cache = SearchCache(similarity_threshold=0.95)
+    scope = cache.make_scope_key(['a'], EDGE_HYBRID_SEARCH_RRF, SearchFilters())
+    other_scope = cache.make_scope_key(['b'], EDGE_HYBRID_SEARCH_RRF, SearchFilters())
+    generation = cache.generation(['a'])
+    key = cache.make_query_key(scope, 'what does Alice like')
+    cache.set(key, generation, _results('Alice likes Bob'), scope, [1.0, 0.0, 0.0])
+
+    paraphrase_vector = [0.99, 0.1, 0.0]
+    similar = cache.get_similar(scope, paraphrase_vector, generation)
+    assert similar is not None
+    assert [edge.fact for edge in similar.edges] == ['Alice likes Bob']
+
+    assert cache.get_similar(scope, [0.0, 1.0, 0.0], generation) is None
+    assert cache.get_similar(other_scope, paraphrase_vector, cache.generation(['b'])) is None
+
+    cache.invalidate(['a'])
+    assert cache.get_similar(scope, paraphrase_vector, cache.generation(['a'])) is None
+    assert cache.stats().semantic_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_search_reuses_results_of_paraphrased_queries():
+    driver = Mock(spec=GraphDriver)
+    driver._database = 'default_db'
+    query_vectors = {
+        'what does Alice like': [1.0, 0.0, 0.0],
+        "what are Alice's preferences": [0.98, 0.05, 0.0],
+        'where does Bob live': [0.0, 1.0, 0.0],
+    }
+    embedder = Mock(spec=EmbedderClient)
+    embedder.create = AsyncMock(side_effect=lambda input_data: query_vectors[input_data[0]])
+    clients = GraphitiClients(
+        driver=driver,
+        llm_client=Mock(spec=LLMClient),
+        embedder=embedder,
+        cross_encoder=Mock(spec=CrossEncoderClient),
+        tracer=NoOpTracer(),
+        search_cache=SearchCache(similarity_threshold=0.95),
+    )
+    results = _results('Alice likes Bob')
+
+    with patch(
+        'graphiti_core.search.search.edge_search',
+        AsyncMock(return_value=(results.edges, results.edge_reranker_scores)),
+    ) as mock_edge_search:
+        for query in query_vectors:
+            await search(clients, query, ['a'], EDGE_HYBRID_SEARCH_RRF, SearchFilters())
+
+        # The paraphrase was served from the cache, the unrelated query was not
+        assert mock_edge_search.call_count == 2
+        # Queries are embedded once, even when the search itself needs the vector
+        assert embedder.create.call_count == 3
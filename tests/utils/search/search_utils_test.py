@@ -1,10 +1,22 @@
 from unittest.mock import AsyncMock, patch
 
+import numpy as np
 import pytest
 
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.edges import EntityEdge
+from graphiti_core.helpers import encode_embedding
 from graphiti_core.nodes import EntityNode
 from graphiti_core.search.search_filters import SearchFilters
-from graphiti_core.search.search_utils import hybrid_node_search
+from graphiti_core.search.search_utils import (
+    bfs_frontiers,
+    calculate_cosine_similarity,
+    hybrid_node_search,
+    node_bfs_search,
+    score_edge_candidates,
+    top_k_cosine_similarity,
+)
+from graphiti_core.utils.datetime_utils import utc_now
 
 
 @pytest.mark.asyncio
@@ -161,3 +173,112 @@ async def test_hybrid_node_search_with_limit_and_duplicates():
         mock_similarity_search.assert_called_with(
             mock_driver, [0.1, 0.2, 0.3], SearchFilters(), ['1'], 4
         )
+
+
+class BfsGraphDriver:
+    """Answers BFS hop and node queries from an in-memory adjacency list."""
+
+    provider = GraphProvider.NEO4J
+
+    def __init__(self, adjacency: dict[str, list[str]]):
+        self.adjacency = adjacency
+        self.hop_queries: list[list[str]] = []
+
+    async def execute_query(self, query, frontier_uuids, limit=None, **kwargs):
+        if 'RETURN DISTINCT n.uuid AS uuid' in query:
+            self.hop_queries.append(frontier_uuids)
+            records = [
+                {'uuid': uuid}
+                for frontier_uuid in frontier_uuids
+                for uuid in self.adjacency.get(frontier_uuid, [])
+            ]
+        else:
+            records = [
+                {
+                    'uuid': uuid,
+                    'name': uuid,
+                    'group_id': 'group',
+                    'labels': ['Entity'],
+                    'created_at': utc_now(),
+                    'summary': '',
+                    'attributes': {},
+                }
+                for uuid in frontier_uuids
+            ][:limit]
+        return records, None, None
+
+
+@pytest.mark.asyncio
+async def test_bfs_frontiers_deduplicates_and_records_hop_distance():
+    # a -> b, a -> c, b -> c, c -> a, c -> d
+    driver = BfsGraphDriver({'a': ['b', 'c'], 'b': ['c'], 'c': ['a', 'd']})
+
+    levels = [level async for level in bfs_frontiers(driver, ['a'], max_depth=3)]
+
+    assert levels == [(0, ['a']), (1, ['b', 'c']), (2, ['d'])]
+    # Each hop expands only the nodes first reached at the previous hop
+    assert driver.hop_queries == [['a'], ['b', 'c'], ['d']]
+
+
+@pytest.mark.asyncio
+async def test_node_bfs_search_stops_expanding_once_limit_is_reached():
+    hub_neighbors = [f'n{i}' for i in range(5)]
+    driver = BfsGraphDriver(
+        {'hub': hub_neighbors, **{neighbor: [f'{neighbor}-far'] for neighbor in hub_neighbors}}
+    )
+
+    nodes = await node_bfs_search(driver, ['hub'], SearchFilters(), bfs_max_depth=3, limit=3)
+
+    assert [node.uuid for node in nodes] == ['n0', 'n1', 'n2']
+    # The limit was reached at the first hop, so the second hop was never queried
+    assert driver.hop_queries == [['hub']]
+
+
+def test_top_k_cosine_similarity_matches_pairwise_scores():
+    rng = np.random.default_rng(0)
+    search_vector = rng.normal(size=16).tolist()
+    embeddings = [rng.normal(size=16).tolist() for _ in range(50)]
+    stored = [encode_embedding(embedding) for embedding in embeddings] + [None, '']
+
+    results = top_k_cosine_similarity(search_vector, stored, limit=5, min_score=-1)
+
+    expected = sorted(
+        ((calculate_cosine_similarity(search_vector, e), i) for i, e in enumerate(embeddings)),
+        reverse=True,
+    )[:5]
+    assert [i for i, _ in results] == [i for _, i in expected]
+    assert [score for _, score in results] == pytest.approx([score for score, _ in expected])
+
+
+def test_top_k_cosine_similarity_applies_min_score():
+    stored = [encode_embedding([1.0, 0.0]), encode_embedding([0.0, 1.0]), '1.0,0.1']
+
+    results = top_k_cosine_similarity([1.0, 0.0], stored, limit=10, min_score=0.5)
+
+    assert [i for i, _ in results] == [0, 2]
+
+
+def test_score_edge_candidates_ranks_per_search_edge():
+    edges = [
+        EntityEdge(
+            uuid=uuid,
+            source_node_uuid='s',
+            target_node_uuid='t',
+            name='RELATES_TO',
+            fact='fact',
+            fact_embedding=embedding,
+            group_id='group',
+            created_at=utc_now(),
+        )
+        for uuid, embedding in [('x', [1.0, 0.0]), ('y', [0.0, 1.0])]
+    ]
+    candidates = [
+        {'id': 1, 'embedding': encode_embedding([1.0, 0.1]), 'search_edge_uuid': 'x'},
+        {'id': 2, 'embedding': encode_embedding([1.0, 0.0]), 'search_edge_uuid': 'x'},
+        {'id': 3, 'embedding': encode_embedding([1.0, 0.0]), 'search_edge_uuid': 'y'},
+        {'id': 4, 'embedding': encode_embedding([0.1, 1.0]), 'search_edge_uuid': 'y'},
+    ]
+
+    input_ids = score_edge_candidates(edges, candidates, limit=1, min_score=0.5)
+
+    assert [(row['id'], row['uuid']) for row in input_ids] == [(2, 'x'), (4, 'y')]
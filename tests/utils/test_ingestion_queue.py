@@ -0,0 +1,230 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+
+import pytest
+
+from graphiti_core.utils.ingestion_queue import (
+    IngestionWorkerPool,
+    QueuedJob,
+    SQLiteIngestionQueue,
+)
+
+
+@pytest.fixture
+def queue_path(tmp_path):
+    return str(tmp_path / 'queue.db')
+
+
+@pytest.mark.asyncio
+async def test_claim_preserves_group_order_and_interleaves_groups(queue_path):
+    queue = SQLiteIngestionQueue(queue_path)
+    for i in range(3):
+        await queue.put('a', {'i': i})
+    await queue.put('b', {'i': 0})
+
+    first = await queue.claim()
+    second = await queue.claim()
+    assert first is not None and second is not None
+    assert (first.group_id, first.payload) == ('a', {'i': 0})
+    # Group a is in progress, so its next job is held back
+    assert (second.group_id, second.payload) == ('b', {'i': 0})
+    assert await queue.claim() is None
+
+    await queue.ack(first)
+    third = await queue.claim()
+    assert third is not None
+    assert (third.group_id, third.payload) == ('a', {'i': 1})
+    assert await queue.depths() == {'a': 2, 'b': 1}
+
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_jobs_are_retried_then_dead_lettered(queue_path):
+    queue = SQLiteIngestionQueue(queue_path, max_attempts=2, retry_backoff=0.05)
+    await queue.put('a', {'i': 0})
+    await queue.put('a', {'i': 1})
+
+    job = await queue.claim()
+    assert job is not None
+    assert await queue.fail(job, 'boom') is True
+
+    # The retry blocks the rest of the group until its backoff has elapsed
+    assert await queue.claim() is None
+    await asyncio.sleep(0.06)
+    job = await queue.claim()
+    assert job is not None
+    assert job.payload == {'i': 0}
+    assert job.attempts == 1
+
+    assert await queue.fail(job, 'boom again') is False
+    dead_letters = await queue.dead_letters('a')
+    assert [(dead.payload, dead.attempts, dead.last_error) for dead in dead_letters] == [
+        ({'i': 0}, 2, 'boom again')
+    ]
+
+    job = await queue.claim()
+    assert job is not None
+    assert job.payload == {'i': 1}
+
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_runnable_groups_excludes_busy_and_backed_off_groups(queue_path):
+    queue = SQLiteIngestionQueue(queue_path, retry_backoff=60)
+    for group_id in ['a', 'b', 'c']:
+        await queue.put(group_id, {'i': 0})
+        await queue.put(group_id, {'i': 1})
+    assert await queue.runnable_groups() == 3
+
+    # Group a has a job in progress and group b is waiting for a retry
+    in_progress = await queue.claim()
+    backed_off = await queue.claim()
+    assert in_progress is not None and backed_off is not None
+    assert await queue.fail(backed_off, 'boom') is True
+
+    assert await queue.runnable_groups() == 1
+
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_unacknowledged_jobs_survive_restart(queue_path):
+    queue = SQLiteIngestionQueue(queue_path)
+    await queue.put('a', {'i': 0})
+    await queue.put('a', {'i': 1})
+    assert await queue.claim() is not None
+    # Simulate a crash while the job is in progress
+    await queue.close()
+
+    queue = SQLiteIngestionQueue(queue_path)
+    assert await queue.claim() is None
+    assert await queue.recover() == 1
+
+    job = await queue.claim()
+    assert job is not None
+    assert job.payload == {'i': 0}
+
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_runs_groups_in_parallel_and_in_order(queue_path):
+    queue = SQLiteIngestionQueue(queue_path, retry_backoff=0.01)
+    events: list[tuple[str, int, str]] = []
+    failed_once: set[int] = set()
+
+    async def handler(job: QueuedJob):
+        i = job.payload['i']
+        if job.group_id == 'b' and i == 1 and i not in failed_once:
+            failed_once.add(i)
+            raise RuntimeError('transient')
+        events.append((job.group_id, i, 'start'))
+        await asyncio.sleep(0.02)
+        events.append((job.group_id, i, 'end'))
+
+    async def drained():
+        while await queue.depths():
+            await asyncio.sleep(0.01)
+
+    pool = IngestionWorkerPool(queue, handler, concurrency=2, poll_interval=0.01)
+    await pool.start()
+    for i in range(3):
+        for group_id in ['a', 'b']:
+            await pool.put(group_id, {'i': i})
+
+    await asyncio.wait_for(drained(), timeout=5)
+    await pool.stop()
+
+    for group_id in ['a', 'b']:
+        group_events = [(i, kind) for group, i, kind in events if group == group_id]
+        assert group_events == [(i, kind) for i in range(3) for kind in ['start', 'end']]
+
+    # Both groups were processed at the same time
+    assert events.index(('b', 0, 'start')) < events.index(('a', 0, 'end'))
+
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_survives_handler_errors(queue_path):
+    queue = SQLiteIngestionQueue(queue_path, max_attempts=1)
+    processed: list[tuple[str, int]] = []
+
+    async def handler(job: QueuedJob):
+        if job.group_id == 'a':
+            raise RuntimeError('permanent')
+        processed.append((job.group_id, job.payload['i']))
+
+    async def drained():
+        while await queue.depths():
+            await asyncio.sleep(0.01)
+
+    # A single worker has to keep running after every failed job
+    pool = IngestionWorkerPool(queue, handler, concurrency=1, poll_interval=0.01)
+    await pool.start()
+    for i in range(2):
+        for group_id in ['a', 'b']:
+            await pool.put(group_id, {'i': i})
+
+    await asyncio.wait_for(drained(), timeout=5)
+    assert pool.running
+    await pool.stop()
+
+    assert processed == [('b', 0), ('b', 1)]
+    assert [dead.payload for dead in await queue.dead_letters('a')] == [{'i': 0}, {'i': 1}]
+
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_isolates_a_blocked_group(queue_path):
+    queue = SQLiteIngestionQueue(queue_path)
+    release = asyncio.Event()
+    processed: list[tuple[str, int]] = []
+
+    async def handler(job: QueuedJob):
+        if job.group_id == 'a':
+            await release.wait()
+        processed.append((job.group_id, job.payload['i']))
+
+    pool = IngestionWorkerPool(queue, handler, concurrency=2, poll_interval=0.01)
+    await pool.start()
+    for i in range(2):
+        await pool.put('a', {'i': i})
+    for i in range(3):
+        await pool.put('b', {'i': i})
+
+    async def group_drained(group_id: str):
+        while group_id in await queue.depths():
+            await asyncio.sleep(0.01)
+
+    # Group b finishes while the first job of group a is still running, and the idle worker
+    # does not pick up the next job of group a
+    await asyncio.wait_for(group_drained('b'), timeout=5)
+    assert processed == [('b', 0), ('b', 1), ('b', 2)]
+    assert await queue.depths() == {'a': 2}
+
+    release.set()
+    await asyncio.wait_for(group_drained('a'), timeout=5)
+    await pool.stop()
+
+    assert processed[3:] == [('a', 0), ('a', 1)]
+
+    await queue.close()